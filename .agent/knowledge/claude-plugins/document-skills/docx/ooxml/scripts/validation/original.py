@@ -0,0 +1,82 @@
+"""
+In-memory access to the original Office file used as the validation baseline.
+"""
+
+import threading
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+
+
+class OriginalPackage:
+    """Read-only view of an original .docx/.pptx/.xlsx archive.
+
+    The archive is opened once and members are read into memory on demand,
+    so nothing is extracted to disk. Instances are shared per file (keyed by
+    path, size and mtime) so every validator looking at the same original
+    reuses the same member cache and memoized baseline errors.
+    """
+
+    # Number of originals kept open at once; older ones are closed
+    MAX_OPEN = 8
+
+    _instances = OrderedDict()
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path, "r")
+        self._names = set(self._zip.namelist())
+        self._members = {}
+        self._lock = threading.Lock()
+
+        # (part name, schema path) -> set of XSD error messages in the original
+        self.baseline_errors = {}
+
+    @classmethod
+    def get(cls, path):
+        """Return the shared OriginalPackage for path, opening it if needed."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+
+        with cls._instances_lock:
+            package = cls._instances.get(key)
+            if package is not None:
+                cls._instances.move_to_end(key)
+                return package
+
+            package = cls(path)
+            cls._instances[key] = package
+            while len(cls._instances) > cls.MAX_OPEN:
+                _, evicted = cls._instances.popitem(last=False)
+                evicted.close()
+            return package
+
+    def __contains__(self, part_name):
+        return part_name in self._names
+
+    def read(self, part_name):
+        """Return the bytes of part_name, or None if the original has no such part."""
+        if part_name not in self._names:
+            return None
+
+        content = self._members.get(part_name)
+        if content is None:
+            with self._lock:
+                content = self._members.get(part_name)
+                if content is None:
+                    if self._zip.fp is None:
+                        # Evicted and closed while still in use elsewhere
+                        self._zip = zipfile.ZipFile(self.path, "r")
+                    content = self._zip.read(part_name)
+                    self._members[part_name] = content
+        return content
+
+    def close(self):
+        """Close the underlying archive."""
+        self._zip.close()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -2,23 +2,28 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
+import difflib
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from .original import OriginalPackage
+from .profile import profiled
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(self, unpacked_dir, original_docx, verbose=False, profiler=None):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
+        # Optional ValidationProfiler recording the time spent in each step
+        self.profiler = profiler
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
 
+    @profiled
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
         # Verify unpacked directory exists and has correct structure
@@ -29,90 +34,67 @@ class RedliningValidator:
 
         # First, check if there are any tracked changes by Claude to validate
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            modified_root = ET.parse(modified_file).getroot()
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
 
+        # Check for w:del or w:ins tags authored by Claude
+        author_attr = f"{{{self.namespaces['w']}}}author"
+        has_claude_changes = any(
+            elem.get(author_attr) == "Claude"
+            for tag in ("del", "ins")
+            for elem in modified_root.iter(f"{{{self.namespaces['w']}}}{tag}")
+        )
+
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not has_claude_changes:
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
             return True
 
-    def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        # Read the original document.xml from the shared in-memory view
+        try:
+            original_content = OriginalPackage.get(self.original_docx).read(
+                "word/document.xml"
+            )
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        if original_content is None:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+
+        try:
+            original_root = ET.fromstring(original_content)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content paragraph by paragraph
+        modified_paragraphs = self._extract_paragraphs(modified_root)
+        original_paragraphs = self._extract_paragraphs(original_root)
+
+        if modified_paragraphs != original_paragraphs:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(
+                original_paragraphs, modified_paragraphs
+            )
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    @profiled
+    def _generate_detailed_diff(self, original_paragraphs, modified_paragraphs):
+        """Generate detailed character-level differences for changed paragraphs."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -125,94 +107,52 @@ class RedliningValidator:
             "  - To reject another's INSERTION: Nest <w:del> inside their <w:ins>",
             "  - To restore another's DELETION: Add new <w:ins> AFTER their <w:del>",
             "",
+            "Differences:",
+            "============",
         ]
-
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
-
+        error_parts.extend(
+            self._get_paragraph_diff(original_paragraphs, modified_paragraphs)
+        )
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
+    def _get_paragraph_diff(self, original_paragraphs, modified_paragraphs):
+        """Return one line per changed paragraph, marked up like git --word-diff=plain.
+
+        Paragraphs are matched as whole strings (by hash), so only paragraphs
+        that actually differ are diffed character by character.
+        """
+        lines = []
+        matcher = difflib.SequenceMatcher(
+            None, original_paragraphs, modified_paragraphs, autojunk=False
+        )
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                continue
+            removed = original_paragraphs[i1:i2]
+            added = modified_paragraphs[j1:j2]
+            # Pair up replaced paragraphs; any surplus was inserted or deleted whole
+            paired = min(len(removed), len(added))
+            for original, modified in zip(removed[:paired], added[:paired]):
+                lines.append(self._get_inline_diff(original, modified))
+            lines.extend(f"[-{text}-]" for text in removed[paired:])
+            lines.extend(f"{{+{text}+}}" for text in added[paired:])
+        return lines
+
+    def _get_inline_diff(self, original_text, modified_text):
+        """Mark character-level changes between two paragraphs inline."""
+        parts = []
+        matcher = difflib.SequenceMatcher(
+            None, original_text, modified_text, autojunk=False
+        )
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                parts.append(original_text[i1:i2])
+                continue
+            if i1 < i2:
+                parts.append(f"[-{original_text[i1:i2]}-]")
+            if j1 < j2:
+                parts.append(f"{{+{modified_text[j1:j2]}+}}")
+        return "".join(parts)
 
     def _remove_claude_tracked_changes(self, root):
         """Remove tracked changes authored by Claude from the XML root."""
@@ -235,9 +175,9 @@ class RedliningValidator:
 
         for parent in root.iter():
             to_process = []
-            for child in parent:
+            for index, child in enumerate(parent):
                 if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
+                    to_process.append((child, index))
 
             # Process in reverse order to maintain indices
             for del_elem, del_index in reversed(to_process):
@@ -251,8 +191,8 @@ class RedliningValidator:
                     parent.insert(del_index, child)
                 parent.remove(del_elem)
 
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
+    def _extract_paragraphs(self, root):
+        """Extract the text of each paragraph from Word XML.
 
         Empty paragraphs are skipped to avoid false positives when tracked
         insertions add only structural elements without text content.
@@ -261,18 +201,16 @@ class RedliningValidator:
         t_tag = f"{{{self.namespaces['w']}}}t"
 
         paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
+        for p_elem in root.iter(p_tag):
             # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
+            paragraph_text = "".join(
+                t_elem.text for t_elem in p_elem.iter(t_tag) if t_elem.text
+            )
             # Skip empty paragraphs - they don't affect content validation
             if paragraph_text:
                 paragraphs.append(paragraph_text)
 
-        return "\n".join(paragraphs)
+        return paragraphs
 
 
 if __name__ == "__main__":
@@ -220,7 +220,55 @@ class TestGetBoundingBoxMessages(unittest.TestCase):
         messages = get_bounding_box_messages(stream)
         self.assertTrue(any("SUCCESS" in msg for msg in messages))
         self.assertFalse(any("FAILURE" in msg for msg in messages))
-    
+
+    def test_failures_reported_in_field_order(self):
+        """Test that intersections are reported in field order, not position order"""
+        data = {
+            "form_fields": [
+                {
+                    "description": "Right",
+                    "page_number": 1,
+                    "label_bounding_box": [200, 10, 250, 30],
+                    "entry_bounding_box": [240, 10, 300, 30]  # Overlaps with its label
+                },
+                {
+                    "description": "Left",
+                    "page_number": 1,
+                    "label_bounding_box": [10, 10, 60, 30],
+                    "entry_bounding_box": [50, 10, 150, 30]  # Overlaps with its label
+                }
+            ]
+        }
+
+        stream = self.create_json_stream(data)
+        messages = get_bounding_box_messages(stream)
+        failures = [msg for msg in messages if "FAILURE" in msg]
+        self.assertEqual(len(failures), 2)
+        self.assertIn("`Right`", failures[0])
+        self.assertIn("`Left`", failures[1])
+
+    def test_many_fields(self):
+        """Test a large form with thousands of fields on several pages"""
+        fields = []
+        for page in range(1, 6):
+            for row in range(500):
+                top = row * 20
+                fields.append({
+                    "description": f"Page{page}Row{row}",
+                    "page_number": page,
+                    "label_bounding_box": [10, top, 100, top + 15],
+                    "entry_bounding_box": [110, top, 300, top + 15]
+                })
+        # One overlap near the end of the last page
+        fields[-1]["entry_bounding_box"] = [110, top - 10, 300, top + 15]
+
+        stream = self.create_json_stream({"form_fields": fields})
+        messages = get_bounding_box_messages(stream)
+        failures = [msg for msg in messages if "FAILURE" in msg]
+        self.assertEqual(len(failures), 1)
+        self.assertIn("`Page5Row498`", failures[0])
+        self.assertIn("`Page5Row499`", failures[0])
+
 
 if __name__ == '__main__':
     unittest.main()
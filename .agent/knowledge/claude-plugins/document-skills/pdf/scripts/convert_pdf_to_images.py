@@ -1,35 +1,117 @@
+import argparse
 import os
 import sys
+import tempfile
 
 from pdf2image import convert_from_path
+from pypdf import PdfReader
 
 
 # Converts each page of a PDF to a PNG image.
+#
+# Each page is rendered at the resolution that makes its longer side `max_dim`
+# pixels (but never above MAX_DPI), computed from its media box, so pages are
+# not rendered oversized and then scaled down. pdftoppm writes the PNGs
+# straight to disk a run of pages at a time, so memory use does not grow with
+# the number of pages.
 
 
-def convert(pdf_path, output_dir, max_dim=1000):
-    images = convert_from_path(pdf_path, dpi=200)
+MAX_DPI = 200
 
-    for i, image in enumerate(images):
-        # Scale image if needed to keep width/height under `max_dim`
-        width, height = image.size
-        if width > max_dim or height > max_dim:
-            scale_factor = min(max_dim / width, max_dim / height)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            image = image.resize((new_width, new_height))
-        
-        image_path = os.path.join(output_dir, f"page_{i+1}.png")
-        image.save(image_path)
-        print(f"Saved page {i+1} as {image_path} (size: {image.size})")
 
-    print(f"Converted {len(images)} pages to PNG images")
+def parse_page_ranges(spec, page_count):
+    # Parses a selection like "1-3,7,10-" into sorted 1-based page numbers.
+    pages = set()
+    for part in spec.split(","):
+        first, dash, last = part.strip().partition("-")
+        try:
+            first = int(first)
+            last = (int(last) if last else page_count) if dash else first
+        except ValueError:
+            raise ValueError(f"Invalid page range: {part.strip()!r}")
+        if first > last:
+            raise ValueError(f"Invalid page range: {part.strip()!r}")
+        if first < 1 or last > page_count:
+            raise ValueError(f"Page range {part.strip()!r} is outside pages 1-{page_count}")
+        pages.update(range(first, last + 1))
+    return sorted(pages)
+
+
+def page_render_size(page, max_dim):
+    # Returns the (width, height) in pixels and the DPI to render a page at so
+    # that it fits within `max_dim`. pdftoppm renders the media box, turned by
+    # the page's rotation.
+    width = float(page.mediabox.width)
+    height = float(page.mediabox.height)
+    if page.rotation % 180 == 90:
+        width, height = height, width
+    dpi = min(MAX_DPI, max_dim * 72 / max(width, height))
+    size = (max(1, round(width * dpi / 72)), max(1, round(height * dpi / 72)))
+    return size, dpi
+
+
+def page_runs(pages, sizes):
+    # Groups consecutive pages that render at the same size, so each group
+    # needs only one pdftoppm invocation.
+    runs = []
+    for page in pages:
+        if runs and runs[-1][1] == page - 1 and sizes[runs[-1][0]] == sizes[page]:
+            runs[-1][1] = page
+        else:
+            runs.append([page, page])
+    return runs
+
+
+def convert(pdf_path, output_dir, max_dim=1000, pages=None, thread_count=1):
+    # `pages` is a selection like "1-3,7"; all pages are converted if it is None.
+    reader = PdfReader(pdf_path)
+    if pages is None:
+        pages = range(1, len(reader.pages) + 1)
+    else:
+        pages = parse_page_ranges(pages, len(reader.pages))
+    sizes = {page: page_render_size(reader.pages[page - 1], max_dim) for page in pages}
+
+    converted = 0
+    # Rendered in a directory inside `output_dir` so moving a page into place is a rename
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        for first_page, last_page in page_runs(pages, sizes):
+            size, dpi = sizes[first_page]
+            image_paths = convert_from_path(
+                pdf_path,
+                dpi=dpi,
+                size=size,
+                first_page=first_page,
+                last_page=last_page,
+                output_folder=temp_dir,
+                fmt="png",
+                paths_only=True,
+                thread_count=thread_count,
+            )
+            for rendered_path in image_paths:
+                # pdftoppm names each file "<prefix>-<page number>.png"
+                stem = os.path.splitext(os.path.basename(rendered_path))[0]
+                page = int(stem.rsplit("-", 1)[1])
+                image_path = os.path.join(output_dir, f"page_{page}.png")
+                os.replace(rendered_path, image_path)
+                print(f"Saved page {page} as {image_path} (size: {size})")
+                converted += 1
+
+    print(f"Converted {converted} pages to PNG images")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: convert_pdf_to_images.py [input pdf] [output directory]")
+    parser = argparse.ArgumentParser(description="Convert the pages of a PDF to PNG images")
+    parser.add_argument("pdf_path", help="Input PDF")
+    parser.add_argument("output_dir", help="Directory to write page_<n>.png files to")
+    parser.add_argument("--pages", help='Pages to convert, e.g. "1-3,7,10-" (default: all)')
+    parser.add_argument("--max-dim", type=int, default=1000,
+                        help="Maximum width and height of each image in pixels (default: 1000)")
+    parser.add_argument("--threads", type=int, default=min(4, os.cpu_count() or 1),
+                        help="pdftoppm processes to render with in parallel (default: up to 4)")
+    args = parser.parse_args()
+
+    try:
+        convert(args.pdf_path, args.output_dir, args.max_dim, args.pages, args.threads)
+    except ValueError as e:
+        print(e)
         sys.exit(1)
-    pdf_path = sys.argv[1]
-    output_directory = sys.argv[2]
-    convert(pdf_path, output_directory)
@@ -3,14 +3,21 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--cache-dir DIR] [--profile [FILE]]
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    ValidationProfiler,
+    profile_frame,
+)
 
 
 def main():
@@ -30,6 +37,27 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate parts in N worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse per-part results for unchanged parts from this directory "
+        "(default: $OOXML_VALIDATION_CACHE, or no cache)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="validation_profile.json",
+        metavar="FILE",
+        help="Record time and peak Python memory per check and part; writes a JSON "
+        "report to FILE (default: validation_profile.json) and collapsed "
+        "stacks for flame graphs to FILE with a .folded suffix",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -52,12 +80,26 @@ def main():
             print(f"Error: Validation not supported for file type {file_extension}")
             sys.exit(1)
 
+    profiler = ValidationProfiler() if args.profile else None
+
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+        options = {"verbose": args.verbose, "profiler": profiler}
+        if issubclass(V, BaseSchemaValidator):
+            options["jobs"] = args.jobs
+            options["cache_dir"] = args.cache_dir
+        with profile_frame(profiler, V.__name__):
+            validator = V(unpacked_dir, original_file, **options)
+            if not validator.validate():
+                success = False
+
+    if profiler is not None:
+        profile_path = Path(args.profile)
+        profiler.write_json(profile_path)
+        profiler.write_folded(profile_path.with_suffix(".folded"))
+        profiler.print_summary()
+        print(f"Profile written to {profile_path}", file=sys.stderr)
 
     if success:
         print("All validations PASSED!")
@@ -0,0 +1,186 @@
+"""
+Wall time and memory profiling for validation runs.
+
+A ValidationProfiler is shared by the validators of one run. Checks and parts
+are recorded as nested frames (validator;check;part) with their wall time and
+peak Python heap usage (tracemalloc), plus counters such as parses and schema
+compilations. The report is available as JSON or as collapsed stacks that
+flame graph tools (flamegraph.pl, speedscope, inferno) read directly.
+"""
+
+import contextlib
+import functools
+import json
+import sys
+import time
+import tracemalloc
+
+from . import schemas
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+class ValidationProfiler:
+    """Collects per-check and per-part timings for one or more validators."""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        # Stack string -> {"seconds", "peak_memory_bytes", "calls"}
+        self.frames = {}
+        self.counters = {}
+        self._stack = []
+        self._started_tracemalloc = False
+        self._start_time = time.perf_counter()
+        self._schema_stats = dict(schemas.stats)
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def count(self, name, amount=1):
+        """Increment a named counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextlib.contextmanager
+    def frame(self, name):
+        """Record the wall time and peak memory of the enclosed block as a nested frame."""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # Keep the parent's peak before resetting it for this frame
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+        else:
+            current = 0
+
+        entry = {"name": name, "start_memory": current, "peak": current}
+        self._stack.append(entry)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack = ";".join(frame["name"] for frame in self._stack)
+            self._stack.pop()
+
+            if tracing:
+                entry["peak"] = max(entry["peak"], tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], entry["peak"])
+                tracemalloc.reset_peak()
+
+            record = self.frames.setdefault(
+                stack, {"seconds": 0.0, "peak_memory_bytes": 0, "calls": 0}
+            )
+            record["seconds"] += elapsed
+            record["peak_memory_bytes"] = max(
+                record["peak_memory_bytes"], entry["peak"] - entry["start_memory"]
+            )
+            record["calls"] += 1
+
+    def report(self):
+        """Return the collected data as a JSON-serializable dict."""
+        schema_counters = {
+            "schema_compilations": schemas.stats["compiled"]
+            - self._schema_stats["compiled"],
+            "schema_cache_hits": schemas.stats["hits"] - self._schema_stats["hits"],
+            "schema_compile_seconds": round(
+                schemas.stats["compile_seconds"]
+                - self._schema_stats["compile_seconds"],
+                6,
+            ),
+        }
+        max_rss = None
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux and bytes on macOS
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            if sys.platform != "darwin":
+                max_rss *= 1024
+
+        return {
+            "total_seconds": round(time.perf_counter() - self._start_time, 6),
+            "max_rss_bytes": max_rss,
+            "counters": {**self.counters, **schema_counters},
+            "frames": [
+                {
+                    "stack": stack,
+                    "seconds": round(record["seconds"], 6),
+                    "self_seconds": round(self._self_seconds(stack), 6),
+                    "peak_memory_bytes": record["peak_memory_bytes"],
+                    "calls": record["calls"],
+                }
+                for stack, record in self.frames.items()
+            ],
+        }
+
+    def _self_seconds(self, stack):
+        """Time spent in a frame outside of its recorded child frames."""
+        prefix = stack + ";"
+        children = sum(
+            record["seconds"]
+            for child, record in self.frames.items()
+            if child.startswith(prefix) and ";" not in child[len(prefix) :]
+        )
+        return max(0.0, self.frames[stack]["seconds"] - children)
+
+    def write_json(self, path):
+        """Write the report as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def write_folded(self, path):
+        """Write collapsed stacks ("a;b;c <microseconds>") of self time per frame."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack in self.frames:
+                microseconds = round(self._self_seconds(stack) * 1_000_000)
+                if microseconds:
+                    f.write(f"{stack} {microseconds}\n")
+
+    def print_summary(self, limit=15, file=None):
+        """Print the slowest frames and the counters."""
+        file = file or sys.stderr
+        report = self.report()
+        print(f"Profile: {report['total_seconds']:.3f}s total", file=file)
+        for frame in sorted(report["frames"], key=lambda f: -f["seconds"])[:limit]:
+            print(
+                f"  {frame['seconds']:8.3f}s  "
+                f"{frame['peak_memory_bytes'] / 1e6:8.1f} MB  "
+                f"x{frame['calls']:<4d} {frame['stack']}",
+                file=file,
+            )
+        for name, value in sorted(report["counters"].items()):
+            print(f"  {name}: {value}", file=file)
+
+    def close(self):
+        """Stop memory tracing if this profiler started it."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+def profile_frame(profiler, name):
+    """Return profiler.frame(name), or a no-op context if profiler is None."""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.frame(name)
+
+
+def profiled(method):
+    """Record a validator method as a frame when the validator has a profiler."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.profiler is None:
+            return method(self, *args, **kwargs)
+        with self.profiler.frame(method.__name__):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,268 @@
+"""
+Single-walk rule engine for element-level checks.
+
+Element-level checks (unique IDs, whitespace preservation, tracked change
+nesting, UUID-like IDs) register as rules. Each part is then walked once
+with ``iter()`` and every element is dispatched only to the rules interested
+in its tag, instead of each check walking every part on its own.
+"""
+
+import re
+
+import lxml.etree
+
+
+def split_tag(tag):
+    """Split a Clark-notation name '{namespace}local' into (namespace, local)."""
+    if tag.startswith("{"):
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return None, tag
+
+
+class ElementRule:
+    """A check applied to matching elements during the single walk over a part.
+
+    Rules register interest in (namespace, local-name) pairs, which are turned
+    into qualified names once, or override matches() for broader interest.
+    Errors are appended to self.errors as fully formatted report lines.
+    """
+
+    def __init__(self, targets=()):
+        self.errors = []
+        self.qualified_targets = {
+            f"{{{namespace}}}{local}" for namespace, local in targets
+        }
+
+    def applies_to(self, relative_path):
+        """Return True if this rule should see the elements of the given part."""
+        return True
+
+    def matches(self, tag):
+        """Return True if elements with this Clark-notation tag go to visit()."""
+        return tag in self.qualified_targets
+
+    def start_part(self, relative_path):
+        """Called before the elements of a part are visited."""
+        self.relative_path = relative_path
+
+    def visit(self, elem):
+        """Check one matching element."""
+        raise NotImplementedError("Subclasses must implement the visit method")
+
+
+def run_element_rules(rules, xml_files, parse, base_dir):
+    """Walk each part once and dispatch its elements to the interested rules.
+
+    Args:
+        rules: Iterable of ElementRule instances
+        xml_files: Parts to walk, in reporting order
+        parse: Callable returning the (read-only) parsed tree for a part
+        base_dir: Directory that part paths are reported relative to
+    """
+    rules = list(rules)
+    # Active rule tuple -> {tag: rules interested in that tag}
+    dispatch_tables = {}
+
+    for xml_file in xml_files:
+        relative_path = xml_file.relative_to(base_dir)
+        active = tuple(rule for rule in rules if rule.applies_to(relative_path))
+        if not active:
+            continue
+        dispatch = dispatch_tables.setdefault(active, {})
+
+        try:
+            root = parse(xml_file).getroot()
+            for rule in active:
+                rule.start_part(relative_path)
+
+            for elem in root.iter(lxml.etree.Element):
+                interested = dispatch.get(elem.tag)
+                if interested is None:
+                    interested = tuple(
+                        rule for rule in active if rule.matches(elem.tag)
+                    )
+                    dispatch[elem.tag] = interested
+                for rule in interested:
+                    rule.visit(elem)
+
+        except Exception as e:
+            for rule in active:
+                rule.errors.append(f"  {relative_path}: Error: {e}")
+
+
+class UniqueIdRule(ElementRule):
+    """IDs listed in UNIQUE_ID_REQUIREMENTS must be unique per file or globally.
+
+    Elements inside mc:AlternateContent are ignored, since the same content
+    legitimately appears once per mc:Choice/mc:Fallback branch.
+    """
+
+    def __init__(self, requirements, mc_namespace):
+        super().__init__()
+        self.requirements = requirements
+        self.alternate_content_tag = f"{{{mc_namespace}}}AlternateContent"
+        self.global_ids = {}  # Track globally unique IDs across all files
+        # Tag or attribute name -> lowercased local name, split once per distinct name
+        self._locals = {}
+
+    def _local(self, name):
+        local = self._locals.get(name)
+        if local is None:
+            local = self._locals[name] = split_tag(name)[1].lower()
+        return local
+
+    def matches(self, tag):
+        return self._local(tag) in self.requirements
+
+    def start_part(self, relative_path):
+        super().start_part(relative_path)
+        self.file_ids = {}  # Track IDs that must be unique within this file
+
+    def visit(self, elem):
+        if next(elem.iterancestors(self.alternate_content_tag), None) is not None:
+            return
+
+        tag = self._local(elem.tag)
+        attr_name, scope = self.requirements[tag]
+
+        # Look for the specified attribute
+        id_value = None
+        for attr, value in elem.attrib.items():
+            if self._local(attr) == attr_name:
+                id_value = value
+                break
+
+        if id_value is None:
+            return
+
+        if scope == "global":
+            # Check global uniqueness
+            if id_value in self.global_ids:
+                prev_file, prev_line, prev_tag = self.global_ids[id_value]
+                self.errors.append(
+                    f"  {self.relative_path}: "
+                    f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
+                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                )
+            else:
+                self.global_ids[id_value] = (self.relative_path, elem.sourceline, tag)
+        elif scope == "file":
+            # Check file-level uniqueness
+            file_ids = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in file_ids:
+                self.errors.append(
+                    f"  {self.relative_path}: "
+                    f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                    f"(first occurrence at line {file_ids[id_value]})"
+                )
+            else:
+                file_ids[id_value] = elem.sourceline
+
+
+class DocumentPartRule(ElementRule):
+    """Base for Word rules that only inspect document.xml parts."""
+
+    def applies_to(self, relative_path):
+        return relative_path.name == "document.xml"
+
+    @staticmethod
+    def _preview(text):
+        """Show a preview of the text."""
+        return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+
+class WhitespacePreservationRule(DocumentPartRule):
+    """w:t elements with leading or trailing whitespace need xml:space='preserve'."""
+
+    def __init__(self, word_namespace, xml_namespace):
+        super().__init__(targets=[(word_namespace, "t")])
+        self.xml_space_attr = f"{{{xml_namespace}}}space"
+
+    def visit(self, elem):
+        text = elem.text
+        if not text:
+            return
+        # Check if text starts or ends with whitespace
+        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+            if elem.attrib.get(self.xml_space_attr) != "preserve":
+                self.errors.append(
+                    f"  {self.relative_path}: "
+                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {self._preview(text)}"
+                )
+
+
+class DeletedTextRule(DocumentPartRule):
+    """w:t elements must not appear within w:del elements."""
+
+    def __init__(self, word_namespace):
+        super().__init__(targets=[(word_namespace, "t")])
+        self.del_tag = f"{{{word_namespace}}}del"
+
+    def visit(self, elem):
+        if elem.text and next(elem.iterancestors(self.del_tag), None) is not None:
+            self.errors.append(
+                f"  {self.relative_path}: "
+                f"Line {elem.sourceline}: <w:t> found within <w:del>: {self._preview(elem.text)}"
+            )
+
+
+class InsertedDelTextRule(DocumentPartRule):
+    """w:delText elements within w:ins are only allowed when nested in a w:del."""
+
+    def __init__(self, word_namespace):
+        super().__init__(targets=[(word_namespace, "delText")])
+        self.ins_tag = f"{{{word_namespace}}}ins"
+        self.del_tag = f"{{{word_namespace}}}del"
+
+    def visit(self, elem):
+        inside_ins = False
+        for ancestor in elem.iterancestors(self.ins_tag, self.del_tag):
+            if ancestor.tag == self.del_tag:
+                return
+            inside_ins = True
+        if inside_ins:
+            self.errors.append(
+                f"  {self.relative_path}: "
+                f"Line {elem.sourceline}: <w:delText> within <w:ins>: {self._preview(elem.text or '')}"
+            )
+
+
+class UuidIdRule(ElementRule):
+    """ID attributes that look like UUIDs must contain only hex values."""
+
+    # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+    UUID_PATTERN = re.compile(
+        r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+    )
+
+    def __init__(self, looks_like_uuid):
+        super().__init__()
+        self.looks_like_uuid = looks_like_uuid
+        # Attribute name -> whether it is an ID attribute, decided once per name
+        self._id_attrs = {}
+
+    def matches(self, tag):
+        return True
+
+    def visit(self, elem):
+        for attr, value in elem.attrib.items():
+            is_id = self._id_attrs.get(attr)
+            if is_id is None:
+                # Check if this is an ID attribute
+                attr_name = split_tag(attr)[1].lower()
+                is_id = self._id_attrs[attr] = attr_name.endswith("id")
+            # Check if value looks like a UUID with invalid hex characters
+            if (
+                is_id
+                and self.looks_like_uuid(value)
+                and not self.UUID_PATTERN.match(value)
+            ):
+                self.errors.append(
+                    f"  {self.relative_path}: "
+                    f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+                )
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
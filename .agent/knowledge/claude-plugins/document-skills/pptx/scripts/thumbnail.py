@@ -18,8 +18,18 @@ Grid limits by column count:
 - 5 cols: max 30 slides per grid (5×6) [default]
 - 6 cols: max 42 slides per grid (6×7)
 
+Pages are rasterized in parallel pdftoppm processes (--jobs), and each grid
+is saved as soon as its slides are ready. Slide images are decoded at a
+reduced scale close to the thumbnail size.
+
+Rendered slide images can be cached between runs (--cache-dir, or the
+PPTX_THUMBNAIL_CACHE environment variable). Each image is stored under a hash
+of everything the slide's rendering depends on: its XML, layout, master,
+theme and media. On a re-run only slides whose inputs changed are rendered
+again, which keeps edit-and-preview loops on large decks fast.
+
 Usage:
-    python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+    python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders] [--jobs N] [--cache-dir DIR]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,17 +48,28 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+    python thumbnail.py presentation.pptx --cache-dir ~/.cache/pptx-thumbnails
+    # Renders only the slides that changed since the last run
 """
 
 import argparse
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from inventory import extract_text_inventory
+from lxml import etree
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
@@ -56,6 +77,7 @@ CONVERSION_DPI = 100  # DPI for PDF to image conversion
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
+MAX_PAGES_PER_TASK = 10  # Maximum pages rasterized by one pdftoppm process
 
 # Grid layout constants
 GRID_PADDING = 20  # Padding between thumbnails
@@ -63,6 +85,10 @@ BORDER_WIDTH = 2  # Border width around thumbnails
 FONT_SIZE_RATIO = 0.12  # Font size as fraction of thumbnail width
 LABEL_PADDING_RATIO = 0.4  # Label padding as fraction of font size
 
+# Render cache
+CACHE_DIR_ENV = "PPTX_THUMBNAIL_CACHE"  # Default cache directory, if set
+RENDER_CACHE_VERSION = "1"  # Bump to invalidate cached images when rendering changes
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -86,6 +112,18 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Rasterize pages in N parallel processes (0 = one per CPU, default: 0)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory caching rendered slide images between runs "
+        f"(default: ${CACHE_DIR_ENV}, or no cache)",
+    )
 
     args = parser.parse_args()
 
@@ -105,28 +143,48 @@ def main():
 
     print(f"Processing: {args.input}")
 
+    jobs = args.jobs or os.cpu_count() or 1
+
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory() as temp_dir, ThreadPoolExecutor(
+            max_workers=jobs
+        ) as executor:
+            # Load the presentation once for the slides and the placeholder regions
+            prs = Presentation(str(input_path))
+
+            # Convert slides to images, reusing cached images of unchanged slides;
+            # pages are rasterized in the background while the grids are built.
+            # This must come before the placeholder regions, which can change
+            # prs (see get_placeholder_regions) and so its cache keys.
+            cache = RenderCache.from_option(args.cache_dir)
+            slide_images = convert_to_images(
+                input_path,
+                Path(temp_dir),
+                CONVERSION_DPI,
+                cache,
+                prs=prs,
+                executor=executor,
+                jobs=jobs,
+            )
+            if not slide_images:
+                print("Error: No slides found")
+                sys.exit(1)
+
+            print(f"Found {len(slide_images)} slides")
+
             # Get placeholder regions if outlining is enabled
             placeholder_regions = None
             slide_dimensions = None
             if args.outline_placeholders:
                 print("Extracting placeholder regions...")
                 placeholder_regions, slide_dimensions = get_placeholder_regions(
-                    input_path
+                    input_path, prs
                 )
                 if placeholder_regions:
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
-            # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
-            if not slide_images:
-                print("Error: No slides found")
-                sys.exit(1)
-
-            print(f"Found {len(slide_images)} slides")
-
-            # Create grids (max cols×(cols+1) images per grid)
+            # Create grids (max cols×(cols+1) images per grid), each saved as
+            # soon as its slides are rasterized
             grid_files = create_grids(
                 slide_images,
                 cols,
@@ -156,15 +214,19 @@ def create_hidden_slide_placeholder(size):
     return img
 
 
-def get_placeholder_regions(pptx_path):
+def get_placeholder_regions(pptx_path, prs=None):
     """Extract ALL text regions from the presentation.
 
     Returns a tuple of (placeholder_regions, slide_dimensions).
     text_regions is a dict mapping slide indices to lists of text regions.
     Each region is a dict with 'left', 'top', 'width', 'height' in inches.
     slide_dimensions is a tuple of (width_inches, height_inches).
+    If prs is not provided, the presentation is loaded from pptx_path. The
+    inventory adds an empty text body to shapes without one, so a provided
+    prs should not be saved or hashed (get_slide_cache_keys) afterwards.
     """
-    prs = Presentation(str(pptx_path))
+    if prs is None:
+        prs = Presentation(str(pptx_path))
     inventory = extract_text_inventory(pptx_path, prs)
     placeholder_regions = {}
 
@@ -194,11 +256,125 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+class RenderCache:
+    """Content-addressed store of rendered slide images.
+
+    Entries are JPEG files named by the slide's cache key (see
+    get_slide_cache_keys). They are written atomically and never modified,
+    so the cache is safe to share between concurrent runs.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_option(cls, cache_dir=None):
+        """Return a cache for cache_dir or $PPTX_THUMBNAIL_CACHE, or None if neither is set."""
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        return cls(cache_dir) if cache_dir else None
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.jpg"
+
+    def get(self, key):
+        """Return the path of the cached image for key, or None on a miss."""
+        entry_path = self._entry_path(key)
+        return entry_path if entry_path.is_file() else None
+
+    def put(self, key, image_path):
+        """Store a copy of image_path for key; concurrent writers of the same key are harmless."""
+        entry_path = self._entry_path(key)
+        temp_name = None
+        try:
+            entry_path.parent.mkdir(exist_ok=True)
+            # Copy to a private temp file, then atomically move it into place
+            fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as dst, open(image_path, "rb") as src:
+                shutil.copyfileobj(src, dst)
+            os.replace(temp_name, entry_path)
+        except OSError:
+            # A cache that cannot be written only costs speed
+            if temp_name is not None and os.path.exists(temp_name):
+                os.unlink(temp_name)
+
+
+def get_slide_cache_keys(prs, dpi):
+    """Return a render cache key for each slide of a presentation.
+
+    A key hashes everything the slide's image depends on: the slide XML and
+    every part it reaches through relationships (layout, master, theme,
+    images, charts, ...), the slide size and default text style, and the
+    DPI. Other slides and notes are not followed, nor are the master's
+    relationships to its other layouts. Slides showing a slide number field
+    also depend on their position.
+    """
+    part_digests = {}  # Partname -> digest of the part's content
+
+    def part_digest(part):
+        digest = part_digests.get(part.partname)
+        if digest is None:
+            digest = part_digests[part.partname] = hashlib.sha256(part.blob).hexdigest()
+        return digest
+
+    def add_dependencies(digest, part, visited):
+        """Hash the part and, depth first, the parts it depends on."""
+        visited.add(part.partname)
+        digest.update(part_digest(part).encode())
+        for rId, rel in sorted(part.rels.items()):
+            digest.update(f"{rId} {rel.reltype}".encode())
+            if rel.is_external:
+                digest.update(rel.target_ref.encode())
+                continue
+            if rel.reltype in (RT.SLIDE, RT.NOTES_SLIDE):
+                continue
+            if (
+                rel.reltype == RT.SLIDE_LAYOUT
+                and part.content_type == CT.PML_SLIDE_MASTER
+            ):
+                continue  # The master's other layouts
+            if rel.target_part.partname not in visited:
+                add_dependencies(digest, rel.target_part, visited)
+
+    # Presentation-wide settings that affect every slide
+    presentation = prs.part._element
+    default_text_style = presentation.find(qn("p:defaultTextStyle"))
+    presentation_settings = "{} {} {} {}".format(
+        RENDER_CACHE_VERSION,
+        dpi,
+        (prs.slide_width, prs.slide_height),
+        etree.tostring(default_text_style) if default_text_style is not None else "",
+    )
+    first_slide_number = int(presentation.get("firstSlideNum", "1"))
+
+    keys = []
+    for slide_idx, slide in enumerate(prs.slides):
+        digest = hashlib.sha256(presentation_settings.encode())
+        add_dependencies(digest, slide.part, set())
+        if slide.element.xpath('.//a:fld[@type="slidenum"]'):
+            digest.update(f"slide {first_slide_number + slide_idx}".encode())
+        keys.append(digest.hexdigest())
+    return keys
+
+
+def convert_to_images(
+    pptx_path, temp_dir, dpi, cache=None, prs=None, executor=None, jobs=1
+):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    With a RenderCache, visible slides whose cache key is already stored are
+    taken from the cache and only the other slides are rendered; their
+    images are then added to the cache.
+
+    With an executor, pages are rasterized by parallel tasks (spread over
+    jobs workers) and the returned list holds a PendingImage for each page that is not rasterized
+    yet (see resolve_image). If prs is not provided, the presentation is
+    loaded from pptx_path; a provided one is left unchanged.
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
-    prs = Presentation(str(pptx_path))
+    if prs is None:
+        prs = Presentation(str(pptx_path))
     total_slides = len(prs.slides)
 
     # Find hidden slides (1-based indexing for display)
@@ -212,6 +388,110 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
+    visible_slides = [
+        slide_num
+        for slide_num in range(1, total_slides + 1)
+        if slide_num not in hidden_slides
+    ]
+
+    # Look up visible slides in the render cache
+    slide_images = {}  # Slide number -> image path
+    cache_keys = None
+    if cache is not None:
+        cache_keys = get_slide_cache_keys(prs, dpi)
+        for slide_num in visible_slides:
+            cached_image = cache.get(cache_keys[slide_num - 1])
+            if cached_image is not None:
+                slide_images[slide_num] = cached_image
+        print(
+            f"Reusing {len(slide_images)} cached slide image(s), "
+            f"rendering {len(visible_slides) - len(slide_images)}"
+        )
+
+    slides_to_render = [
+        slide_num for slide_num in visible_slides if slide_num not in slide_images
+    ]
+    if slides_to_render:
+        if slide_images:
+            # Hide the cached slides in a copy of the deck, since hidden slides
+            # are not exported. Unlike deleting them, this keeps slide numbers
+            # and everything else about the remaining slides unchanged.
+            cached_elements = [prs.slides[n - 1].element for n in slide_images]
+            original_show = [element.get("show") for element in cached_elements]
+            render_path = temp_dir / "render" / pptx_path.name
+            render_path.parent.mkdir()
+            try:
+                for element in cached_elements:
+                    element.set("show", "0")
+                prs.save(str(render_path))
+            finally:
+                for element, show in zip(cached_elements, original_show):
+                    if show is None:
+                        del element.attrib["show"]
+                    else:
+                        element.set("show", show)
+        else:
+            render_path = pptx_path
+
+        page_cache_keys = (
+            [cache_keys[slide_num - 1] for slide_num in slides_to_render]
+            if cache is not None
+            else None
+        )
+        rendered_images = render_slides(
+            render_path,
+            temp_dir,
+            dpi,
+            len(slides_to_render),
+            executor,
+            jobs,
+            cache,
+            page_cache_keys,
+        )
+        slide_images.update(zip(slides_to_render, rendered_images))
+
+    # Create full list with placeholders for hidden slides
+    all_images = []
+
+    # Get placeholder dimensions from first visible slide
+    if hidden_slides and visible_slides and visible_slides[0] in slide_images:
+        with Image.open(resolve_image(slide_images[visible_slides[0]])) as img:
+            placeholder_size = img.size
+    else:
+        placeholder_size = (1920, 1080)
+
+    for slide_num in range(1, total_slides + 1):
+        if slide_num in hidden_slides:
+            # Create placeholder image for hidden slide
+            placeholder_path = temp_dir / f"hidden-{slide_num:03d}.jpg"
+            placeholder_img = create_hidden_slide_placeholder(placeholder_size)
+            placeholder_img.save(placeholder_path, "JPEG")
+            all_images.append(placeholder_path)
+        elif slide_num in slide_images:
+            # Use the actual visible slide image
+            all_images.append(slide_images[slide_num])
+
+    return all_images
+
+
+def render_slides(
+    pptx_path,
+    temp_dir,
+    dpi,
+    page_count,
+    executor=None,
+    jobs=1,
+    cache=None,
+    cache_keys=None,
+):
+    """Render the visible slides of a presentation to JPEG images, in slide order.
+
+    The presentation is converted to PDF once. Its page_count pages are then
+    rasterized in page ranges: with an executor, each range is a task (the
+    ranges are sized for jobs parallel workers) and its pages are returned as PendingImages; without one, all pages
+    are rasterized before returning. With a cache, each page image is stored
+    under the matching entry of cache_keys.
+    """
     pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
 
     # Convert to PDF
@@ -234,41 +514,78 @@ def convert_to_images(pptx_path, temp_dir, dpi):
 
     # Convert PDF to images
     print(f"Converting to images at {dpi} DPI...")
+    if executor is None:
+        return rasterize_pages(pdf_path, 1, None, temp_dir, dpi, cache, cache_keys)
+
+    # Several ranges per worker, in page order, so the first grids are ready early
+    pages_per_task = max(1, min(MAX_PAGES_PER_TASK, -(-page_count // jobs)))
+    images = []
+    for first_page in range(1, page_count + 1, pages_per_task):
+        last_page = min(first_page + pages_per_task - 1, page_count)
+        future = executor.submit(
+            rasterize_pages,
+            pdf_path,
+            first_page,
+            last_page,
+            temp_dir,
+            dpi,
+            cache,
+            cache_keys[first_page - 1 : last_page] if cache_keys else None,
+        )
+        images.extend(
+            PendingImage(future, index) for index in range(last_page - first_page + 1)
+        )
+    return images
+
+
+def rasterize_pages(
+    pdf_path, first_page, last_page, temp_dir, dpi, cache=None, cache_keys=None
+):
+    """Rasterize a page range of a PDF (to the end if last_page is None) with pdftoppm.
+
+    Returns the page images in page order. With a cache, the images are also
+    stored under cache_keys, which are given per page of the range.
+    """
+    # Each range gets its own directory, so concurrent ranges never mix files
+    output_dir = temp_dir / f"pages-{first_page:05d}"
+    output_dir.mkdir()
+
+    command = ["pdftoppm", "-jpeg", "-r", str(dpi), "-f", str(first_page)]
+    if last_page is not None:
+        command += ["-l", str(last_page)]
     result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
+        command + [str(pdf_path), str(output_dir / "slide")],
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
         raise RuntimeError("Image conversion failed")
 
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+    images = sorted(output_dir.glob("slide-*.jpg"))
+    if cache is not None:
+        for key, image_path in zip(cache_keys, images):
+            cache.put(key, image_path)
+    return images
 
-    # Create full list with placeholders for hidden slides
-    all_images = []
-    visible_idx = 0
 
-    # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
-            placeholder_size = img.size
-    else:
-        placeholder_size = (1920, 1080)
+class PendingImage:
+    """A slide image that a rasterization task is still producing."""
 
-    for slide_num in range(1, total_slides + 1):
-        if slide_num in hidden_slides:
-            # Create placeholder image for hidden slide
-            placeholder_path = temp_dir / f"hidden-{slide_num:03d}.jpg"
-            placeholder_img = create_hidden_slide_placeholder(placeholder_size)
-            placeholder_img.save(placeholder_path, "JPEG")
-            all_images.append(placeholder_path)
-        else:
-            # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
+    def __init__(self, future, index):
+        self.future = future  # Future of the task's list of page images
+        self.index = index  # Index of this image in that list
+
+    def result(self):
+        """Wait for the task and return the image path."""
+        images = self.future.result()
+        if self.index >= len(images):
+            raise RuntimeError("Image conversion failed")
+        return images[self.index]
 
-    return all_images
+
+def resolve_image(image):
+    """Return the path of a slide image, waiting for it if it is a PendingImage."""
+    return image.result() if isinstance(image, PendingImage) else image
 
 
 def create_grids(
@@ -279,7 +596,11 @@ def create_grids(
     placeholder_regions=None,
     slide_dimensions=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
+    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid.
+
+    Images may be PendingImages; each grid is saved as soon as its own
+    images are rasterized, while later pages are still being rasterized.
+    """
     # Maximum images per grid is cols × (cols + 1) for better proportions
     max_images_per_grid = cols * (cols + 1)
     grid_files = []
@@ -326,12 +647,17 @@ def create_grid(
     placeholder_regions=None,
     slide_dimensions=None,
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
+    """Create thumbnail grid from slide images with optional placeholder outlining.
+
+    Images are opened one at a time and decoded at a reduced scale close to
+    the thumbnail size (Image.draft), so large slide images are never fully
+    decoded.
+    """
     font_size = int(width * FONT_SIZE_RATIO)
     label_padding = int(font_size * LABEL_PADDING_RATIO)
 
     # Get dimensions
-    with Image.open(image_paths[0]) as img:
+    with Image.open(resolve_image(image_paths[0])) as img:
         aspect = img.height / img.width
     height = int(width * aspect)
 
@@ -353,7 +679,7 @@ def create_grid(
         font = ImageFont.load_default()
 
     # Place thumbnails
-    for i, img_path in enumerate(image_paths):
+    for i, image in enumerate(image_paths):
         row, col = i // cols, i % cols
         x = col * width + (col + 1) * GRID_PADDING
         y_base = (
@@ -374,10 +700,14 @@ def create_grid(
         # Add thumbnail below label with proportional spacing
         y_thumbnail = y_base + label_padding + font_size + label_padding
 
-        with Image.open(img_path) as img:
+        with Image.open(resolve_image(image)) as img:
             # Get original dimensions before thumbnail
             orig_w, orig_h = img.size
 
+            # Decode JPEGs at the smallest scale still at least thumbnail size
+            img.draft(img.mode, (width, height))
+            draft_scale = img.width / orig_w
+
             # Apply placeholder outlines if enabled
             if placeholder_regions and (start_slide_num + i) in placeholder_regions:
                 # Convert to RGBA for transparency support
@@ -395,8 +725,9 @@ def create_grid(
                     slide_width_inches = orig_w / CONVERSION_DPI
                     slide_height_inches = orig_h / CONVERSION_DPI
 
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
+                # Scale to the decoded image, which may be smaller than the original
+                x_scale = img.width / slide_width_inches
+                y_scale = img.height / slide_height_inches
 
                 # Create a highlight overlay
                 overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
@@ -413,8 +744,8 @@ def create_grid(
                     # Draw highlight outline with red color and thick stroke
                     # Using a bright red outline instead of fill
                     stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
+                        1, round(max(5, min(orig_w, orig_h) // 150) * draft_scale)
+                    )  # Thicker proportional stroke width, at the decoded scale
                     overlay_draw.rectangle(
                         [(px_left, px_top), (px_left + px_width, px_top + px_height)],
                         outline=(255, 0, 0, 255),  # Bright red, fully opaque
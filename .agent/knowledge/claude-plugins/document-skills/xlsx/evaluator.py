@@ -0,0 +1,1627 @@
+"""
+In-process formula evaluation for xlsx workbooks
+
+Evaluates the common subset of Excel formulas without launching LibreOffice:
+arithmetic, comparison and text operators, cell and range references
+(including cross-sheet references and defined names), and functions such as
+SUM, AVERAGE, IF, VLOOKUP, INDEX and MATCH. Formula cells are linked in a
+dependency graph, so after inputs change only the cells downstream of them
+are recomputed.
+
+Formulas outside the supported subset (array formulas, volatile or dynamic
+reference functions, circular references, ...) raise UnsupportedFormulaError;
+recalc.py then falls back to LibreOffice.
+
+Usage:
+    from evaluator import FormulaEngine
+
+    engine = FormulaEngine.load('model.xlsx')
+    engine.recalculate()
+    engine.set_value('Inputs', 'B3', 0.07)
+    engine.recalculate()  # Only recomputes cells that depend on Inputs!B3
+    engine.save()
+"""
+
+import inspect
+import math
+import os
+import re
+import tempfile
+import zipfile
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP, Context, Decimal, InvalidOperation
+from pathlib import Path
+
+from lxml import etree
+from openpyxl.formula.tokenizer import Token, Tokenizer, TokenizerError
+from openpyxl.utils.cell import column_index_from_string, get_column_letter
+
+from recalc import _namespace, _string_text, _workbook_part, _workbook_parts
+
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+WIDE_RANGE_COLUMNS = 64  # Ranges wider than this are indexed per sheet, not per column
+
+DIV0 = '#DIV/0!'
+NA = '#N/A'
+NAME = '#NAME?'
+NUM = '#NUM!'
+REF = '#REF!'
+VALUE = '#VALUE!'
+
+# Operator binding powers; Excel evaluates all binary operators left to right
+INFIX_POWER = {
+    '=': 10, '<>': 10, '<': 10, '>': 10, '<=': 10, '>=': 10,
+    '&': 20,
+    '+': 30, '-': 30,
+    '*': 40, '/': 40,
+    '^': 50,
+}
+PREFIX_POWER = 60  # Negation binds tighter than ^, so -2^2 is 4
+POSTFIX_POWER = 70
+
+_NUMBER_TEXT = re.compile(r'\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$')
+_AREA = re.compile(
+    r'(?:(\$?)([A-Za-z]{1,3})(\$?)(\d+)(?::(\$?)([A-Za-z]{1,3})(\$?)(\d+))?'
+    r'|(\$?)([A-Za-z]{1,3}):(\$?)([A-Za-z]{1,3})'
+    r'|(\$?)(\d+):(\$?)(\d+))$'
+)
+_FUNCTION_PREFIXES = ('_XLFN.', '_XLWS.')  # Newer functions are stored with these
+
+
+class UnsupportedFormulaError(Exception):
+    """A formula uses a feature the in-process evaluator does not implement"""
+
+
+class ExcelError(Exception):
+    """
+    An Excel error value such as #DIV/0!
+
+    Error values are stored in cells like any other value, and raised while
+    evaluating so that they propagate through operators and functions.
+    """
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+    def __eq__(self, other):
+        return isinstance(other, ExcelError) and other.code == self.code
+
+    def __hash__(self):
+        return hash(self.code)
+
+    def __repr__(self):
+        return f'ExcelError({self.code!r})'
+
+    def __str__(self):
+        return self.code
+
+
+class RangeValue:
+    """
+    A rectangular block of cells, as passed to functions like SUM or VLOOKUP
+
+    Whole-column and whole-row references keep their full extent, but
+    iteration stops at the last used row and column of the sheet.
+    """
+
+    __slots__ = ('_get', '_extent', 'sheet', 'min_row', 'min_col', 'max_row', 'max_col')
+
+    def __init__(self, engine, sheet, min_row, min_col, max_row, max_col):
+        self._get = engine._values.get
+        self._extent = engine._extents[sheet]
+        self.sheet = sheet
+        self.min_row = min_row
+        self.min_col = min_col
+        self.max_row = max_row
+        self.max_col = max_col
+
+    @property
+    def height(self):
+        return self.max_row - self.min_row + 1
+
+    @property
+    def width(self):
+        return self.max_col - self.min_col + 1
+
+    def _used_rows(self):
+        return range(self.min_row, min(self.max_row, self._extent[0]) + 1)
+
+    def _used_cols(self):
+        return range(self.min_col, min(self.max_col, self._extent[1]) + 1)
+
+    def single(self):
+        """Value of a one-cell range; larger ranges are not scalars"""
+        if self.min_row != self.max_row or self.min_col != self.max_col:
+            raise ExcelError(VALUE)
+        return self._get((self.sheet, self.min_row, self.min_col))
+
+    def cell(self, row, col):
+        """Value at 0-based (row, col) within the range"""
+        return self._get((self.sheet, self.min_row + row, self.min_col + col))
+
+    def rows(self):
+        get, sheet, cols = self._get, self.sheet, self._used_cols()
+        return [[get((sheet, row, col)) for col in cols] for row in self._used_rows()]
+
+    def column(self, index):
+        get, sheet, col = self._get, self.sheet, self.min_col + index
+        return [get((sheet, row, col)) for row in self._used_rows()]
+
+    def row(self, index):
+        get, sheet, row = self._get, self.sheet, self.min_row + index
+        return [get((sheet, row, col)) for col in self._used_cols()]
+
+    def values(self):
+        get, sheet, cols = self._get, self.sheet, self._used_cols()
+        for row in self._used_rows():
+            for col in cols:
+                yield get((sheet, row, col))
+
+    def vector(self):
+        """Values of a single-row or single-column range"""
+        if self.width == 1:
+            return self.column(0)
+        if self.height == 1:
+            return self.row(0)
+        raise ExcelError(NA)
+
+    def resized(self, height, width):
+        """Range of the given shape anchored at this range's top-left cell"""
+        return self._with(self.min_row, self.min_col,
+                          self.min_row + height - 1, self.min_col + width - 1)
+
+    def sub(self, row, col):
+        """INDEX-style sub-range: 1-based row and column, 0 for all of them"""
+        min_row, max_row = (self.min_row, self.max_row) if row == 0 else (self.min_row + row - 1,) * 2
+        min_col, max_col = (self.min_col, self.max_col) if col == 0 else (self.min_col + col - 1,) * 2
+        return self._with(min_row, min_col, max_row, max_col)
+
+    def _with(self, min_row, min_col, max_row, max_col):
+        other = RangeValue.__new__(RangeValue)
+        other._get, other._extent, other.sheet = self._get, self._extent, self.sheet
+        other.min_row, other.min_col, other.max_row, other.max_col = min_row, min_col, max_row, max_col
+        return other
+
+
+# Value coercion, following Excel's rules for operators and function arguments
+
+def _scalar(value):
+    if value.__class__ is RangeValue:
+        value = value.single()
+    if value.__class__ is ExcelError:
+        raise value
+    return value
+
+
+def _number(value):
+    cls = value.__class__
+    if cls is float:
+        return value
+    if cls is bool:
+        return 1.0 if value else 0.0
+    if value is None:
+        return 0.0
+    if cls is str:
+        if _NUMBER_TEXT.match(value):
+            return float(value)
+        raise ExcelError(VALUE)
+    if cls is RangeValue:
+        return _number(value.single())
+    if cls is ExcelError:
+        raise value
+    raise ExcelError(VALUE)
+
+
+def _integer(value):
+    return int(_number(value))
+
+
+def _format_number(value):
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return ('%.15g' % value).upper()
+
+
+def _text(value):
+    cls = value.__class__
+    if cls is str:
+        return value
+    if cls is float:
+        return _format_number(value)
+    if cls is bool:
+        return 'TRUE' if value else 'FALSE'
+    if value is None:
+        return ''
+    if cls is RangeValue:
+        return _text(value.single())
+    raise value
+
+
+def _boolean(value):
+    cls = value.__class__
+    if cls is bool:
+        return value
+    if cls is float:
+        return value != 0
+    if value is None:
+        return False
+    if cls is str:
+        upper = value.upper()
+        if upper in ('TRUE', 'FALSE'):
+            return upper == 'TRUE'
+        raise ExcelError(VALUE)
+    if cls is RangeValue:
+        return _boolean(value.single())
+    raise value
+
+
+def _order_key(value):
+    """Excel sort order: numbers, then text (case-insensitive), then logicals"""
+    cls = value.__class__
+    if cls is float:
+        return (0, value)
+    if cls is str:
+        return (1, value.lower())
+    if cls is bool:
+        return (2, value)
+    return (3, str(value))
+
+
+def _blank_like(other):
+    if other.__class__ is str:
+        return ''
+    if other.__class__ is bool:
+        return False
+    return 0.0
+
+
+def _compare(left, right):
+    left = _scalar(left)
+    right = _scalar(right)
+    if left is None:
+        left = _blank_like(right)
+    if right is None:
+        right = _blank_like(left)
+    left, right = _order_key(left), _order_key(right)
+    return (left > right) - (left < right)
+
+
+def _divide(left, right):
+    if right == 0:
+        raise ExcelError(DIV0)
+    return left / right
+
+
+def _power(base, exponent):
+    if base == 0 and exponent <= 0:
+        raise ExcelError(NUM if exponent == 0 else DIV0)
+    try:
+        return math.pow(base, exponent)
+    except (OverflowError, ValueError):
+        raise ExcelError(NUM)
+
+
+ARITHMETIC = {
+    '+': float.__add__,
+    '-': float.__sub__,
+    '*': float.__mul__,
+    '/': _divide,
+    '^': _power,
+}
+
+COMPARISONS = {
+    '=': lambda order: order == 0,
+    '<>': lambda order: order != 0,
+    '<': lambda order: order < 0,
+    '>': lambda order: order > 0,
+    '<=': lambda order: order <= 0,
+    '>=': lambda order: order >= 0,
+}
+
+
+# Function argument helpers
+
+def _numbers(args):
+    """Numbers from SUM-style arguments: ranges contribute only numeric cells"""
+    for arg in args:
+        if arg.__class__ is RangeValue:
+            for value in arg.values():
+                if value.__class__ is float:
+                    yield value
+                elif value.__class__ is ExcelError:
+                    raise value
+        elif arg is not None:
+            yield _number(arg)
+
+
+def _logicals(args):
+    for arg in args:
+        if arg.__class__ is RangeValue:
+            for value in arg.values():
+                if value.__class__ is bool:
+                    yield value
+                elif value.__class__ is float:
+                    yield value != 0
+                elif value.__class__ is ExcelError:
+                    raise value
+        else:
+            yield _boolean(arg)
+
+
+def _wildcard(pattern):
+    """Compile an Excel wildcard pattern (* and ?, escaped with ~)"""
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '~' and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        elif char == '*':
+            parts.append('.*')
+        elif char == '?':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return re.compile(''.join(parts), re.IGNORECASE | re.DOTALL)
+
+
+def _has_wildcards(text):
+    return '*' in text or '?' in text or '~' in text
+
+
+def _criterion(criteria):
+    """Predicate for a SUMIF/COUNTIF criterion such as 5, ">=10", "<>x" or "a*" """
+    criteria = _scalar(criteria)
+    operator = '='
+    if criteria.__class__ is str:
+        for candidate in ('<=', '>=', '<>', '<', '>', '='):
+            if criteria.startswith(candidate):
+                operator, criteria = candidate, criteria[len(candidate):]
+                break
+        if _NUMBER_TEXT.match(criteria):
+            criteria = float(criteria)
+        elif criteria.upper() in ('TRUE', 'FALSE'):
+            criteria = criteria.upper() == 'TRUE'
+    elif criteria is None:
+        criteria = 0.0
+
+    if criteria.__class__ is str and operator in ('=', '<>'):
+        if criteria == '':
+            matches = lambda value: value is None or value == ''
+        elif _has_wildcards(criteria):
+            pattern = _wildcard(criteria)
+            matches = lambda value: value.__class__ is str and pattern.fullmatch(value) is not None
+        else:
+            lowered = criteria.lower()
+            matches = lambda value: value.__class__ is str and value.lower() == lowered
+        if operator == '<>':
+            return lambda value: not matches(value)
+        return matches
+
+    key = _order_key(criteria)
+    if operator == '=':
+        return lambda value: value is not None and _order_key(value) == key
+    if operator == '<>':
+        return lambda value: value is None or _order_key(value) != key
+
+    test = COMPARISONS[operator]
+
+    def matches(value):
+        # Only values of the criterion's type (number, text or logical) compare
+        if value is None or value.__class__ is ExcelError:
+            return False
+        value_key = _order_key(value)
+        return value_key[0] == key[0] and test((value_key > key) - (value_key < key))
+
+    return matches
+
+
+def _criteria_cells(range_criteria):
+    """Rows of cells and predicates for the (range, criteria) pairs of *IFS functions"""
+    if len(range_criteria) % 2:
+        raise ExcelError(VALUE)
+    ranges = range_criteria[::2]
+    if any(cells.__class__ is not RangeValue for cells in ranges):
+        raise ExcelError(VALUE)
+    height, width = ranges[0].height, ranges[0].width
+    if any(cells.height != height or cells.width != width for cells in ranges):
+        raise ExcelError(VALUE)
+    predicates = [_criterion(criteria) for criteria in range_criteria[1::2]]
+    return ranges, predicates
+
+
+def _matching_positions(ranges, predicates):
+    columns = [list(cells.values()) for cells in ranges]
+    for position, values in enumerate(zip(*columns)):
+        if all(predicate(value) for predicate, value in zip(predicates, values)):
+            yield position
+
+
+def _lookup(lookup, values, match_type):
+    """0-based position of lookup in values, or None (MATCH semantics)"""
+    if lookup is None:
+        return None
+    if match_type == 0:
+        if lookup.__class__ is str and _has_wildcards(lookup):
+            pattern = _wildcard(lookup)
+            for position, value in enumerate(values):
+                if value.__class__ is str and pattern.fullmatch(value):
+                    return position
+            return None
+        key = _order_key(lookup)
+        for position, value in enumerate(values):
+            if value is not None and _order_key(value) == key:
+                return position
+        return None
+
+    # Approximate match over sorted values: the last one not past the lookup value
+    key = _order_key(lookup)
+    found = None
+    for position, value in enumerate(values):
+        if value is None:
+            continue
+        value_key = _order_key(value)
+        if value_key[0] != key[0]:
+            continue
+        if (value_key <= key) if match_type > 0 else (value_key >= key):
+            found = position
+        else:
+            break
+    return found
+
+
+def _round(number, digits, rounding):
+    number = _number(number)
+    quantum = Decimal(1).scaleb(-_integer(digits))
+    try:
+        rounded = Decimal(repr(number)).quantize(quantum, rounding=rounding, context=Context(prec=400))
+    except InvalidOperation:
+        return number
+    return float(rounded)
+
+
+# Worksheet functions. Arguments arrive evaluated: references as RangeValue,
+# omitted trailing arguments use the Python defaults, and empty arguments
+# (as in IF(A1,,1)) are None.
+
+def _sum(*args):
+    return math.fsum(_numbers(args))
+
+
+def _average(*args):
+    values = list(_numbers(args))
+    if not values:
+        raise ExcelError(DIV0)
+    return math.fsum(values) / len(values)
+
+
+def _min(*args):
+    return min(_numbers(args), default=0.0)
+
+
+def _max(*args):
+    return max(_numbers(args), default=0.0)
+
+
+def _count(*args):
+    count = 0
+    for arg in args:
+        if arg.__class__ is RangeValue:
+            count += sum(1 for value in arg.values() if value.__class__ is float)
+        elif arg is not None:
+            try:
+                _number(arg)
+            except ExcelError:
+                continue
+            count += 1
+    return float(count)
+
+
+def _counta(*args):
+    count = 0
+    for arg in args:
+        if arg.__class__ is RangeValue:
+            count += sum(1 for value in arg.values() if value is not None)
+        elif arg is not None:
+            count += 1
+    return float(count)
+
+
+def _and(*args):
+    values = list(_logicals(args))
+    if not values:
+        raise ExcelError(VALUE)
+    return all(values)
+
+
+def _or(*args):
+    values = list(_logicals(args))
+    if not values:
+        raise ExcelError(VALUE)
+    return any(values)
+
+
+def _not(value):
+    return not _boolean(_scalar(value))
+
+
+def _abs(value):
+    return abs(_number(value))
+
+
+def _int(value):
+    return float(math.floor(_number(value)))
+
+
+def _mod(number, divisor):
+    number, divisor = _number(number), _number(divisor)
+    if divisor == 0:
+        raise ExcelError(DIV0)
+    return number - divisor * math.floor(number / divisor)
+
+
+def _sqrt(value):
+    value = _number(value)
+    if value < 0:
+        raise ExcelError(NUM)
+    return math.sqrt(value)
+
+
+def _power_function(base, exponent):
+    return _power(_number(base), _number(exponent))
+
+
+def _round_half_up(number, digits=0.0):
+    return _round(number, digits, ROUND_HALF_UP)
+
+
+def _round_up(number, digits=0.0):
+    return _round(number, digits, ROUND_UP)
+
+
+def _round_down(number, digits=0.0):
+    return _round(number, digits, ROUND_DOWN)
+
+
+def _sumproduct(*arrays):
+    rows = []
+    shape = None
+    for array in arrays:
+        if array.__class__ is RangeValue:
+            if shape is None:
+                shape = (array.height, array.width)
+            elif shape != (array.height, array.width):
+                raise ExcelError(VALUE)
+            rows.append(list(array.values()))
+        else:
+            rows.append([_scalar(array)])
+    total = []
+    for values in zip(*rows):
+        product = 1.0
+        for value in values:
+            if value.__class__ is ExcelError:
+                raise value
+            product *= value if value.__class__ is float else 0.0
+        total.append(product)
+    return math.fsum(total)
+
+
+def _sumif(cells, criteria, sum_cells=None):
+    if cells.__class__ is not RangeValue:
+        raise ExcelError(VALUE)
+    if sum_cells is None:
+        sum_cells = cells
+    elif sum_cells.__class__ is not RangeValue:
+        raise ExcelError(VALUE)
+    sum_values = list(sum_cells.resized(cells.height, cells.width).values())
+    matches = _criterion(criteria)
+    total = []
+    for position, value in enumerate(cells.values()):
+        if matches(value) and position < len(sum_values):
+            summand = sum_values[position]
+            if summand.__class__ is float:
+                total.append(summand)
+            elif summand.__class__ is ExcelError:
+                raise summand
+    return math.fsum(total)
+
+
+def _sumifs(sum_cells, *range_criteria):
+    ranges, predicates = _criteria_cells(range_criteria)
+    if sum_cells.__class__ is not RangeValue or (sum_cells.height, sum_cells.width) != (ranges[0].height, ranges[0].width):
+        raise ExcelError(VALUE)
+    sum_values = list(sum_cells.values())
+    total = []
+    for position in _matching_positions(ranges, predicates):
+        if position < len(sum_values):
+            summand = sum_values[position]
+            if summand.__class__ is float:
+                total.append(summand)
+            elif summand.__class__ is ExcelError:
+                raise summand
+    return math.fsum(total)
+
+
+def _countif(cells, criteria):
+    if cells.__class__ is not RangeValue:
+        raise ExcelError(VALUE)
+    matches = _criterion(criteria)
+    count = sum(1 for value in cells.values() if matches(value))
+    # Blank cells past the used area still match criteria such as ""
+    if matches(None):
+        count += cells.height * cells.width - len(cells._used_rows()) * len(cells._used_cols())
+    return float(count)
+
+
+def _countifs(*range_criteria):
+    ranges, predicates = _criteria_cells(range_criteria)
+    return float(sum(1 for _ in _matching_positions(ranges, predicates)))
+
+
+def _vlookup(lookup, table, column, approximate=True):
+    lookup = _scalar(lookup)
+    if table.__class__ is not RangeValue:
+        raise ExcelError(VALUE)
+    index = _integer(column)
+    if index < 1:
+        raise ExcelError(VALUE)
+    if index > table.width:
+        raise ExcelError(REF)
+    position = _lookup(lookup, table.column(0), 1 if _boolean(approximate) else 0)
+    if position is None:
+        raise ExcelError(NA)
+    return table.cell(position, index - 1)
+
+
+def _hlookup(lookup, table, row, approximate=True):
+    lookup = _scalar(lookup)
+    if table.__class__ is not RangeValue:
+        raise ExcelError(VALUE)
+    index = _integer(row)
+    if index < 1:
+        raise ExcelError(VALUE)
+    if index > table.height:
+        raise ExcelError(REF)
+    position = _lookup(lookup, table.row(0), 1 if _boolean(approximate) else 0)
+    if position is None:
+        raise ExcelError(NA)
+    return table.cell(index - 1, position)
+
+
+def _match(lookup, cells, match_type=1.0):
+    lookup = _scalar(lookup)
+    if cells.__class__ is not RangeValue:
+        raise ExcelError(NA)
+    match_type = _integer(match_type)
+    position = _lookup(lookup, cells.vector(), (match_type > 0) - (match_type < 0))
+    if position is None:
+        raise ExcelError(NA)
+    return float(position + 1)
+
+
+def _index(cells, row=None, column=None):
+    if cells.__class__ is not RangeValue:
+        if _integer(row or 0.0) > 1 or _integer(column or 0.0) > 1:
+            raise ExcelError(REF)
+        return cells
+    row = _integer(row)
+    if column is None:
+        if cells.height == 1:
+            row, column = 1, row
+        else:
+            column = 1 if cells.width == 1 else 0
+    else:
+        column = _integer(column)
+    if not (0 <= row <= cells.height and 0 <= column <= cells.width):
+        raise ExcelError(REF)
+    return cells.sub(row, column)
+
+
+def _concatenate(*args):
+    return ''.join(_text(_scalar(arg)) for arg in args)
+
+
+def _len(text):
+    return float(len(_text(_scalar(text))))
+
+
+def _left(text, count=1.0):
+    count = _integer(count)
+    if count < 0:
+        raise ExcelError(VALUE)
+    return _text(_scalar(text))[:count]
+
+
+def _right(text, count=1.0):
+    count = _integer(count)
+    if count < 0:
+        raise ExcelError(VALUE)
+    return _text(_scalar(text))[-count:] if count else ''
+
+
+def _mid(text, start, count):
+    start, count = _integer(start), _integer(count)
+    if start < 1 or count < 0:
+        raise ExcelError(VALUE)
+    return _text(_scalar(text))[start - 1:start - 1 + count]
+
+
+def _upper(text):
+    return _text(_scalar(text)).upper()
+
+
+def _lower(text):
+    return _text(_scalar(text)).lower()
+
+
+def _trim(text):
+    return ' '.join(part for part in _text(_scalar(text)).split(' ') if part)
+
+
+FUNCTIONS = {
+    'SUM': _sum,
+    'AVERAGE': _average,
+    'MIN': _min,
+    'MAX': _max,
+    'COUNT': _count,
+    'COUNTA': _counta,
+    'AND': _and,
+    'OR': _or,
+    'NOT': _not,
+    'ABS': _abs,
+    'INT': _int,
+    'MOD': _mod,
+    'SQRT': _sqrt,
+    'POWER': _power_function,
+    'ROUND': _round_half_up,
+    'ROUNDUP': _round_up,
+    'ROUNDDOWN': _round_down,
+    'SUMPRODUCT': _sumproduct,
+    'SUMIF': _sumif,
+    'SUMIFS': _sumifs,
+    'COUNTIF': _countif,
+    'COUNTIFS': _countifs,
+    'VLOOKUP': _vlookup,
+    'HLOOKUP': _hlookup,
+    'MATCH': _match,
+    'INDEX': _index,
+    'CONCATENATE': _concatenate,
+    'LEN': _len,
+    'LEFT': _left,
+    'RIGHT': _right,
+    'MID': _mid,
+    'UPPER': _upper,
+    'LOWER': _lower,
+    'TRIM': _trim,
+}
+
+
+# Functions that decide which arguments to evaluate receive them unevaluated,
+# as zero-argument callables (None when omitted)
+
+def _if(condition, value_if_true=None, value_if_false=None):
+    if _boolean(_scalar(condition())):
+        return value_if_true() if value_if_true else True
+    return value_if_false() if value_if_false else False
+
+
+def _iferror(value, value_if_error):
+    try:
+        return _scalar(value())
+    except ExcelError:
+        return value_if_error()
+
+
+def _ifna(value, value_if_na):
+    try:
+        return _scalar(value())
+    except ExcelError as error:
+        if error.code != NA:
+            raise
+        return value_if_na()
+
+
+def _choose(index, *values):
+    index = _integer(index())
+    if not 1 <= index <= len(values):
+        raise ExcelError(VALUE)
+    return values[index - 1]()
+
+
+def _is_function(test, on_error=False):
+    def is_function(value):
+        try:
+            value = _scalar(value())
+        except ExcelError:
+            return on_error
+        return test(value)
+    return is_function
+
+
+LAZY_FUNCTIONS = {
+    'IF': _if,
+    'IFERROR': _iferror,
+    'IFNA': _ifna,
+    'CHOOSE': _choose,
+    'ISERROR': _is_function(lambda value: False, on_error=True),
+    'ISNUMBER': _is_function(lambda value: value.__class__ is float),
+    'ISTEXT': _is_function(lambda value: value.__class__ is str),
+    'ISBLANK': _is_function(lambda value: value is None),
+}
+
+
+class _Parser:
+    """
+    Pratt parser from openpyxl formula tokens to a small AST of tuples
+
+    Nodes are ('number', value), ('text', value), ('logical', value),
+    ('error', code), ('reference', text), ('negate', node),
+    ('percent', node), ('operator', op, left, right) and
+    ('function', name, [node or None for empty arguments]).
+    """
+
+    def __init__(self, formula):
+        try:
+            tokenizer = Tokenizer(formula)
+        except TokenizerError as e:
+            raise UnsupportedFormulaError(f'cannot parse {formula}: {e}')
+        self.tokens = [token for token in tokenizer.items if token.type != Token.WSPACE]
+        self.position = 0
+
+    def parse(self):
+        node = self._expression(0)
+        if self.position != len(self.tokens):
+            raise UnsupportedFormulaError(f'unexpected {self.tokens[self.position].value!r}')
+        return node
+
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self):
+        token = self._peek()
+        if token is None:
+            raise UnsupportedFormulaError('formula ends unexpectedly')
+        self.position += 1
+        return token
+
+    def _expression(self, min_power):
+        left = self._prefix()
+        while True:
+            token = self._peek()
+            if token is None:
+                return left
+            if token.type == Token.OP_POST:
+                if POSTFIX_POWER <= min_power:
+                    return left
+                self.position += 1
+                left = ('percent', left)
+                continue
+            if token.type == Token.OPERAND or token.subtype == Token.OPEN and token.type in (Token.FUNC, Token.PAREN):
+                # Only whitespace separates them, which is the intersection operator
+                raise UnsupportedFormulaError('the intersection operator is not supported')
+            if token.type != Token.OP_IN:
+                return left
+            power = INFIX_POWER.get(token.value)
+            if power is None:
+                raise UnsupportedFormulaError(f'operator {token.value!r} is not supported')
+            if power <= min_power:
+                return left
+            self.position += 1
+            left = ('operator', token.value, left, self._expression(power))
+
+    def _prefix(self):
+        token = self._next()
+        if token.type == Token.OPERAND:
+            if token.subtype == Token.NUMBER:
+                return ('number', float(token.value))
+            if token.subtype == Token.TEXT:
+                return ('text', token.value[1:-1].replace('""', '"'))
+            if token.subtype == Token.LOGICAL:
+                return ('logical', token.value.upper() == 'TRUE')
+            if token.subtype == Token.ERROR:
+                return ('error', token.value.upper())
+            return ('reference', token.value)
+        if token.type == Token.OP_PRE:
+            operand = self._expression(PREFIX_POWER)
+            return ('negate', operand) if token.value == '-' else operand
+        if token.type == Token.PAREN and token.subtype == Token.OPEN:
+            node = self._expression(0)
+            closing = self._next()
+            if closing.type != Token.PAREN:
+                raise UnsupportedFormulaError(f'unexpected {closing.value!r}')
+            return node
+        if token.type == Token.FUNC and token.subtype == Token.OPEN:
+            return ('function', token.value[:-1].upper(), self._arguments())
+        raise UnsupportedFormulaError(f'{token.value!r} is not supported')
+
+    def _arguments(self):
+        args = []
+        token = self._peek()
+        if token is not None and token.type == Token.FUNC and token.subtype == Token.CLOSE:
+            self.position += 1
+            return args
+        while True:
+            token = self._peek()
+            if token is not None and (token.type == Token.SEP or token.type == Token.FUNC and token.subtype == Token.CLOSE):
+                args.append(None)
+            else:
+                args.append(self._expression(0))
+            token = self._next()
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                return args
+            if token.type != Token.SEP or token.subtype != Token.ARG:
+                raise UnsupportedFormulaError(f'unexpected {token.value!r}')
+
+
+def _parse_area(text):
+    """
+    Corners of an A1 area as ((row, row_absolute), (col, col_absolute)) pairs
+
+    Rows or columns that a whole-column or whole-row reference leaves open
+    are None.
+    """
+    match = _AREA.match(text)
+    if match is None:
+        return None
+    groups = match.groups()
+    if groups[1] is not None:
+        first = ((int(groups[3]), bool(groups[2])), (column_index_from_string(groups[1].upper()), bool(groups[0])))
+        if groups[5] is None:
+            return first, first
+        return first, ((int(groups[7]), bool(groups[6])), (column_index_from_string(groups[5].upper()), bool(groups[4])))
+    if groups[9] is not None:
+        return (((None, True), (column_index_from_string(groups[9].upper()), bool(groups[8]))),
+                ((None, True), (column_index_from_string(groups[11].upper()), bool(groups[10]))))
+    return (((int(groups[13]), bool(groups[12])), (None, True)),
+            ((int(groups[15]), bool(groups[14])), (None, True)))
+
+
+def _split_reference(text):
+    """Split 'Sheet'!A1:B2 into (sheet name or None, area text)"""
+    sheet, separator, area = text.rpartition('!')
+    if not separator:
+        return None, text
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, area
+
+
+class _Formula:
+    """A compiled formula cell: its evaluation function and its references"""
+
+    __slots__ = ('text', 'function', 'references')
+
+    def __init__(self, text, function, references):
+        self.text = text
+        self.function = function
+        self.references = references  # (sheet, min_row, min_col, max_row, max_col)
+
+
+class FormulaEngine:
+    """
+    Formula values and dependency graph of a workbook
+
+    Cells are keyed by (sheet name, row, column). Formulas are compiled to
+    Python closures when the workbook is loaded; recalculate() evaluates them
+    in dependency order, the first time for every formula cell and afterwards
+    only for cells downstream of values changed with set_value().
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._values = {}
+        self._formulas = {}
+        self._extents = {}  # sheet -> [last used row, last used column]
+        self._sheet_names = {}  # lower-cased name -> sheet name
+        self._sheet_parts = {}  # sheet name -> worksheet part in the package
+        self._names = {}  # (sheet or None, lower-cased name) -> reference text
+        self._asts = {}  # formula text -> parsed AST
+
+        # Dependency graph: cells referenced directly, and ranges indexed by
+        # (sheet, column), or (sheet, None) for very wide ranges
+        self._cell_dependents = defaultdict(set)
+        self._range_dependents = defaultdict(list)
+
+        self._dirty = set()
+        self._changed_inputs = set()
+        self._calculated = False
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a workbook and compile its formulas
+
+        Raises:
+            UnsupportedFormulaError: If any formula is outside the supported subset
+        """
+        engine = cls(path)
+        with zipfile.ZipFile(path) as archive:
+            sheets, shared_strings_part = _workbook_parts(archive)
+            engine._read_names(archive)
+            for name, part in sheets:
+                engine._sheet_names[name.lower()] = name
+                engine._sheet_parts[name] = part
+                engine._extents[name] = [0, 0]
+            shared_strings = _read_shared_strings(archive, shared_strings_part)
+            pending = []
+            for name, part in sheets:
+                with archive.open(part) as stream:
+                    pending.extend(engine._read_sheet(stream, name, shared_strings))
+
+        for key, text, master in pending:
+            engine._add_formula(key, text, master)
+        return engine
+
+    def _read_names(self, archive):
+        root = etree.fromstring(archive.read(_workbook_part(archive)))
+        ns = _namespace(root.tag)
+        all_sheets = [sheet.get('name') for sheet in root.iterfind(f'{ns}sheets/{ns}sheet')]
+        for defined_name in root.iterfind(f'{ns}definedNames/{ns}definedName'):
+            local = defined_name.get('localSheetId')
+            scope = all_sheets[int(local)] if local is not None and int(local) < len(all_sheets) else None
+            self._names[(scope, defined_name.get('name', '').lower())] = (defined_name.text or '').strip()
+
+    def _read_sheet(self, stream, sheet, shared_strings):
+        """Read a worksheet's values, returning its formulas to compile once all values are known"""
+        formulas = []
+        shared = {}  # shared formula index -> (master key, master text)
+        extent = self._extents[sheet]
+        values = self._values
+
+        row_number = 0
+        for _, row in etree.iterparse(stream, tag='{*}row', huge_tree=True):
+            ns = _namespace(row.tag)
+            formula_tag, value_tag, inline_tag = f'{ns}f', f'{ns}v', f'{ns}is'
+            row_number = _row_number(row, row_number)
+            extent[0] = max(extent[0], row_number)
+            for col, cell in _row_cells(row):
+                if col > extent[1]:
+                    extent[1] = col
+                key = (sheet, row_number, col)
+                value_type = cell.get('t')
+                value = None
+                formula = None
+                for child in cell:
+                    if child.tag == value_tag:
+                        value = _cell_value(child.text, value_type, shared_strings)
+                    elif child.tag == inline_tag:
+                        value = _string_text(child, ns)
+                    elif child.tag == formula_tag:
+                        formula = child
+                if value is not None:
+                    values[key] = value
+                if formula is None:
+                    continue
+
+                kind = formula.get('t', 'normal')
+                if kind == 'shared':
+                    index = formula.get('si')
+                    if formula.text:
+                        shared[index] = (key, formula.text)
+                        formulas.append((key, formula.text, None))
+                    else:
+                        formulas.append((key, None, (shared, index)))
+                elif kind == 'normal':
+                    formulas.append((key, formula.text or '', None))
+                else:
+                    raise UnsupportedFormulaError(
+                        f"{_location(key)}: {kind} formulas are not supported"
+                    )
+            row.clear()
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+
+        # Shared formulas are stored once, on their master cell
+        resolved = []
+        for key, text, master in formulas:
+            if master is not None:
+                shared_formulas, index = master
+                if index not in shared_formulas:
+                    raise UnsupportedFormulaError(f'{_location(key)}: shared formula {index} has no master cell')
+                master = shared_formulas[index]
+            resolved.append((key, text, master))
+        return resolved
+
+    def _add_formula(self, key, text, master):
+        """Compile a formula cell and link it into the dependency graph"""
+        sheet, row, col = key
+        if master is not None:
+            (_, master_row, master_col), text = master
+            offset = (row - master_row, col - master_col)
+        else:
+            offset = (0, 0)
+
+        try:
+            ast = self._asts.get(text)
+            if ast is None:
+                ast = self._asts[text] = _Parser('=' + text).parse()
+            references = []
+            value_function, _ = self._compile(ast, key, offset, references)
+        except UnsupportedFormulaError as e:
+            raise UnsupportedFormulaError(f'{_location(key)}: {e}') from None
+
+        self._formulas[key] = _Formula(text, value_function, references)
+        for reference in references:
+            ref_sheet, min_row, min_col, max_row, max_col = reference
+            if min_row == max_row and min_col == max_col:
+                self._cell_dependents[(ref_sheet, min_row, min_col)].add(key)
+            elif max_col - min_col + 1 > WIDE_RANGE_COLUMNS:
+                self._range_dependents[(ref_sheet, None)].append((min_row, max_row, min_col, max_col, key))
+            else:
+                entry = (min_row, max_row, min_col, max_col, key)
+                for ref_col in range(min_col, max_col + 1):
+                    self._range_dependents[(ref_sheet, ref_col)].append(entry)
+
+    # Compilation of AST nodes to closures. Each node compiles to a pair of
+    # (value function, range function); the range function is set only for
+    # references, so functions can receive them as ranges.
+
+    def _compile(self, node, cell, offset, references):
+        kind = node[0]
+        if kind in ('number', 'text', 'logical'):
+            constant = node[1]
+            return (lambda: constant), None
+        if kind == 'error':
+            error = ExcelError(node[1])
+            return (lambda: error), None
+        if kind == 'reference':
+            return self._compile_reference(node[1], cell, offset, references)
+        if kind == 'negate':
+            operand, _ = self._compile(node[1], cell, offset, references)
+            return (lambda: -_number(operand())), None
+        if kind == 'percent':
+            operand, _ = self._compile(node[1], cell, offset, references)
+            return (lambda: _number(operand()) / 100), None
+        if kind == 'operator':
+            return self._compile_operator(node, cell, offset, references), None
+        return self._compile_function(node, cell, offset, references), None
+
+    def _compile_operator(self, node, cell, offset, references):
+        _, operator, left, right = node
+        left, _ = self._compile(left, cell, offset, references)
+        right, _ = self._compile(right, cell, offset, references)
+        if operator in ARITHMETIC:
+            apply = ARITHMETIC[operator]
+            return lambda: apply(_number(left()), _number(right()))
+        if operator == '&':
+            return lambda: _text(left()) + _text(right())
+        test = COMPARISONS[operator]
+        return lambda: test(_compare(left(), right()))
+
+    def _compile_function(self, node, cell, offset, references):
+        _, name, arg_nodes = node
+        for prefix in _FUNCTION_PREFIXES:
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+        lazy = name in LAZY_FUNCTIONS
+        function = LAZY_FUNCTIONS.get(name) or FUNCTIONS.get(name)
+        if function is None:
+            raise UnsupportedFormulaError(f'function {name} is not supported')
+
+        args = []
+        for arg in arg_nodes:
+            if arg is None:
+                args.append(lambda: None)
+            else:
+                value_function, range_function = self._compile(arg, cell, offset, references)
+                args.append(range_function or value_function)
+        try:
+            inspect.signature(function).bind(*args)
+        except TypeError:
+            raise UnsupportedFormulaError(f'wrong number of arguments to {name}') from None
+
+        if lazy:
+            return lambda: function(*args)
+        if len(args) == 1:
+            only, = args
+            return lambda: function(only())
+        return lambda: function(*[arg() for arg in args])
+
+    def _compile_reference(self, text, cell, offset, references):
+        target = self._resolve_reference(text, cell[0], offset)
+        if target is None:
+            error = ExcelError(REF)
+            return (lambda: error), None
+        references.append(target)
+        ref_sheet, min_row, min_col, max_row, max_col = target
+        if min_row == max_row and min_col == max_col:
+            get = self._values.get
+            key = (ref_sheet, min_row, min_col)
+            return (lambda: get(key)), (lambda: RangeValue(self, ref_sheet, min_row, min_col, max_row, max_col))
+
+        # Where a single value is expected, a range means the cell in the
+        # formula's row or column (implicit intersection)
+        _, row, col = cell
+        if min_col == max_col and min_row <= row <= max_row:
+            key = (ref_sheet, row, min_col)
+        elif min_row == max_row and min_col <= col <= max_col:
+            key = (ref_sheet, min_row, col)
+        else:
+            key = None
+        if key is None:
+            value = _raise_value_error
+        else:
+            get = self._values.get
+            value = lambda: get(key)
+        return value, (lambda: RangeValue(self, ref_sheet, min_row, min_col, max_row, max_col))
+
+    def _resolve_reference(self, text, sheet, offset):
+        """(sheet, min_row, min_col, max_row, max_col) for a reference, None for #REF!"""
+        sheet_name, area_text = _split_reference(text)
+        if sheet_name is not None:
+            if ':' in sheet_name:
+                raise UnsupportedFormulaError(f'3D reference {text} is not supported')
+            target_sheet = self._sheet_names.get(sheet_name.lower())
+            if target_sheet is None:
+                return None
+        else:
+            target_sheet = sheet
+
+        area = _parse_area(area_text)
+        if area is None:
+            name = self._names.get((sheet, area_text.lower())) or self._names.get((None, area_text.lower()))
+            if sheet_name is None and name:
+                # Defined names hold absolute references, so no offset applies
+                return self._resolve_reference(name, sheet, (0, 0))
+            raise UnsupportedFormulaError(f'reference {text} is not supported')
+
+        (first_row, first_col), (last_row, last_col) = area
+        row_offset, col_offset = offset
+        rows = [_shift(first_row, row_offset, 1), _shift(last_row, row_offset, MAX_ROW)]
+        cols = [_shift(first_col, col_offset, 1), _shift(last_col, col_offset, MAX_COLUMN)]
+        if None in rows or None in cols:
+            return None
+        return (target_sheet, min(rows), min(cols), max(rows), max(cols))
+
+    # Evaluation
+
+    def recalculate(self):
+        """
+        Evaluate formulas affected by changes since the last call
+
+        The first call evaluates every formula cell. Later calls evaluate only
+        the formulas downstream of cells changed with set_value().
+
+        Returns:
+            Number of formula cells evaluated
+        """
+        if self._calculated:
+            keys = self._downstream(self._dirty)
+        else:
+            keys = set(self._formulas)
+        order = self._evaluation_order(keys)
+        for key in order:
+            self._evaluate(key)
+        self._dirty.clear()
+        self._calculated = True
+        return len(order)
+
+    def _evaluate(self, key):
+        try:
+            value = self._formulas[key].function()
+            if value.__class__ is RangeValue:
+                value = value.single()
+            if value is None:
+                value = 0.0
+            elif value.__class__ is float and not math.isfinite(value):
+                value = ExcelError(NUM)
+        except ExcelError as error:
+            value = error
+        except UnsupportedFormulaError as e:
+            raise UnsupportedFormulaError(f'{_location(key)}: {e}') from None
+        except RecursionError:
+            raise UnsupportedFormulaError(f'{_location(key)}: formula is nested too deeply') from None
+        self._values[key] = value
+
+    def _precedents(self, key, keys, rows_by_column):
+        """
+        Cells among keys that the formula at key reads
+
+        rows_by_column holds the sorted rows of keys per (sheet, column), so
+        a range only visits the formulas being evaluated rather than all of
+        the formulas inside it.
+        """
+        for sheet, min_row, min_col, max_row, max_col in self._formulas[key].references:
+            if min_row == max_row and min_col == max_col:
+                cell = (sheet, min_row, min_col)
+                if cell in keys:
+                    yield cell
+                continue
+            last_row, last_col = self._extents[sheet]
+            for col in range(min_col, min(max_col, last_col) + 1):
+                rows = rows_by_column.get((sheet, col))
+                if rows:
+                    for row in rows[bisect_left(rows, min_row):bisect_right(rows, max_row)]:
+                        yield (sheet, row, col)
+
+    def _dependents(self, key):
+        """Formula cells that read the cell at key"""
+        sheet, row, col = key
+        yield from self._cell_dependents.get(key, ())
+        for bucket in ((sheet, col), (sheet, None)):
+            for min_row, max_row, min_col, max_col, dependent in self._range_dependents.get(bucket, ()):
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    yield dependent
+
+    def _downstream(self, changed):
+        """Formula cells whose value depends, directly or not, on the changed cells"""
+        affected = set()
+        queue = list(changed)
+        while queue:
+            for dependent in self._dependents(queue.pop()):
+                if dependent not in affected and dependent in self._formulas:
+                    affected.add(dependent)
+                    queue.append(dependent)
+        return affected
+
+    def _evaluation_order(self, keys):
+        """Order formula cells so that each follows the formulas it reads"""
+        rows_by_column = defaultdict(list)
+        for sheet, row, col in keys:
+            rows_by_column[(sheet, col)].append(row)
+        for rows in rows_by_column.values():
+            rows.sort()
+
+        order = []
+        done = set()
+        visiting = set()
+        for root in keys:
+            if root in done:
+                continue
+            visiting.add(root)
+            stack = [(root, self._precedents(root, keys, rows_by_column))]
+            while stack:
+                key, precedents = stack[-1]
+                for precedent in precedents:
+                    if precedent in done:
+                        continue
+                    if precedent in visiting:
+                        raise UnsupportedFormulaError(
+                            f'{_location(precedent)}: circular reference'
+                        )
+                    visiting.add(precedent)
+                    stack.append((precedent, self._precedents(precedent, keys, rows_by_column)))
+                    break
+                else:
+                    stack.pop()
+                    visiting.discard(key)
+                    done.add(key)
+                    order.append(key)
+        return order
+
+    # Reading and changing cells
+
+    def _key(self, sheet, reference):
+        name = self._sheet_names.get(sheet.lower())
+        area = _parse_area(reference)
+        if name is None or area is None or area[0] != area[1] or area[0][0][0] is None or area[0][1][0] is None:
+            raise ValueError(f'{sheet}!{reference} is not a cell in this workbook')
+        (row, _), (col, _) = area[0]
+        return (name, row, col)
+
+    def get_value(self, sheet, reference):
+        """Current value of a cell: float, str, bool, ExcelError or None if blank"""
+        return self._values.get(self._key(sheet, reference))
+
+    def set_value(self, sheet, reference, value):
+        """
+        Change an input cell; the next recalculate() updates its dependents
+
+        Raises:
+            ValueError: If the cell holds a formula
+        """
+        key = self._key(sheet, reference)
+        if key in self._formulas:
+            raise ValueError(f'{_location(key)} holds a formula')
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = float(value)
+        elif value is not None and not isinstance(value, (str, bool, ExcelError)):
+            raise TypeError(f'unsupported cell value {value!r}')
+        if value is None:
+            self._values.pop(key, None)
+        else:
+            self._values[key] = value
+        extent = self._extents[key[0]]
+        extent[0] = max(extent[0], key[1])
+        extent[1] = max(extent[1], key[2])
+        self._dirty.add(key)
+        self._changed_inputs.add(key)
+
+    def formula_cells(self):
+        """(sheet, coordinate) of every formula cell"""
+        for sheet, row, col in self._formulas:
+            yield sheet, f'{get_column_letter(col)}{row}'
+
+    # Saving
+
+    def save(self, path=None):
+        """
+        Write formula results as cached values, plus any changed inputs
+
+        Only the worksheets are rewritten; every other part of the package is
+        copied unchanged. The file is replaced atomically.
+        """
+        path = Path(path or self.path)
+        updates = defaultdict(dict)
+        for key in self._formulas:
+            updates[key[0]][key[1:]] = (self._values.get(key), True)
+        for key in self._changed_inputs:
+            updates[key[0]][key[1:]] = (self._values.get(key), False)
+
+        with zipfile.ZipFile(self.path) as source:
+            rewritten = {
+                self._sheet_parts[sheet]: _update_sheet(source.read(self._sheet_parts[sheet]), cells)
+                for sheet, cells in updates.items()
+            }
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.xlsx')
+            try:
+                with os.fdopen(fd, 'wb') as handle, zipfile.ZipFile(handle, 'w') as target:
+                    for info in source.infolist():
+                        data = rewritten.get(info.filename)
+                        if data is None:
+                            data = source.read(info)
+                        target.writestr(info, data, compress_type=info.compress_type)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        self.path = path
+
+
+def _raise_value_error():
+    raise ExcelError(VALUE)
+
+
+def _shift(position, offset, unbounded):
+    """Apply a shared formula offset to one row or column of a reference"""
+    value, absolute = position
+    if value is None:
+        return unbounded
+    if not absolute:
+        value += offset
+    return value if value >= 1 else None
+
+
+def _location(key):
+    sheet, row, col = key
+    return f'{sheet}!{get_column_letter(col)}{row}'
+
+
+def _cell_value(text, value_type, shared_strings):
+    if text is None:
+        return None
+    if value_type is None or value_type == 'n':
+        return float(text)
+    if value_type == 's':
+        return shared_strings[int(text)]
+    if value_type == 'b':
+        return text == '1'
+    if value_type == 'e':
+        return ExcelError(text)
+    if value_type == 'str':
+        return text
+    raise UnsupportedFormulaError(f'cell type {value_type!r} is not supported')
+
+
+def _read_shared_strings(archive, part):
+    strings = []
+    if part is None:
+        return strings
+    try:
+        stream = archive.open(part)
+    except KeyError:
+        return strings
+    with stream:
+        for _, item in etree.iterparse(stream, tag='{*}si', huge_tree=True):
+            strings.append(_string_text(item, _namespace(item.tag)))
+            item.clear()
+    return strings
+
+
+def _row_number(row, previous):
+    """Number of a row element; rows may omit it and follow the previous row"""
+    number = row.get('r')
+    return int(number) if number is not None else previous + 1
+
+
+def _column_number(reference):
+    return column_index_from_string(reference.rstrip('0123456789'))
+
+
+def _row_cells(row):
+    """(column, cell element) for the cells of a row element"""
+    col = 0
+    for cell in row:
+        reference = cell.get('r')
+        col = col + 1 if reference is None else _column_number(reference)
+        yield col, cell
+
+
+def _number_text(value):
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _write_value(cell, value, is_formula, ns):
+    """Replace a cell's cached value, keeping its formula and style"""
+    for child in cell.findall(f'{ns}v') + cell.findall(f'{ns}is'):
+        cell.remove(child)
+    cell.attrib.pop('t', None)
+    if value is None:
+        return
+
+    if value.__class__ is str and not is_formula:
+        cell.set('t', 'inlineStr')
+        element = etree.Element(f'{ns}is')
+        text = etree.SubElement(element, f'{ns}t')
+        text.text = value
+        if value != value.strip():
+            text.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
+    else:
+        element = etree.Element(f'{ns}v')
+        if value.__class__ is bool:
+            cell.set('t', 'b')
+            element.text = '1' if value else '0'
+        elif value.__class__ is str:
+            cell.set('t', 'str')
+            element.text = value
+        elif value.__class__ is ExcelError:
+            cell.set('t', 'e')
+            element.text = value.code
+        else:
+            element.text = _number_text(value)
+
+    formula = cell.find(f'{ns}f')
+    if formula is not None:
+        formula.addnext(element)
+    else:
+        cell.insert(0, element)
+
+
+def _update_sheet(data, cells):
+    """Write {(row, col): (value, is_formula)} into a worksheet's XML"""
+    root = etree.fromstring(data, etree.XMLParser(huge_tree=True))
+    ns = _namespace(root.tag)
+    sheet_data = root.find(f'{ns}sheetData')
+    remaining = dict(cells)
+    rows = {}
+    row_number = 0
+    for row in sheet_data:
+        row_number = _row_number(row, row_number)
+        rows[row_number] = row
+        for col, cell in _row_cells(row):
+            update = remaining.pop((row_number, col), None)
+            if update is not None:
+                _write_value(cell, update[0], update[1], ns)
+
+    # Inputs set on cells that did not exist yet
+    for (row_number, col), (value, is_formula) in sorted(remaining.items()):
+        row = rows.get(row_number)
+        if row is None:
+            row = etree.Element(f'{ns}row', r=str(row_number))
+            following = [number for number in rows if number > row_number]
+            if following:
+                rows[min(following)].addprevious(row)
+            else:
+                sheet_data.append(row)
+            rows[row_number] = row
+        cell = etree.Element(f'{ns}c', r=f'{get_column_letter(col)}{row_number}')
+        position = next(
+            (index for index, (existing_col, _) in enumerate(_row_cells(row)) if existing_col > col),
+            len(row),
+        )
+        row.insert(position, cell)
+        _write_value(cell, value, is_formula, ns)
+
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+if __name__ == '__main__':
+    raise RuntimeError("This module should not be run directly.")
@@ -1,30 +1,56 @@
 #!/usr/bin/env python3
 """
 Excel Formula Recalculation Script
-Recalculates all formulas in an Excel file using LibreOffice
+Recalculates all formulas in an Excel file, in process when the formulas are
+supported by evaluator.py and otherwise using LibreOffice
 """
 
+import argparse
 import json
-import sys
+import math
+import shutil
 import subprocess
 import os
 import platform
+import posixpath
+import signal
+import tempfile
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from openpyxl import load_workbook
+from xml.parsers import expat
+from openpyxl.utils import coordinate_to_tuple, get_column_letter
+
+
+EXCEL_ERRORS = ('#VALUE!', '#DIV/0!', '#REF!', '#NAME?', '#NULL!', '#NUM!', '#N/A')
+EXCEL_ERROR_SET = frozenset(EXCEL_ERRORS)
+MAX_ERROR_LOCATIONS = 20  # Locations listed per error type in the summary
+TEXT_VALUE_TYPES = frozenset(('e', 'str', 'inlineStr'))  # Cell types cached as text
+ENGINES = ('auto', 'native', 'libreoffice')
+BATCH_POLL_INTERVAL = 0.1  # Seconds between checks of a batch session's progress
+MAX_STALLED_SESSIONS = 2  # Batch sessions in a row that may finish no file before giving up
+
+
+def _libreoffice_profile_dir():
+    """Directory of the LibreOffice user profile that holds the macros"""
+    if platform.system() == 'Darwin':
+        return os.path.expanduser('~/Library/Application Support/LibreOffice/4')
+    return os.path.expanduser('~/.config/libreoffice/4')
 
 
 def setup_libreoffice_macro():
     """Setup LibreOffice macro for recalculation if not already configured"""
-    if platform.system() == 'Darwin':
-        macro_dir = os.path.expanduser('~/Library/Application Support/LibreOffice/4/user/basic/Standard')
-    else:
-        macro_dir = os.path.expanduser('~/.config/libreoffice/4/user/basic/Standard')
+    macro_dir = os.path.join(_libreoffice_profile_dir(), 'user', 'basic', 'Standard')
     
     macro_file = os.path.join(macro_dir, 'Module1.xba')
     
     if os.path.exists(macro_file):
         with open(macro_file, 'r') as f:
-            if 'RecalculateAndSave' in f.read():
+            content = f.read()
+            if 'RecalculateAndSave' in content and 'RecalculateBatch' in content:
                 return True
     
     if not os.path.exists(macro_dir):
@@ -32,6 +58,10 @@ def setup_libreoffice_macro():
                       capture_output=True, timeout=10)
         os.makedirs(macro_dir, exist_ok=True)
     
+    # RecalculateBatch reads "<index> <file URL>" lines from the file named by
+    # RECALC_BATCH_LIST and appends "start <index>", then "done <index>" or
+    # "fail <index> <message>", to RECALC_BATCH_STATUS for each document, then
+    # shuts LibreOffice down
     macro_content = '''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
 <script:module xmlns:script="http://openoffice.org/2000/script" script:name="Module1" script:language="StarBasic">
@@ -40,6 +70,55 @@ def setup_libreoffice_macro():
       ThisComponent.store()
       ThisComponent.close(True)
     End Sub
+
+    Sub RecalculateBatch()
+      Dim listNum As Integer, entry As String, index As String, message As String
+      Dim separator As Long
+      listNum = FreeFile
+      Open Environ("RECALC_BATCH_LIST") For Input As #listNum
+      Do While Not EOF(listNum)
+        Line Input #listNum, entry
+        separator = InStr(entry, " ")
+        If separator &gt; 0 Then
+          index = Left(entry, separator - 1)
+          WriteBatchStatus("start " &amp; index)
+          message = RecalculateDocument(Mid(entry, separator + 1))
+          If message = "" Then
+            WriteBatchStatus("done " &amp; index)
+          Else
+            WriteBatchStatus("fail " &amp; index &amp; " " &amp; message)
+          End If
+        End If
+      Loop
+      Close #listNum
+      StarDesktop.terminate()
+    End Sub
+
+    Function RecalculateDocument(url As String) As String
+      Dim loadArgs(0) As New com.sun.star.beans.PropertyValue
+      Dim doc As Object
+      On Error GoTo Failed
+      loadArgs(0).Name = "Hidden"
+      loadArgs(0).Value = True
+      doc = StarDesktop.loadComponentFromURL(url, "_blank", 0, loadArgs())
+      doc.calculateAll()
+      doc.store()
+      doc.close(True)
+      RecalculateDocument = ""
+      Exit Function
+    Failed:
+      RecalculateDocument = "Line " &amp; Erl &amp; ": " &amp; Replace(Replace(Error$, Chr(13), " "), Chr(10), " ")
+      On Error Resume Next
+      If Not IsNull(doc) Then doc.close(True)
+    End Function
+
+    Sub WriteBatchStatus(status As String)
+      Dim statusNum As Integer
+      statusNum = FreeFile
+      Open Environ("RECALC_BATCH_STATUS") For Append As #statusNum
+      Print #statusNum, status
+      Close #statusNum
+    End Sub
 </script:module>'''
     
     try:
@@ -50,24 +129,71 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+def recalc(filename, timeout=30, engine='auto'):
     """
     Recalculate formulas in Excel file and report any errors
     
     Args:
         filename: Path to Excel file
-        timeout: Maximum time to wait for recalculation (seconds)
+        timeout: Maximum time to wait for LibreOffice recalculation (seconds)
+        engine: 'native' evaluates formulas in process, 'libreoffice' runs
+            soffice, and 'auto' tries native first and falls back to
+            LibreOffice when the workbook uses formulas it does not support
     
     Returns:
-        dict with error locations and counts
+        dict with error locations and counts, and the engine that was used
     """
     if not Path(filename).exists():
         return {'error': f'File {filename} does not exist'}
     
+    fallback_reason = None
+    if engine != 'libreoffice':
+        try:
+            recalc_native(filename)
+        except Exception as e:
+            if engine == 'native':
+                return {'error': str(e)}
+            fallback_reason = str(e)
+        else:
+            return summarize(filename, 'native')
+    
+    error = recalc_libreoffice(filename, timeout)
+    if error:
+        if fallback_reason:
+            return {'error': error, 'fallback_reason': fallback_reason}
+        return {'error': error}
+    
+    result = summarize(filename, 'libreoffice')
+    if fallback_reason and 'error' not in result:
+        result['fallback_reason'] = fallback_reason
+    return result
+
+
+def recalc_native(filename):
+    """
+    Recalculate formulas in process and save the results into the file
+    
+    Raises:
+        UnsupportedFormulaError: If the workbook uses formulas outside the
+            subset evaluator.py implements
+    """
+    # Imported here because evaluator.py builds on this module's package readers
+    from evaluator import FormulaEngine
+    
+    engine = FormulaEngine.load(filename)
+    engine.recalculate()
+    engine.save()
+
+
+def recalc_libreoffice(filename, timeout=30):
+    """Recalculate formulas with LibreOffice; returns an error message on failure"""
     abs_path = str(Path(filename).absolute())
     
+    if shutil.which('soffice') is None:
+        return 'LibreOffice (soffice) is not installed'
+    
     if not setup_libreoffice_macro():
-        return {'error': 'Failed to setup LibreOffice macro'}
+        return 'Failed to setup LibreOffice macro'
     
     cmd = [
         'soffice', '--headless', '--norestore',
@@ -94,85 +220,629 @@ def recalc(filename, timeout=30):
     if result.returncode != 0 and result.returncode != 124:  # 124 is timeout exit code
         error_msg = result.stderr or 'Unknown error during recalculation'
         if 'Module1' in error_msg or 'RecalculateAndSave' not in error_msg:
-            return {'error': 'LibreOffice macro not configured properly'}
+            return 'LibreOffice macro not configured properly'
         else:
-            return {'error': error_msg}
+            return error_msg
+    return None
+
+
+def recalc_batch(manifest, engine='auto', timeout=30):
+    """
+    Recalculate every workbook listed in a manifest and report errors per file
     
-    # Check for Excel errors in the recalculated file - scan ALL cells
+    The manifest is a JSON list of files, each either a path or an object with
+    "file" and an optional "timeout", or an object holding that list as "files"
+    and a default "timeout". Relative paths are relative to the manifest.
+    
+    Files the native engine cannot handle are all recalculated in a single
+    LibreOffice session, and each file's error scan runs while LibreOffice
+    moves on to the next one.
+    
+    Args:
+        manifest: Path to the JSON manifest
+        engine: As for recalc()
+        timeout: Seconds allowed per file when the manifest sets none
+    
+    Returns:
+        dict with per-file results keyed as listed in the manifest, and counts
+    """
     try:
-        wb = load_workbook(filename, data_only=True)
-        
-        excel_errors = ['#VALUE!', '#DIV/0!', '#REF!', '#NAME?', '#NULL!', '#NUM!', '#N/A']
-        error_details = {err: [] for err in excel_errors}
-        total_errors = 0
-        
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            # Check ALL rows and columns - no limits
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value is not None and isinstance(cell.value, str):
-                        for err in excel_errors:
-                            if err in cell.value:
-                                location = f"{sheet_name}!{cell.coordinate}"
-                                error_details[err].append(location)
-                                total_errors += 1
-                                break
-        
-        wb.close()
-        
-        # Build result summary
-        result = {
-            'status': 'success' if total_errors == 0 else 'errors_found',
-            'total_errors': total_errors,
-            'error_summary': {}
-        }
-        
-        # Add non-empty error categories
-        for err_type, locations in error_details.items():
-            if locations:
-                result['error_summary'][err_type] = {
-                    'count': len(locations),
-                    'locations': locations[:20]  # Show up to 20 locations
-                }
-        
-        # Add formula count for context - also check ALL cells
-        wb_formulas = load_workbook(filename, data_only=False)
-        formula_count = 0
-        for sheet_name in wb_formulas.sheetnames:
-            ws = wb_formulas[sheet_name]
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
-                        formula_count += 1
-        wb_formulas.close()
+        jobs = _read_manifest(manifest, timeout)
+    except (OSError, ValueError) as e:
+        return {'error': f'Invalid manifest {manifest}: {e}'}
+    
+    results = {}
+    fallback_reasons = {}
+    libreoffice_jobs = []
+    for name, path, file_timeout in jobs:
+        if not path.exists():
+            results[name] = {'error': f'File {path} does not exist'}
+            continue
+        if engine != 'libreoffice':
+            try:
+                recalc_native(path)
+            except Exception as e:
+                if engine == 'native':
+                    results[name] = {'error': str(e)}
+                    continue
+                fallback_reasons[name] = str(e)
+            else:
+                results[name] = summarize(path, 'native')
+                continue
+        libreoffice_jobs.append((name, path, file_timeout))
+    
+    if libreoffice_jobs:
+        with ThreadPoolExecutor(max_workers=1) as scanner:
+            scans = {}
+            
+            def scan(index):
+                name, path, _ = libreoffice_jobs[index]
+                scans[name] = scanner.submit(summarize, path, 'libreoffice')
+            
+            failures = recalc_libreoffice_batch(
+                [(path, file_timeout) for _, path, file_timeout in libreoffice_jobs], scan
+            )
+            for index, (name, _, _) in enumerate(libreoffice_jobs):
+                if index in failures:
+                    results[name] = {'error': failures[index]}
+                else:
+                    results[name] = scans[name].result()
+                if name in fallback_reasons:
+                    results[name]['fallback_reason'] = fallback_reasons[name]
+    
+    results = {name: results[name] for name, _, _ in jobs}
+    statuses = [result.get('status', 'failed') for result in results.values()]
+    return {
+        'total_files': len(results),
+        'success': statuses.count('success'),
+        'errors_found': statuses.count('errors_found'),
+        'failed': statuses.count('failed'),
+        'results': results,
+    }
+
+
+def _read_manifest(manifest, default_timeout):
+    """Read a batch manifest into (name, path, timeout) for each listed file"""
+    with open(manifest) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        default_timeout = data.get('timeout', default_timeout)
+        data = data.get('files')
+    if not isinstance(data, list):
+        raise ValueError('expected a list of files')
+    
+    base = Path(manifest).parent
+    jobs = []
+    seen = set()
+    for entry in data:
+        if isinstance(entry, str):
+            entry = {'file': entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get('file'), str):
+            raise ValueError(f'expected a path or an object with "file", got {entry!r}')
+        name = entry['file']
+        if name in seen:
+            raise ValueError(f'{name} is listed more than once')
+        seen.add(name)
+        file_timeout = entry.get('timeout', default_timeout)
+        if not isinstance(file_timeout, (int, float)) or file_timeout <= 0:
+            raise ValueError(f'invalid timeout for {name}: {file_timeout!r}')
+        jobs.append((name, base / name, file_timeout))
+    return jobs
+
+
+def recalc_libreoffice_batch(jobs, on_done=None):
+    """
+    Recalculate many files with as few LibreOffice launches as possible
+    
+    One soffice process opens, recalculates, stores and closes the files in
+    turn. When a file takes longer than its timeout, or LibreOffice crashes
+    on it, the process is killed, that file is reported as failed and a new
+    session carries on with the files after it.
+    
+    Args:
+        jobs: List of (path, timeout in seconds)
+        on_done: Called with a file's index in jobs as soon as it is stored
+    
+    Returns:
+        dict mapping the index of each file that failed to an error message
+    """
+    if shutil.which('soffice') is None:
+        return dict.fromkeys(range(len(jobs)), 'LibreOffice (soffice) is not installed')
+    if not setup_libreoffice_macro():
+        return dict.fromkeys(range(len(jobs)), 'Failed to setup LibreOffice macro')
+    
+    failures = {}
+    remaining = list(range(len(jobs)))
+    stalled = 0
+    while remaining:
+        handled, error = _run_batch_session(jobs, remaining, on_done, failures)
+        remaining = [index for index in remaining if index not in handled]
+        stalled = 0 if handled else stalled + 1
+        if stalled >= MAX_STALLED_SESSIONS:
+            failures.update(dict.fromkeys(remaining, error))
+            break
+    return failures
+
+
+def _run_batch_session(jobs, indexes, on_done, failures):
+    """
+    Run one soffice process over the files at indexes, in order
+    
+    Returns:
+        (set of indexes finished or failed, message explaining why the session
+        stopped early, or None)
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        list_file = Path(temp_dir) / 'files.txt'
+        status_file = Path(temp_dir) / 'status.txt'
+        list_file.write_text(''.join(
+            f'{index} {Path(jobs[index][0]).absolute().as_uri()}\n' for index in indexes
+        ))
+        status_file.touch()
         
-        result['total_formulas'] = formula_count
+        cmd = [
+            'soffice', '--headless', '--norestore',
+            'vnd.sun.star.script:Standard.Module1.RecalculateBatch?language=Basic&location=application',
+        ]
+        env = dict(os.environ, RECALC_BATCH_LIST=str(list_file), RECALC_BATCH_STATUS=str(status_file))
+        stderr_file = Path(temp_dir) / 'stderr.txt'
+        with open(stderr_file, 'wb') as stderr:
+            # A session of its own, so a hung soffice can be killed with its children
+            process = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL,
+                                       stderr=stderr, start_new_session=True)
         
-        return result
+        handled = set()
+        current = None  # File LibreOffice has started on and not finished
+        remaining = len(indexes)
+        last_event = time.monotonic()
+        partial = ''
+        error = None
+        with open(status_file) as status:
+            while remaining:
+                exited = process.poll() is not None
+                partial += status.read()
+                *lines, partial = partial.split('\n')
+                for line in lines:
+                    state, _, rest = line.rstrip('\r').partition(' ')
+                    index, _, message = rest.partition(' ')
+                    if state not in ('start', 'done', 'fail') or not index.isdigit():
+                        continue
+                    index = int(index)
+                    last_event = time.monotonic()
+                    if state == 'start':
+                        current = index
+                        continue
+                    current = None
+                    remaining -= 1
+                    handled.add(index)
+                    if state == 'done':
+                        if on_done is not None:
+                            on_done(index)
+                    else:
+                        failures[index] = message or 'LibreOffice could not recalculate the file'
+                if not remaining:
+                    break
+                
+                timeout = jobs[current if current is not None else indexes[len(handled)]][1]
+                if exited:
+                    error = stderr_file.read_text(errors='replace').strip()
+                    if not error:
+                        error = ('LibreOffice exited while recalculating the file' if current is not None
+                                 else 'LibreOffice exited before opening the file')
+                elif time.monotonic() - last_event > timeout:
+                    _kill_session(process)
+                    error = f'Timed out after {timeout} seconds'
+                else:
+                    time.sleep(BATCH_POLL_INTERVAL)
+                    continue
+                
+                # Blame the file LibreOffice was working on; if it never got to
+                # one, the session itself failed and the caller decides whether
+                # to retry
+                if current is not None:
+                    failures[current] = error
+                    handled.add(current)
+                    _remove_lock_files(jobs[current][0])
+                break
         
+        if process.poll() is None:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                _kill_session(process)
+    return handled, error
+
+
+def _kill_session(process):
+    """Kill soffice and the processes it started"""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+    process.wait()
+    # The profile lock would otherwise stop the next session from starting
+    try:
+        os.remove(os.path.join(_libreoffice_profile_dir(), '.lock'))
+    except OSError:
+        pass
+
+
+def _remove_lock_files(filename):
+    """Remove the lock file LibreOffice leaves beside a document it was killed on"""
+    path = Path(filename)
+    try:
+        (path.parent / f'.~lock.{path.name}#').unlink()
+    except OSError:
+        pass
+
+
+def summarize(filename, engine):
+    """Scan a recalculated file for Excel errors, noting the engine used"""
+    # Check for Excel errors in the recalculated file - scan ALL cells
+    try:
+        result = scan_workbook(filename)
     except Exception as e:
         return {'error': str(e)}
+    result['engine'] = engine
+    return result
+
+
+def _same_value(left, right):
+    if isinstance(left, float) and isinstance(right, float):
+        return math.isclose(left, right, rel_tol=1e-9, abs_tol=1e-12)
+    return left == right
+
+
+def benchmark(filename, timeout=30):
+    """
+    Time native and LibreOffice recalculation of the same workbook
+    
+    Each engine recalculates its own copy of the file, so the file itself is
+    not changed. The cached values both engines wrote are then compared for
+    every formula cell.
+    
+    Returns:
+        dict with per-engine timings and status, and the cells whose values differ
+    """
+    if not Path(filename).exists():
+        return {'error': f'File {filename} does not exist'}
+    
+    from evaluator import FormulaEngine
+    
+    result = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        copies = {}
+        for engine in ('native', 'libreoffice'):
+            copy = Path(temp_dir) / engine / Path(filename).name
+            copy.parent.mkdir()
+            shutil.copy2(filename, copy)
+            start = time.perf_counter()
+            outcome = recalc(copy, timeout, engine)
+            result[engine] = {'seconds': round(time.perf_counter() - start, 3)}
+            if 'error' in outcome:
+                result[engine]['error'] = outcome['error']
+            else:
+                result[engine]['status'] = outcome['status']
+                result[engine]['total_errors'] = outcome['total_errors']
+                copies[engine] = copy
+        
+        if len(copies) == 2:
+            native = FormulaEngine.load(copies['native'])
+            libreoffice = FormulaEngine.load(copies['libreoffice'])
+            mismatches = [
+                f'{sheet}!{reference}'
+                for sheet, reference in native.formula_cells()
+                if not _same_value(native.get_value(sheet, reference),
+                                   libreoffice.get_value(sheet, reference))
+            ]
+            result['speedup'] = round(result['libreoffice']['seconds'] / max(result['native']['seconds'], 1e-3), 1)
+            result['mismatches'] = len(mismatches)
+            result['mismatch_locations'] = mismatches[:MAX_ERROR_LOCATIONS]
+    return result
+
+
+def _namespace(tag):
+    """Namespace prefix of an element tag, e.g. '{http://...}' or ''"""
+    return tag[:tag.find('}') + 1]
+
+
+def _resolve_target(source_part, target):
+    """Resolve a relationship target against the part that owns it"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def _read_rels(archive, part):
+    """Map relationship ids of a package part to (type, target part)"""
+    rels_part = posixpath.join(posixpath.dirname(part), '_rels', posixpath.basename(part) + '.rels')
+    try:
+        root = ET.fromstring(archive.read(rels_part))
+    except KeyError:
+        return {}
+    return {
+        rel.get('Id'): (rel.get('Type', ''), _resolve_target(part, rel.get('Target', '')))
+        for rel in root
+        if rel.get('TargetMode') != 'External'
+    }
+
+
+def _workbook_part(archive):
+    """Find the workbook part through the package relationships"""
+    return next(
+        (target for rel_type, target in _read_rels(archive, '').values()
+         if rel_type.endswith('/officeDocument')),
+        'xl/workbook.xml',
+    )
+
+
+def _workbook_parts(archive):
+    """Find the worksheet parts (in tab order) and the shared strings part"""
+    workbook_part = _workbook_part(archive)
+    workbook_rels = _read_rels(archive, workbook_part)
+    shared_strings_part = next(
+        (target for rel_type, target in workbook_rels.values()
+         if rel_type.endswith('/sharedStrings')),
+        None,
+    )
+
+    root = ET.fromstring(archive.read(workbook_part))
+    ns = _namespace(root.tag)
+    sheets = []
+    for sheet in root.iterfind(f'{ns}sheets/{ns}sheet'):
+        # r:id, in either the transitional or the strict relationships namespace
+        rel_id = next((value for key, value in sheet.attrib.items() if key.endswith('}id')), None)
+        rel_type, target = workbook_rels.get(rel_id, ('', None))
+        # Chartsheets and dialog sheets have no cells to check
+        if target and rel_type.endswith('/worksheet'):
+            sheets.append((sheet.get('name'), target))
+    return sheets, shared_strings_part
+
+
+def _string_text(element, ns):
+    """Text of a shared or inline string, leaving out phonetic runs"""
+    return ''.join(
+        node.text or ''
+        for node in chain(element.iterfind(f'{ns}t'), element.iterfind(f'{ns}r/{ns}t'))
+    )
+
+
+def _shared_string_errors(archive, part):
+    """
+    Find the shared strings whose text is an Excel error value
+
+    The table is streamed and only the matching entries are kept, keyed by
+    their index as it appears in a cell's <v> element.
+    """
+    errors = {}
+    if part is None:
+        return errors
+
+    try:
+        stream = archive.open(part)
+    except KeyError:
+        return errors
+
+    with stream:
+        root = None
+        index = 0
+        for event, element in ET.iterparse(stream, events=('start', 'end')):
+            if root is None:
+                root = element
+                ns = _namespace(root.tag)
+                item_tag = f'{ns}si'
+            elif event == 'end' and element.tag == item_tag:
+                text = _string_text(element, ns)
+                if text in EXCEL_ERROR_SET:
+                    errors[str(index)] = text
+                index += 1
+                root.clear()
+    return errors
+
+
+class _SheetScanner:
+    """
+    Expat handlers that check a worksheet's cells as they stream past
+
+    Only the current cell's type, reference and text are held, so memory stays
+    bounded whatever the size of the sheet.
+    """
+
+    def __init__(self, sheet_name, shared_errors, error_counts, error_locations):
+        self.sheet_name = sheet_name
+        self.shared_errors = shared_errors
+        self.error_counts = error_counts
+        self.error_locations = error_locations
+        self.formula_count = 0
+
+        # Namespaced tag names, set from the root element
+        self._cell_tag = self._value_tag = self._text_tag = None
+        self._formula_tag = self._row_tag = self._phonetic_tag = None
+
+        self._row_number = 0
+        self._column = 0
+        self._last_reference = None
+        self._reference = None
+        self._value_type = None
+        self._text = None  # Text of the cell's <v> or inline string
+        self._collecting = False
+        self._phonetic = False
+
+    def scan(self, stream):
+        """Parse a worksheet stream and return the number of formulas in it"""
+        parser = expat.ParserCreate(namespace_separator=' ')
+        parser.buffer_text = True
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        parser.CharacterDataHandler = self._characters
+        parser.ParseFile(stream)
+        return self.formula_count
+
+    def _start(self, name, attrs):
+        if name == self._cell_tag:
+            self._value_type = attrs.get('t')
+            self._text = None
+            reference = attrs.get('r')
+            if reference is None:
+                # Cells may omit their reference and follow the previous one
+                if self._last_reference is not None:
+                    self._column = coordinate_to_tuple(self._last_reference)[1]
+                    self._last_reference = None
+                self._column += 1
+            else:
+                self._last_reference = reference
+            self._reference = reference
+        elif name == self._value_tag or (name == self._text_tag and not self._phonetic):
+            if self._text is None:
+                self._text = []
+            self._collecting = True
+        elif name == self._formula_tag:
+            self.formula_count += 1
+        elif name == self._row_tag:
+            self._row_number = int(attrs.get('r', self._row_number + 1))
+            self._column = 0
+            self._last_reference = None
+        elif name == self._phonetic_tag:
+            self._phonetic = True
+        elif self._cell_tag is None:
+            # The root element gives the namespace (transitional or strict)
+            ns = name[:name.rfind(' ') + 1]
+            self._cell_tag = f'{ns}c'
+            self._value_tag = f'{ns}v'
+            self._text_tag = f'{ns}t'
+            self._formula_tag = f'{ns}f'
+            self._row_tag = f'{ns}row'
+            self._phonetic_tag = f'{ns}rPh'
+
+    def _end(self, name):
+        if name == self._cell_tag:
+            if self._text is None or self._value_type is None:
+                return
+            value = ''.join(self._text)
+            if self._value_type == 's':
+                value = self.shared_errors.get(value)
+            elif self._value_type not in TEXT_VALUE_TYPES:
+                return
+            if value in EXCEL_ERROR_SET:
+                self._record_error(value)
+        elif self._collecting:
+            self._collecting = False
+        elif name == self._phonetic_tag:
+            self._phonetic = False
+
+    def _characters(self, data):
+        if self._collecting:
+            self._text.append(data)
+
+    def _record_error(self, error):
+        self.error_counts[error] += 1
+        locations = self.error_locations[error]
+        if len(locations) < MAX_ERROR_LOCATIONS:
+            reference = self._reference
+            if reference is None:
+                reference = f'{get_column_letter(self._column)}{self._row_number}'
+            locations.append(f'{self.sheet_name}!{reference}')
+
+
+def scan_workbook(filename):
+    """
+    Report Excel errors and count formulas in a saved workbook
+
+    Each worksheet's XML is streamed once from the zip, reading cached values
+    and formula flags together, so large workbooks are checked in bounded
+    memory without loading them into openpyxl.
+
+    Args:
+        filename: Path to Excel file
+
+    Returns:
+        dict with error locations and counts
+    """
+    error_counts = dict.fromkeys(EXCEL_ERRORS, 0)
+    error_locations = {err: [] for err in EXCEL_ERRORS}
+    formula_count = 0
+
+    with zipfile.ZipFile(filename) as archive:
+        sheets, shared_strings_part = _workbook_parts(archive)
+        shared_errors = _shared_string_errors(archive, shared_strings_part)
+
+        for sheet_name, part in sheets:
+            scanner = _SheetScanner(sheet_name, shared_errors, error_counts, error_locations)
+            with archive.open(part) as stream:
+                formula_count += scanner.scan(stream)
+
+    total_errors = sum(error_counts.values())
+
+    # Build result summary
+    result = {
+        'status': 'success' if total_errors == 0 else 'errors_found',
+        'total_errors': total_errors,
+        'error_summary': {}
+    }
+
+    # Add non-empty error categories
+    for err_type, count in error_counts.items():
+        if count:
+            result['error_summary'][err_type] = {
+                'count': count,
+                'locations': error_locations[err_type]
+            }
+
+    # Add formula count for context
+    result['total_formulas'] = formula_count
+
+    return result
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python recalc.py <excel_file> [timeout_seconds]")
-        print("\nRecalculates all formulas in an Excel file using LibreOffice")
-        print("\nReturns JSON with error details:")
-        print("  - status: 'success' or 'errors_found'")
-        print("  - total_errors: Total number of Excel errors found")
-        print("  - total_formulas: Number of formulas in the file")
-        print("  - error_summary: Breakdown by error type with locations")
-        print("    - #VALUE!, #DIV/0!, #REF!, #NAME?, #NULL!, #NUM!, #N/A")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
-    timeout = int(sys.argv[2]) if len(sys.argv) > 2 else 30
-    
-    result = recalc(filename, timeout)
+    parser = argparse.ArgumentParser(
+        description='Recalculate all formulas in an Excel file and report Excel errors as JSON',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Returns JSON with error details:
+  - status: 'success' or 'errors_found'
+  - total_errors: Total number of Excel errors found
+  - total_formulas: Number of formulas in the file
+  - error_summary: Breakdown by error type with locations
+    - #VALUE!, #DIV/0!, #REF!, #NAME?, #NULL!, #NUM!, #N/A
+  - engine: 'native' or 'libreoffice'
+  - fallback_reason: Why the native engine was not used, if it fell back
+
+With --batch, the manifest is a JSON list of paths (or {"file": ..., "timeout": ...}
+objects), or {"timeout": ..., "files": [...]}. The output has per-file results
+under "results" and counts of success, errors_found and failed files.""",
+    )
+    parser.add_argument('excel_file', nargs='?', help='Excel file to recalculate')
+    parser.add_argument('timeout', nargs='?', type=int, default=30,
+                        help='Maximum seconds for LibreOffice recalculation (default: 30)')
+    parser.add_argument('--engine', choices=ENGINES, default='auto',
+                        help='native: evaluate in process; libreoffice: run soffice; '
+                             'auto: native, falling back to LibreOffice for '
+                             'unsupported formulas (default: auto)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Time both engines on copies of the file and compare their results '
+                             'instead of recalculating it')
+    parser.add_argument('--batch', metavar='MANIFEST',
+                        help='Recalculate the files listed in a JSON manifest, using one '
+                             'LibreOffice session for those that need it')
+    args = parser.parse_args()
+    
+    if args.batch:
+        if args.excel_file:
+            parser.error('--batch takes the files to recalculate from the manifest')
+        if args.benchmark:
+            parser.error('--batch cannot be combined with --benchmark')
+        result = recalc_batch(args.batch, args.engine, args.timeout)
+    elif args.excel_file is None:
+        parser.error('the following arguments are required: excel_file')
+    elif args.benchmark:
+        result = benchmark(args.excel_file, args.timeout)
+    else:
+        result = recalc(args.excel_file, args.timeout, args.engine)
     print(json.dumps(result, indent=2))
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -5,11 +5,16 @@ Validation modules for Word document processing.
 from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
+from .profile import ValidationProfiler, profile_frame
 from .redlining import RedliningValidator
+from .structure import PackageStructureValidator
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "PackageStructureValidator",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "ValidationProfiler",
+    "profile_frame",
 ]
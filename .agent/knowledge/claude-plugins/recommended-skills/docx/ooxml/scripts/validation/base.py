@@ -2,11 +2,21 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from . import schemas
+from .cache import ValidationCache, content_hash
+from .original import OriginalPackage
+from .profile import profile_frame, profiled
+from .rules import UniqueIdRule, run_element_rules
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -41,6 +51,9 @@ class BaseSchemaValidator:
     # Subclasses should override this with format-specific mappings
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    # Bump when validation logic changes so cached per-part results are not reused
+    VALIDATOR_VERSION = 1
+
     # Unified schema mappings for all Office document types
     SCHEMA_MAPPINGS = {
         # Document type specific schemas
@@ -66,6 +79,9 @@ class BaseSchemaValidator:
         "drawing": "ISO-IEC29500-4_2016/dml-main.xsd",
     }
 
+    # Directory holding the XSD files referenced by SCHEMA_MAPPINGS
+    SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
+
     # Unified namespace constants
     MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
     XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
@@ -81,6 +97,18 @@ class BaseSchemaValidator:
         "http://schemas.openxmlformats.org/package/2006/content-types"
     )
 
+    # Common media file extensions that should be declared, with their content types
+    MEDIA_CONTENT_TYPES = {
+        "png": "image/png",
+        "jpg": "image/jpeg",
+        "jpeg": "image/jpeg",
+        "gif": "image/gif",
+        "bmp": "image/bmp",
+        "tiff": "image/tiff",
+        "wmf": "image/x-wmf",
+        "emf": "image/x-emf",
+    }
+
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
@@ -103,13 +131,30 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    # Template placeholders ({{ ... }}) stripped from text before XSD validation
+    TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
+
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        cache_dir=None,
+        profiler=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        # Worker processes for per-part XSD validation (1 = serial, 0 = one per CPU)
+        self.jobs = jobs or os.cpu_count() or 1
+        # On-disk per-part result cache (cache_dir or $OOXML_VALIDATION_CACHE, else off)
+        self.cache = ValidationCache.from_option(cache_dir)
+        # Optional ValidationProfiler recording per-check and per-part timings
+        self.profiler = profiler
 
         # Set schemas directory
-        self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        self.schemas_dir = self.SCHEMAS_DIR
 
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
@@ -120,18 +165,92 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed trees shared by all checks: path -> (size, mtime_ns, tree or error)
+        self._parsed_trees = {}
+        # Element rule name -> errors from the last single walk, not yet reported
+        self._pending_rule_errors = {}
+
+    @classmethod
+    def prewarm_schemas(cls, schema_paths=None):
+        """Compile schema_paths (default: every mapped schema) in this process.
+
+        Called by each XSD pool worker as it starts, so a worker never pauses
+        mid-run to compile a schema.
+        """
+        if schema_paths is None:
+            schema_paths = sorted(
+                {cls.SCHEMAS_DIR / path for path in cls.SCHEMA_MAPPINGS.values()}
+            )
+        schemas.prewarm(schema_paths)
+
+    @property
+    def original_package(self):
+        """In-memory view of the original file, shared with other validators."""
+        return OriginalPackage.get(self.original_file)
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _element_rules(self):
+        """Element-level rules checked together in one walk over each part.
+
+        Subclasses extend the returned mapping of check name -> ElementRule.
+        """
+        return {
+            "unique_ids": UniqueIdRule(self.UNIQUE_ID_REQUIREMENTS, self.MC_NAMESPACE)
+        }
+
+    def _element_rule_errors(self, name):
+        """Return the errors found by one element rule.
+
+        The first rule-backed check walks every part once for all rules; the
+        other checks then pick up their results without walking again.
+        """
+        if name not in self._pending_rule_errors:
+            rules = self._element_rules()
+            with profile_frame(self.profiler, "element_rules"):
+                run_element_rules(
+                    rules.values(), self.xml_files, self._parse, self.unpacked_dir
+                )
+            self._pending_rule_errors = {
+                rule_name: rule.errors for rule_name, rule in rules.items()
+            }
+        return self._pending_rule_errors.pop(name)
+
+    def _parse(self, xml_file):
+        """Parse xml_file once and share the tree between all checks.
+
+        The returned tree must be treated as read-only; checks that modify it
+        work on a copy. Parse errors are cached and re-raised as well. Files
+        changed on disk since they were parsed are parsed again.
+        """
+        xml_file = Path(xml_file)
+        stat = xml_file.stat()
+        cached = self._parsed_trees.get(str(xml_file))
+        if cached is None or cached[:2] != (stat.st_size, stat.st_mtime_ns):
+            if self.profiler is not None:
+                self.profiler.count("parses")
+            try:
+                result = lxml.etree.parse(str(xml_file))
+            except Exception as e:
+                result = e
+            cached = (stat.st_size, stat.st_mtime_ns, result)
+            self._parsed_trees[str(xml_file)] = cached
+
+        if isinstance(cached[2], Exception):
+            raise cached[2]
+        return cached[2]
+
+    @profiled
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
             try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                # Try to parse the XML file (cached for the remaining checks)
+                self._parse(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -153,13 +272,14 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    @profiled
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -183,86 +303,10 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    @profiled
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
-        errors = []
-        global_ids = {}  # Track globally unique IDs across all files
-
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = self._element_rule_errors("unique_ids")
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,6 +318,7 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    @profiled
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -310,7 +355,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -385,13 +430,12 @@ class BaseSchemaValidator:
                 )
             return True
 
+    @profiled
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -411,7 +455,7 @@ class BaseSchemaValidator:
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +478,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -519,6 +563,7 @@ class BaseSchemaValidator:
 
         return None
 
+    @profiled
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
         errors = []
@@ -531,7 +576,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -563,18 +608,6 @@ class BaseSchemaValidator:
                 "theme",  # Common
             }
 
-            # Common media file extensions that should be declared
-            media_extensions = {
-                "png": "image/png",
-                "jpg": "image/jpeg",
-                "jpeg": "image/jpeg",
-                "gif": "image/gif",
-                "bmp": "image/bmp",
-                "tiff": "image/tiff",
-                "wmf": "image/x-wmf",
-                "emf": "image/x-emf",
-            }
-
             # Get all files in the unpacked directory
             all_files = list(self.unpacked_dir.rglob("*"))
             all_files = [f for f in all_files if f.is_file()]
@@ -593,7 +626,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._parse(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -617,10 +650,10 @@ class BaseSchemaValidator:
                 extension = file_path.suffix.lstrip(".").lower()
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
-                    if extension in media_extensions:
+                    if extension in self.MEDIA_CONTENT_TYPES:
                         relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{self.MEDIA_CONTENT_TYPES[extension]}"/>'
                         )
 
         except Exception as e:
@@ -673,7 +706,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -685,6 +718,7 @@ class BaseSchemaValidator:
                 )
             return True, set()
 
+    @profiled
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
         new_errors = []
@@ -692,11 +726,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.xml_files, self._validate_parts_against_xsd()
+        ):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,7 +745,7 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -738,6 +771,109 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_parts_against_xsd(self):
+        """Return validate_file_against_xsd results for self.xml_files, in order.
+
+        Parts whose result is in the on-disk cache are not validated again;
+        the rest are validated (in parallel if jobs > 1) and stored.
+        """
+        results = [None] * len(self.xml_files)
+        cache_keys = {}
+
+        if self.cache is not None:
+            for index, xml_file in enumerate(self.xml_files):
+                cache_keys[index] = self._xsd_cache_key(xml_file)
+                cached = self.cache.get(cache_keys[index])
+                if cached is not None:
+                    results[index] = (cached["valid"], set(cached["errors"]))
+                    if self.profiler is not None:
+                        self.profiler.count("xsd_cache_hits")
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        for index, result in zip(
+            pending, self._run_xsd_validation([self.xml_files[i] for i in pending])
+        ):
+            results[index] = result
+            if self.cache is not None:
+                is_valid, new_errors = result
+                self.cache.put(
+                    cache_keys[index], {"valid": is_valid, "errors": sorted(new_errors)}
+                )
+
+        return results
+
+    def _run_xsd_validation(self, xml_files):
+        """Run validate_file_against_xsd over xml_files, returning results in order.
+
+        With jobs > 1 the parts are spread over a process pool; each worker
+        builds its own validator and compiles the schemas the parts need
+        before taking any work.
+        Results come back in the original file order, so the report is the
+        same as in serial mode.
+        """
+        if self.jobs <= 1 or len(xml_files) <= 1:
+            results = []
+            for xml_file in xml_files:
+                # Parts validated in worker processes are not profiled individually
+                with profile_frame(
+                    self.profiler, xml_file.relative_to(self.unpacked_dir).as_posix()
+                ):
+                    results.append(
+                        self.validate_file_against_xsd(xml_file, verbose=False)
+                    )
+            return results
+
+        workers = min(self.jobs, len(xml_files))
+        cache_dir = self.cache.cache_dir if self.cache is not None else None
+        # Only the schemas these parts use, not every mapped one
+        schema_paths = sorted(
+            {
+                schema_path
+                for schema_path in map(self._get_schema_path, xml_files)
+                if schema_path is not None
+            }
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_xsd_worker,
+            initargs=(
+                type(self),
+                self.unpacked_dir,
+                self.original_file,
+                cache_dir,
+                schema_paths,
+            ),
+        ) as executor:
+            return list(
+                executor.map(
+                    _validate_part_against_xsd,
+                    xml_files,
+                    chunksize=max(1, len(xml_files) // (workers * 4)),
+                )
+            )
+
+    def _cache_key(self, kind, part_name, *components):
+        """Build a cache key for a part from everything its result depends on."""
+        return ValidationCache.make_key(
+            kind,
+            type(self).__name__,
+            self.VALIDATOR_VERSION,
+            schemas.schema_set_version(self.schemas_dir),
+            part_name,
+            *components,
+        )
+
+    def _xsd_cache_key(self, xml_file):
+        """Cache key for the XSD result of a part: its bytes and the original's."""
+        part_name = xml_file.relative_to(self.unpacked_dir).as_posix()
+        original = self.original_package.read(part_name)
+        return self._cache_key(
+            "xsd",
+            part_name,
+            content_hash(xml_file.read_bytes()),
+            content_hash(original) if original is not None else "-",
+        )
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -762,96 +898,83 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+    def _preprocess_for_xsd(self, root, clean_namespaces):
+        """Prepare a tree for XSD validation in a single pass, modifying it in place.
 
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
-
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
-
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
-
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
-
-        return lxml.etree.ElementTree(xml_copy)
+        Removes template tags from text nodes, the mc:Ignorable attribute on the
+        root and, if clean_namespaces is set, all attributes and elements that are
+        not in allowed namespaces. Callers must pass a tree they own.
+        """
+        # Remove mc:Ignorable attribute from root
+        mc_ignorable = f"{{{self.MC_NAMESPACE}}}Ignorable"
+        if mc_ignorable in root.attrib:
+            del root.attrib[mc_ignorable]
 
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
         elements_to_remove = []
+        for elem in root.iter(lxml.etree.Element):
+            tag = elem.tag
+
+            # Template tags are kept in w:t/a:t text, which is what they replace
+            if not (tag.endswith("}t") or tag == "t"):
+                if elem.text and "{{" in elem.text:
+                    elem.text = self.TEMPLATE_TAG_PATTERN.sub("", elem.text)
+                if elem.tail and "{{" in elem.tail:
+                    elem.tail = self.TEMPLATE_TAG_PATTERN.sub("", elem.tail)
 
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
+            if not clean_namespaces:
                 continue
 
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
-                    continue
+            # Remove attributes not in allowed namespaces
+            attrs_to_remove = [
+                attr
+                for attr in elem.attrib
+                if attr.startswith("{")
+                and attr[1:].partition("}")[0] not in self.OOXML_NAMESPACES
+            ]
+            for attr in attrs_to_remove:
+                del elem.attrib[attr]
 
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
+            # Collect elements not in allowed namespaces (never the root itself)
+            if (
+                tag.startswith("{")
+                and tag[1:].partition("}")[0] not in self.OOXML_NAMESPACES
+                and elem is not root
+            ):
+                elements_to_remove.append(elem)
 
-        # Remove collected elements
+        # Detach after the walk; descendants of removed elements go with them
         for elem in elements_to_remove:
-            root.remove(elem)
-
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
-
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
+            elem.getparent().remove(elem)
 
-        return xml_doc
+    def _validate_single_file_xsd(self, xml_file, base_path, content=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+        If content is given, it is parsed instead of reading xml_file from disk;
+        xml_file is then only used to pick the schema.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
-
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            # Load schema (compiled once per process and shared across validators)
+            schema = schemas.get_schema(schema_path)
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+            if content is not None:
+                # Parsed here from the original's bytes, so it can be changed in place
+                root = lxml.etree.parse(io.BytesIO(content)).getroot()
+            else:
+                # Parsed trees are shared and read-only: preprocess a single copy
+                root = copy.deepcopy(self._parse(xml_file).getroot())
 
             # Clean ignorable namespaces if needed
             relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+            self._preprocess_for_xsd(
+                root,
+                clean_namespaces=bool(relative_path.parts)
+                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS,
+            )
+            xml_doc = lxml.etree.ElementTree(root)
 
             # Validate
             if schema.validate(xml_doc):
@@ -869,82 +992,69 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The part is read from the original archive in memory and the result is
+        memoized, so each original part is validated at most once per process.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        part_name = xml_file.relative_to(unpacked_dir).as_posix()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        original = self.original_package
+        key = (part_name, self._get_schema_path(xml_file))
+        if key not in original.baseline_errors:
+            content = original.read(part_name)
+            if content is None:
+                # File didn't exist in original, so no original errors
+                errors = set()
+            else:
+                errors = self._get_cached_baseline_errors(
+                    xml_file, unpacked_dir, part_name, content
+                )
+            original.baseline_errors[key] = errors
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        return original.baseline_errors[key]
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+    def _get_cached_baseline_errors(self, xml_file, unpacked_dir, part_name, content):
+        """Validate an original part, reusing the on-disk cache when enabled."""
+        if self.cache is not None:
+            cache_key = self._cache_key("baseline", part_name, content_hash(content))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return set(cached)
 
-            # Validate the specific file in original
+        # Validate the specific file in original
+        with profile_frame(self.profiler, "original"):
             is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+                xml_file, unpacked_dir, content=content
             )
-            return errors if errors else set()
+        errors = errors if errors else set()
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
+        if self.cache is not None:
+            self.cache.put(cache_key, sorted(errors))
+        return errors
 
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
 
-        Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
-        """
-        warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
+# Validator used by each process pool worker (see _validate_parts_against_xsd)
+_worker_validator = None
 
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
-                continue
 
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
+def _init_xsd_worker(
+    validator_cls, unpacked_dir, original_file, cache_dir, schema_paths
+):
+    global _worker_validator
+    _worker_validator = validator_cls(unpacked_dir, original_file, cache_dir=cache_dir)
+    validator_cls.prewarm_schemas(schema_paths)
+
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+def _validate_part_against_xsd(xml_file):
+    return _worker_validator.validate_file_against_xsd(xml_file, verbose=False)
 
 
 if __name__ == "__main__":
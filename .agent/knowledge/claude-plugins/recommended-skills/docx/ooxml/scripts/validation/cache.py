@@ -0,0 +1,83 @@
+"""
+On-disk cache of per-part validation results for edit-validate loops.
+
+Entries are addressed by a hash of everything the result depends on (part
+bytes, original part bytes, schema set and validator version), so a repeat
+run only revalidates parts whose bytes changed. Each entry is a small JSON
+file written atomically, which makes the cache safe to share between
+concurrent processes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Environment variable that enables the cache when no directory is passed explicitly
+CACHE_DIR_ENV = "OOXML_VALIDATION_CACHE"
+
+
+def content_hash(content):
+    """Return the hex digest used to identify part contents."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class ValidationCache:
+    """Content-addressed store of JSON-serializable validation results."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_option(cls, cache_dir=None):
+        """Return a cache for cache_dir or $OOXML_VALIDATION_CACHE, or None if neither is set."""
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        return cls(cache_dir) if cache_dir else None
+
+    @staticmethod
+    def make_key(*components):
+        """Combine key components (strings) into a single hex key."""
+        digest = hashlib.sha256()
+        for component in components:
+            digest.update(str(component).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """Return the stored value for key, or None on a miss."""
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            # Missing, or being replaced by another process: treat as a miss
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store value for key; concurrent writers of the same key are harmless."""
+        entry_path = self._entry_path(key)
+        temp_name = None
+        try:
+            entry_path.parent.mkdir(exist_ok=True)
+            # Write to a private temp file, then atomically move it into place
+            fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(temp_name, entry_path)
+        except OSError:
+            # A cache that cannot be written only costs speed
+            if temp_name is not None and os.path.exists(temp_name):
+                os.unlink(temp_name)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,105 @@
+"""
+Process-wide registry of compiled XSD schemas.
+
+Compiling an XMLSchema (especially the WordprocessingML set with all its
+imports) is far more expensive than validating a part against it, so each
+schema is compiled once per process and shared by every validator and run.
+"""
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+import lxml.etree
+
+# Resolved schema path -> compiled lxml.etree.XMLSchema
+_compiled_schemas = {}
+# Resolved schema path -> exception raised while compiling it (not retried)
+_failed_schemas = {}
+_lock = threading.Lock()
+
+# Compilation counters, useful to confirm the cache is being hit
+stats = {"compiled": 0, "hits": 0, "compile_seconds": 0.0}
+
+# Schemas directory -> hash of every .xsd file in it
+_schema_set_versions = {}
+
+
+def get_schema(schema_path):
+    """Return the compiled schema for schema_path, compiling it on first use.
+
+    Schemas that fail to compile raise the same exception on every call
+    without being recompiled.
+    """
+    key = str(Path(schema_path).resolve())
+
+    schema = _compiled_schemas.get(key)
+    if schema is not None:
+        stats["hits"] += 1
+        return schema
+
+    with _lock:
+        if key in _failed_schemas:
+            raise _failed_schemas[key]
+
+        # Another thread may have compiled it while we waited
+        schema = _compiled_schemas.get(key)
+        if schema is not None:
+            stats["hits"] += 1
+            return schema
+
+        start = time.perf_counter()
+        try:
+            with open(key, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+                schema = lxml.etree.XMLSchema(xsd_doc)
+        except Exception as e:
+            _failed_schemas[key] = e
+            raise
+        finally:
+            stats["compile_seconds"] += time.perf_counter() - start
+            stats["compiled"] += 1
+        _compiled_schemas[key] = schema
+
+    return schema
+
+
+def schema_set_version(schemas_dir):
+    """Return a hash identifying the exact contents of the schemas directory.
+
+    Used to key cached validation results, so editing any XSD (including one
+    that is only imported) invalidates them.
+    """
+    key = str(Path(schemas_dir).resolve())
+    version = _schema_set_versions.get(key)
+    if version is None:
+        digest = hashlib.sha256()
+        for xsd_file in sorted(Path(key).rglob("*.xsd")):
+            digest.update(xsd_file.relative_to(key).as_posix().encode("utf-8"))
+            digest.update(xsd_file.read_bytes())
+        version = _schema_set_versions[key] = digest.hexdigest()
+    return version
+
+
+def prewarm(schema_paths):
+    """Compile schema_paths ahead of time (see BaseSchemaValidator.prewarm_schemas)."""
+    for schema_path in schema_paths:
+        try:
+            get_schema(schema_path)
+        except Exception:
+            # Reported per file when the schema is actually used
+            continue
+
+
+def clear():
+    """Drop all compiled schemas (mainly for benchmarking cold runs)."""
+    with _lock:
+        _compiled_schemas.clear()
+        _failed_schemas.clear()
+        stats.update(compiled=0, hits=0, compile_seconds=0.0)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -36,6 +36,7 @@ from pathlib import Path
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.profile import profile_frame
 from ooxml.scripts.validation.redlining import RedliningValidator
 
 from .utilities import XMLEditor
@@ -835,26 +836,36 @@ class Document:
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
-    def validate(self) -> None:
+    def validate(self, profiler=None) -> None:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Args:
+            profiler: Optional ValidationProfiler that records the time spent in
+                each check and part (see ValidationProfiler.report()).
+
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
+        # Create validators with current state; unchanged parts reuse cached results
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_docx,
+            verbose=False,
+            cache_dir=Path(self.temp_dir) / "validation_cache",
+            profiler=profiler,
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path, self.original_docx, verbose=False, profiler=profiler
         )
 
         # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+        with profile_frame(profiler, "DOCXSchemaValidator"):
+            if not schema_validator.validate():
+                raise ValueError("Schema validation failed")
+        with profile_frame(profiler, "RedliningValidator"):
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
 
     def save(self, destination=None, validate=True) -> None:
         """
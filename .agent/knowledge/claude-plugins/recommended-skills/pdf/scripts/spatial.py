@@ -0,0 +1,92 @@
+"""
+Sort-and-sweep search for overlapping rectangles.
+
+Shared by the pptx inventory (overlapping shapes on a slide) and the pdf
+bounding box checker (overlapping form field boxes on a page). Instead of
+comparing every pair of rectangles, rectangles are swept along one axis and
+only those whose extents overlap on that axis are compared. The axis is the
+one along which the boxes are more spread out, so both a row and a column of
+form fields are checked in close to linear time. Boxes that overlap heavily
+on both axes (e.g. thousands of nested boxes) still compare most pairs.
+
+Usage:
+    from spatial import find_overlapping_pairs
+    pairs = find_overlapping_pairs(boxes, predicate)
+"""
+
+import heapq
+from typing import Callable, Optional, Sequence
+
+
+def find_overlapping_pairs(
+    boxes: Sequence[Sequence[float]],
+    predicate: Optional[Callable[[int, int], bool]] = None,
+) -> list[tuple[int, int]]:
+    """Find all pairs of boxes whose extents overlap.
+
+    Args:
+        boxes: Rectangles as (x0, y0, x1, y1); the corners may be given in either order
+        predicate: Optional exact test predicate(i, j) applied to each candidate
+            pair, e.g. to require a minimum overlap or strict intersection
+
+    Returns:
+        Sorted list of index pairs (i, j) with i < j. Without a predicate these
+        are the pairs whose closed extents overlap on both axes; with one, the
+        candidates for which predicate(i, j) is true. Since candidates include
+        boxes that merely touch, any predicate that requires the boxes to
+        touch or overlap gets the same result as testing every pair.
+    """
+    # Normalized extents, so inverted corners still produce candidates
+    extents = [
+        (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        for x0, y0, x1, y1 in boxes
+    ]
+    if _sweep_density(extents, 1) < _sweep_density(extents, 0):
+        # Sweep down the page instead: same overlaps with the axes swapped
+        extents = [(y0, x0, y1, x1) for x0, y0, x1, y1 in extents]
+    order = sorted(range(len(extents)), key=lambda index: extents[index][0])
+
+    pairs = []
+    active = set()  # Boxes whose extent on the sweep axis reaches the sweep position
+    expiry = []  # Heap of (end on the sweep axis, index) for the active boxes
+
+    for index in order:
+        start, low, end, high = extents[index]
+
+        # Drop boxes that end before this one starts
+        while expiry and expiry[0][0] < start:
+            active.discard(heapq.heappop(expiry)[1])
+
+        for other in active:
+            if extents[other][1] <= high and low <= extents[other][3]:
+                pair = (other, index) if other < index else (index, other)
+                if predicate is None or predicate(*pair):
+                    pairs.append(pair)
+
+        active.add(index)
+        heapq.heappush(expiry, (end, index))
+
+    pairs.sort()
+    return pairs
+
+
+def _sweep_density(extents, axis):
+    """Roughly how many boxes are active at once when sweeping along an axis.
+
+    This is the total length of the boxes along the axis over the length the
+    boxes span, so it is small when they are spread out along the axis and
+    close to the box count when they are stacked across it.
+    """
+    if not extents:
+        return 0.0
+    starts = [extent[axis] for extent in extents]
+    ends = [extent[axis + 2] for extent in extents]
+    span = max(ends) - min(starts)
+    total = sum(end - start for start, end in zip(starts, ends))
+    if span <= 0:
+        return float(len(extents))
+    return total / span
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
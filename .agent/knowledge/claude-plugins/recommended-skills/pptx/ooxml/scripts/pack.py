@@ -3,7 +3,7 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--quick]
 """
 
 import argparse
@@ -15,17 +15,30 @@ import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+try:
+    from .validation.structure import PackageStructureValidator
+except ImportError:  # Run as a script from ooxml/scripts
+    from validation.structure import PackageStructureValidator
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Only run the in-process structural checks (skip the soffice round-trip)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            render_check=not args.quick,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +55,16 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, render_check=True):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
-        validate: If True, validates with soffice (default: False)
+        validate: If True, runs the in-process structural checks and, if those
+            pass, the soffice round-trip (default: False)
+        render_check: If False, skips the slow soffice round-trip and relies on
+            the structural checks only (default: True)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -78,15 +94,22 @@ def pack_document(input_dir, output_file, validate=False):
                 if f.is_file():
                     zf.write(f, f.relative_to(temp_content_dir))
 
-        # Validate if requested
+        # Validate if requested: fast structural checks first, soffice only if they pass
         if validate:
-            if not validate_document(output_file):
+            if not validate_structure(output_file) or (
+                render_check and not validate_document(output_file)
+            ):
                 output_file.unlink()  # Delete the corrupt file
                 return False
 
     return True
 
 
+def validate_structure(doc_path):
+    """Validate package structure in-process without launching soffice."""
+    return PackageStructureValidator(doc_path).validate()
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
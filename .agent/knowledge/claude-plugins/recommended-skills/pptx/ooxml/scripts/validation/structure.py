@@ -0,0 +1,227 @@
+"""
+Fast in-process structural validator for packed Office files.
+"""
+
+import posixpath
+import zipfile
+from pathlib import Path
+from urllib.parse import unquote
+
+import lxml.etree
+
+from .base import BaseSchemaValidator
+
+
+class PackageStructureValidator:
+    """Structural validator that checks a packed Office file without launching soffice.
+
+    Reads the zip archive directly and fails fast on the first failing check:
+    zip integrity, required parts, XML well-formedness, [Content_Types].xml
+    coverage and relationship targets.
+    """
+
+    CONTENT_TYPES_PART = "[Content_Types].xml"
+    ROOT_RELS_PART = "_rels/.rels"
+    OFFICE_DOCUMENT_RELATIONSHIP = "/officeDocument"
+
+    def __init__(self, packed_file, verbose=False):
+        self.packed_file = Path(packed_file)
+        self.verbose = verbose
+
+        # Populated by validate_zip_integrity
+        self.part_names = []
+        # Populated by validate_xml: part name -> parsed root element
+        self.xml_roots = {}
+
+    def validate(self):
+        """Run all structural checks, stopping at the first failure."""
+        try:
+            with zipfile.ZipFile(self.packed_file, "r") as zf:
+                return (
+                    self.validate_zip_integrity(zf)
+                    and self.validate_required_parts()
+                    and self.validate_xml(zf)
+                    and self.validate_content_types()
+                    and self.validate_relationship_targets()
+                )
+        except zipfile.BadZipFile as e:
+            print(f"FAILED - {self.packed_file.name} is not a valid zip archive: {e}")
+            return False
+
+    def validate_zip_integrity(self, zf):
+        """Validate member CRCs and that no part name appears twice."""
+        errors = []
+
+        bad_member = zf.testzip()
+        if bad_member is not None:
+            errors.append(f"  {bad_member}: CRC check failed")
+
+        seen = set()
+        self.part_names = []
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            if info.filename.lower() in seen:
+                errors.append(f"  {info.filename}: Duplicate part name in archive")
+                continue
+            seen.add(info.filename.lower())
+            self.part_names.append(info.filename)
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} zip integrity errors:")
+            for error in errors:
+                print(error)
+            return False
+        if self.verbose:
+            print("PASSED - Zip archive is intact")
+        return True
+
+    def validate_required_parts(self):
+        """Validate that the package-level parts every Office file needs exist."""
+        errors = [
+            f"  {part}: Required part is missing"
+            for part in (self.CONTENT_TYPES_PART, self.ROOT_RELS_PART)
+            if part not in self.part_names
+        ]
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} missing required parts:")
+            for error in errors:
+                print(error)
+            return False
+        if self.verbose:
+            print("PASSED - All required parts are present")
+        return True
+
+    def validate_xml(self, zf):
+        """Validate that all XML and .rels parts are well-formed."""
+        errors = []
+        self.xml_roots = {}
+
+        for name in self.part_names:
+            if not name.endswith((".xml", ".rels")):
+                continue
+            try:
+                self.xml_roots[name] = lxml.etree.fromstring(zf.read(name))
+            except lxml.etree.XMLSyntaxError as e:
+                errors.append(f"  {name}: Line {e.lineno}: {e.msg}")
+            except Exception as e:
+                errors.append(f"  {name}: Unexpected error: {str(e)}")
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} XML violations:")
+            for error in errors:
+                print(error)
+            return False
+        if self.verbose:
+            print("PASSED - All XML files are well-formed")
+        return True
+
+    def validate_content_types(self):
+        """Validate that every part has a content type and every Override has a part."""
+        errors = []
+        ns = BaseSchemaValidator.CONTENT_TYPES_NAMESPACE
+        root = self.xml_roots[self.CONTENT_TYPES_PART]
+
+        # Part names are case-insensitive: lowercased name -> declared PartName
+        declared_parts = {}
+        for override in root.findall(f"{{{ns}}}Override"):
+            part_name = override.get("PartName")
+            if part_name is not None:
+                declared_parts[part_name.lstrip("/").lower()] = part_name
+
+        declared_extensions = set()
+        for default in root.findall(f"{{{ns}}}Default"):
+            extension = default.get("Extension")
+            if extension is not None:
+                declared_extensions.add(extension.lower())
+
+        existing_parts = {name.lower() for name in self.part_names}
+        for key in sorted(declared_parts.keys() - existing_parts):
+            errors.append(
+                f"  {declared_parts[key]}: Override in [Content_Types].xml for missing part"
+            )
+
+        for name in self.part_names:
+            if name == self.CONTENT_TYPES_PART or name.lower() in declared_parts:
+                continue
+            # Part extensions follow the last dot, so "_rels/.rels" has extension "rels"
+            basename = posixpath.basename(name)
+            extension = basename.rpartition(".")[2].lower() if "." in basename else ""
+            if extension in declared_extensions:
+                continue
+            error = f"  {name}: No content type declared in [Content_Types].xml"
+            if extension in BaseSchemaValidator.MEDIA_CONTENT_TYPES:
+                content_type = BaseSchemaValidator.MEDIA_CONTENT_TYPES[extension]
+                error += f' - should add: <Default Extension="{extension}" ContentType="{content_type}"/>'
+            errors.append(error)
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} content type declaration errors:")
+            for error in errors:
+                print(error)
+            return False
+        if self.verbose:
+            print("PASSED - All parts have a declared content type")
+        return True
+
+    def validate_relationship_targets(self):
+        """Validate that internal relationship targets exist and the main part is referenced."""
+        errors = []
+        ns = BaseSchemaValidator.PACKAGE_RELATIONSHIPS_NAMESPACE
+        # Part names are case-insensitive, as in validate_content_types
+        existing_parts = {name.lower() for name in self.part_names}
+
+        for rels_name, rels_root in self.xml_roots.items():
+            if not rels_name.endswith(".rels"):
+                continue
+
+            # word/_rels/document.xml.rels -> targets are relative to word/
+            base_dir = posixpath.dirname(posixpath.dirname(rels_name))
+
+            for rel in rels_root.findall(f"{{{ns}}}Relationship"):
+                target = rel.get("Target")
+                if (
+                    not target
+                    or rel.get("TargetMode") == "External"
+                    or target.startswith(("http", "mailto:"))
+                ):
+                    continue
+
+                if target.startswith("/"):
+                    target_part = posixpath.normpath(target.lstrip("/"))
+                else:
+                    target_part = posixpath.normpath(posixpath.join(base_dir, target))
+                # Fragment identifiers (e.g. "slide2.xml#anchor") still point at the part
+                target_part = target_part.split("#", 1)[0]
+
+                target_part = target_part.lower()
+                if (
+                    target_part not in existing_parts
+                    and unquote(target_part) not in existing_parts
+                ):
+                    errors.append(
+                        f"  {rels_name}: Line {rel.sourceline}: Broken reference to {target}"
+                    )
+
+        root_rels = self.xml_roots[self.ROOT_RELS_PART]
+        if not any(
+            rel.get("Type", "").endswith(self.OFFICE_DOCUMENT_RELATIONSHIP)
+            for rel in root_rels.findall(f"{{{ns}}}Relationship")
+        ):
+            errors.append(
+                f"  {self.ROOT_RELS_PART}: No officeDocument relationship to the main part"
+            )
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} relationship validation errors:")
+            for error in errors:
+                print(error)
+            return False
+        if self.verbose:
+            print("PASSED - All relationship targets exist")
+        return True
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -11,29 +11,52 @@ This module provides functionality to:
 - Export to JSON with clean, structured data
 
 Classes:
+    FontRegistry: Index of installed fonts with a cache of loaded fonts
+    FontMetrics: Cached word widths for text wrapping with one font
+    StyleResolver: Slide size and formatting inherited from layouts and masters
+    LayoutStyles: The same inherited formatting, read from the layout XML
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    extract_text_inventory_from_xml: The same, reading the slide XML directly
+    get_inventory_as_dict: Extract all text as JSON-serializable dicts, optionally in parallel
     save_inventory: Save extracted data to JSON
 
 Usage:
-    python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.json [--jobs N | --fast]
 """
 
 import argparse
 import json
+import os
 import platform
+import posixpath
 import sys
+import weakref
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from lxml import etree
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.enum.dml import MSO_FILL
+from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.enum.text import PP_ALIGN
+from pptx.oxml import element_class_lookup, oxml_parser
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.shapes.autoshape import Shape
 from pptx.shapes.base import BaseShape
+from pptx.shapes.placeholder import _InheritsDimensions
+from pptx.text.text import Font
+from spatial import find_overlapping_pairs
 
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
@@ -60,6 +83,12 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 0
+    Extracts slides in parallel, one worker process per CPU
+
+  python inventory.py presentation.pptx inventory.json --fast
+    Reads the slide XML directly instead of loading the presentation (for bulk audits)
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,8 +105,22 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Extract slides in N worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Read the slide XML directly instead of loading the presentation",
+    )
 
     args = parser.parse_args()
+    if args.fast and args.jobs != 1:
+        parser.error("--fast cannot be combined with --jobs")
 
     input_path = Path(args.input)
     if not input_path.exists():
@@ -94,11 +137,13 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        inventory = get_inventory_as_dict(
+            input_path, issues_only=args.issues_only, jobs=args.jobs, fast=args.fast
+        )
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        write_inventory_json(inventory, output_path)
 
         print(f"Output saved to: {args.output}")
 
@@ -125,6 +170,538 @@ The output JSON includes:
         sys.exit(1)
 
 
+class FontMetrics:
+    """Text measurement for one loaded font, measuring each distinct word once.
+
+    Line widths are accumulated from cached word and space widths. Kerning
+    across word boundaries is not part of that sum, so a line whose estimate
+    falls within kerning_margin_px of a limit is measured exactly instead
+    (set it to 0 to rely on the estimate alone).
+    """
+
+    kerning_margin_px: float = 1.0
+
+    def __init__(self, font: Any):
+        self.font = font
+        self._draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        self._word_widths: Dict[str, float] = {}
+        self.space_width = self.text_length(" ")
+
+    def text_length(self, text: str) -> float:
+        """Measure text exactly."""
+        return self._draw.textlength(text, font=self.font)
+
+    def word_length(self, word: str) -> float:
+        """Width of a single word, measured on first use."""
+        width = self._word_widths.get(word)
+        if width is None:
+            width = self._word_widths[word] = self.text_length(word)
+        return width
+
+    def fits(self, estimated_width: float, words: List[str], max_width: float) -> bool:
+        """Return True if the words joined by spaces fit within max_width."""
+        if estimated_width <= max_width - self.kerning_margin_px:
+            return True
+        if estimated_width > max_width + self.kerning_margin_px:
+            return False
+        return self.text_length(" ".join(words)) <= max_width
+
+
+class FontRegistry:
+    """Index of installed font files, built once per process.
+
+    Font directories are listed once (optionally cached on disk between runs)
+    and name lookups are memoized, so resolving a font is a dict hit instead
+    of a filesystem scan. Loaded FreeTypeFont objects are kept in an LRU keyed
+    by (path, size), together with their cached word widths.
+    """
+
+    # Environment variable naming a JSON file that caches the directory listings
+    CACHE_ENV = "PPTX_FONT_INDEX_CACHE"
+
+    # Number of loaded (path, size) fonts kept in memory
+    MAX_LOADED_FONTS = 64
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None):
+        """Build the index of the platform font directories.
+
+        Args:
+            cache_path: Optional JSON file to reuse directory listings from;
+                defaults to $PPTX_FONT_INDEX_CACHE if set.
+        """
+        if platform.system() == "Darwin":  # macOS
+            font_dirs = [
+                "/System/Library/Fonts/",
+                "/Library/Fonts/",
+                "~/Library/Fonts/",
+            ]
+            self.extensions = (".ttf", ".otf", ".ttc", ".dfont")
+        else:  # Linux
+            font_dirs = [
+                "/usr/share/fonts/truetype/",
+                "/usr/local/share/fonts/",
+                "~/.fonts/",
+            ]
+            self.extensions = (".ttf", ".otf")
+
+        cache_path = cache_path or os.environ.get(self.CACHE_ENV)
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        # Font directory -> file names in directory order; missing directories are left out
+        self.listings: Dict[str, List[str]] = self._load_listings(
+            [Path(font_dir).expanduser() for font_dir in font_dirs]
+        )
+        self._names: Dict[str, set] = {
+            font_dir: set(names) for font_dir, names in self.listings.items()
+        }
+        self._paths: Dict[str, Optional[str]] = {}
+        self._fonts: OrderedDict = OrderedDict()
+
+    def _load_listings(self, font_dirs: List[Path]) -> Dict[str, List[str]]:
+        """List each font directory, reusing cached listings of unchanged directories."""
+        cached = {}
+        if self.cache_path and self.cache_path.exists():
+            try:
+                cached = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                cached = {}
+
+        listings = {}
+        entries = {}
+        for font_dir in font_dirs:
+            try:
+                mtime_ns = font_dir.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            entry = cached.get(str(font_dir))
+            if not entry or entry.get("mtime_ns") != mtime_ns:
+                try:
+                    names = [
+                        file_path.name
+                        for file_path in font_dir.iterdir()
+                        if file_path.is_file()
+                    ]
+                except (OSError, PermissionError):
+                    names = []
+                entry = {"mtime_ns": mtime_ns, "files": names}
+            listings[str(font_dir)] = entry["files"]
+            entries[str(font_dir)] = entry
+
+        if self.cache_path and entries != cached:
+            try:
+                self.cache_path.write_text(json.dumps(entries), encoding="utf-8")
+            except OSError:
+                pass
+
+        return listings
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Return the font file path for a font name, or None if not installed."""
+        if font_name not in self._paths:
+            self._paths[font_name] = self._find_uncached(font_name)
+        return self._paths[font_name]
+
+    def _find_uncached(self, font_name: str) -> Optional[str]:
+        # Common font file variations to try
+        font_variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        font_name_lower = font_name.lower().replace(" ", "")
+
+        for font_dir, names in self.listings.items():
+            # First try exact matches
+            for variant in font_variations:
+                for ext in self.extensions:
+                    if f"{variant}{ext}" in self._names[font_dir]:
+                        return str(Path(font_dir) / f"{variant}{ext}")
+
+            # Then try fuzzy matching - find files containing the font name
+            for name in names:
+                file_name_lower = name.lower()
+                if font_name_lower in file_name_lower and file_name_lower.endswith(
+                    self.extensions
+                ):
+                    return str(Path(font_dir) / name)
+
+        return None
+
+    def load(self, font_name: str, size: int) -> Any:
+        """Return a loaded font for a font name and size, falling back to PIL's default."""
+        return self.metrics(font_name, size).font
+
+    def metrics(self, font_name: str, size: int) -> FontMetrics:
+        """Return the FontMetrics for a font name and size, loading the font if needed."""
+        font_path = self.find(font_name)
+        key = (font_path, size)
+        metrics = self._fonts.get(key)
+        if metrics is not None:
+            self._fonts.move_to_end(key)
+            return metrics
+
+        if font_path:
+            try:
+                font = ImageFont.truetype(font_path, size=size)
+            except Exception:
+                font = ImageFont.load_default()
+        else:
+            font = ImageFont.load_default()
+
+        metrics = self._fonts[key] = FontMetrics(font)
+        if len(self._fonts) > self.MAX_LOADED_FONTS:
+            self._fonts.popitem(last=False)
+        return metrics
+
+
+_font_registry: Optional[FontRegistry] = None
+
+
+def get_font_registry() -> FontRegistry:
+    """Return the process-wide FontRegistry, building it on first use."""
+    global _font_registry
+    if _font_registry is None:
+        _font_registry = FontRegistry()
+    return _font_registry
+
+
+class StyleResolver:
+    """Formatting that slides inherit from their presentation, layouts and masters.
+
+    Every shape needs the slide size, and placeholders inherit their position,
+    size and default font size from the slide layout and master. python-pptx
+    resolves these by searching the layout for each shape; the resolver does
+    that once per layout and master and answers shapes with dict lookups.
+    One resolver is kept per presentation (see for_part).
+    """
+
+    _resolvers: "weakref.WeakKeyDictionary[Any, StyleResolver]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, package: Any):
+        try:
+            prs = package.presentation_part.presentation
+            self.slide_width_emu: Optional[int] = prs.slide_width
+            self.slide_height_emu: Optional[int] = prs.slide_height
+        except (AttributeError, TypeError):
+            self.slide_width_emu = self.slide_height_emu = None
+
+        # Layout part -> {placeholder idx: (left, top, width, height)}
+        self._layout_geometry: Dict[Any, Dict[int, Tuple[Any, ...]]] = {}
+        # Layout part -> {placeholder type: default font size in points}
+        self._layout_font_sizes: Dict[Any, Dict[Any, Optional[float]]] = {}
+        # Master part -> {"titleStyle"/"bodyStyle": font size in points}
+        self._master_font_sizes: Dict[Any, Dict[str, int]] = {}
+
+    @classmethod
+    def for_part(cls, part: Any) -> "StyleResolver":
+        """Return the resolver of the presentation a slide, layout or master part belongs to."""
+        package = part.package
+        resolver = cls._resolvers.get(package)
+        if resolver is None:
+            resolver = cls._resolvers[package] = cls(package)
+        return resolver
+
+    def shape_geometry(self, shape: BaseShape) -> Tuple[Any, Any, Any, Any]:
+        """Return the effective (left, top, width, height) of a shape in EMUs.
+
+        Slide placeholders without their own position or size inherit it from
+        the layout placeholder with the same idx, as in python-pptx.
+        """
+        if not isinstance(shape, _InheritsDimensions) or not hasattr(
+            shape.part, "slide_layout"
+        ):
+            return shape.left, shape.top, shape.width, shape.height
+
+        element = shape._element
+        geometry = get_element_geometry(element)
+        if None not in geometry:
+            return geometry
+
+        inherited = self._get_layout_geometry(shape.part.slide_layout).get(
+            element.ph_idx, (None, None, None, None)
+        )
+        return tuple(  # type: ignore
+            value if value is not None else inherited_value
+            for value, inherited_value in zip(geometry, inherited)
+        )
+
+    def placeholder_font_size(self, shape: BaseShape) -> Optional[float]:
+        """Return the default font size a placeholder inherits from its slide layout, in points."""
+        return self.layout_font_size(
+            shape.part.slide_layout, shape.placeholder_format.type  # type: ignore
+        )
+
+    def text_style_font_size(self, shape: BaseShape, style_name: str) -> Optional[int]:
+        """Return the font size of a text style ("titleStyle" or "bodyStyle") of the shape's master."""
+        if not hasattr(shape.part, "slide_layout"):
+            return None
+        slide_master = shape.part.slide_layout.slide_master  # type: ignore
+        if not hasattr(slide_master, "element"):
+            return None
+        return self.master_font_size(slide_master, style_name)
+
+    def layout_font_size(self, slide_layout: Any, placeholder_type: Any) -> Optional[float]:
+        """Return the default font size the layout gives a placeholder type, in points."""
+        sizes = self._layout_font_sizes.get(slide_layout.part)
+        if sizes is None:
+            sizes = self._layout_font_sizes[slide_layout.part] = (
+                get_placeholder_font_sizes(
+                    placeholder.element for placeholder in slide_layout.placeholders
+                )
+            )
+        return sizes.get(placeholder_type)
+
+    def master_font_size(self, slide_master: Any, style_name: str) -> Optional[int]:
+        """Return the first font size of a master text style ("titleStyle" or "bodyStyle")."""
+        sizes = self._master_font_sizes.get(slide_master.part)
+        if sizes is None:
+            sizes = self._master_font_sizes[slide_master.part] = (
+                get_text_style_font_sizes(slide_master.element)
+            )
+        return sizes.get(style_name)
+
+    def _get_layout_geometry(self, slide_layout: Any) -> Dict[int, Tuple[Any, ...]]:
+        """Map each placeholder idx of a layout to its effective geometry."""
+        geometry = self._layout_geometry.get(slide_layout.part)
+        if geometry is None:
+            geometry = {}
+            for layout_placeholder in slide_layout.placeholders:
+                idx = layout_placeholder.placeholder_format.idx
+                if idx not in geometry:
+                    geometry[idx] = (
+                        layout_placeholder.left,
+                        layout_placeholder.top,
+                        layout_placeholder.width,
+                        layout_placeholder.height,
+                    )
+            self._layout_geometry[slide_layout.part] = geometry
+        return geometry
+
+
+def get_placeholder_font_sizes(placeholder_elements: Any) -> Dict[Any, Optional[float]]:
+    """Map placeholder types to their default font size in points.
+
+    The size of a type is the first defRPr size in the first placeholder
+    element of that type, or None if that placeholder sets no size.
+    """
+    sizes: Dict[Any, Optional[float]] = {}
+    for element in placeholder_elements:
+        if element.ph_type in sizes:
+            continue
+        sizes[element.ph_type] = None
+        for elem in element.iter(qn("a:defRPr")):
+            if sz := elem.get("sz"):
+                sizes[element.ph_type] = float(sz) / 100.0  # Convert to points
+                break
+    return sizes
+
+
+def get_text_style_font_sizes(master_element: Any) -> Dict[str, int]:
+    """Map the text styles of a slide master ("titleStyle", "bodyStyle") to their first font size."""
+    sizes: Dict[str, int] = {}
+    for style in master_element.iter(qn("p:titleStyle"), qn("p:bodyStyle")):
+        style_name = style.tag.split("}")[-1]
+        if style_name in sizes:
+            continue
+        for elem in style.iter():
+            if "sz" in elem.attrib:
+                sizes[style_name] = int(elem.attrib["sz"]) // 100
+                break
+    return sizes
+
+
+def get_element_geometry(element: Any) -> Tuple[Any, Any, Any, Any]:
+    """Return the (x, y, cx, cy) a shape element sets itself, None where unset.
+
+    Same as element.x, element.y, element.cx and element.cy, but finds the
+    <a:xfrm> once instead of once per value.
+    """
+    xfrm = element.xfrm
+    if xfrm is None:
+        return None, None, None, None
+    return xfrm.x, xfrm.y, xfrm.cx, xfrm.cy
+
+
+def get_placeholder_type(shape: BaseShape) -> Any:
+    """Return the PP_PLACEHOLDER type of a placeholder shape, or None for other shapes.
+
+    Same as shape.placeholder_format.type for placeholders, but finds the
+    <p:ph> element once instead of once per property.
+    """
+    ph = getattr(getattr(shape, "_element", None), "ph", None)
+    return ph.type if ph is not None else None
+
+
+def get_shape_geometry(shape: BaseShape) -> Tuple[Any, Any, Any, Any]:
+    """Return the effective (left, top, width, height) of a shape in EMUs."""
+    if not hasattr(shape, "part"):
+        return tuple(  # type: ignore
+            getattr(shape, name, 0) for name in ("left", "top", "width", "height")
+        )
+    return StyleResolver.for_part(shape.part).shape_geometry(shape)
+
+
+class LayoutStyles:
+    """Slide size and inherited formatting for the slides of one layout, read from XML.
+
+    Used instead of a StyleResolver by the XML inventory path, which has no
+    python-pptx Presentation. It provides the same lookups for ShapeData:
+    placeholder geometry inherited from the layout (and from there the master),
+    and the layout and master default font sizes.
+    """
+
+    # Master placeholder type that a layout placeholder type inherits its
+    # position and size from, as in python-pptx's LayoutPlaceholder
+    BASE_PLACEHOLDER_TYPES = {
+        PP_PLACEHOLDER.BODY: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.CHART: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.BITMAP: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.CENTER_TITLE: PP_PLACEHOLDER.TITLE,
+        PP_PLACEHOLDER.ORG_CHART: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.DATE: PP_PLACEHOLDER.DATE,
+        PP_PLACEHOLDER.FOOTER: PP_PLACEHOLDER.FOOTER,
+        PP_PLACEHOLDER.MEDIA_CLIP: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.OBJECT: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.PICTURE: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.SLIDE_NUMBER: PP_PLACEHOLDER.SLIDE_NUMBER,
+        PP_PLACEHOLDER.SUBTITLE: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.TABLE: PP_PLACEHOLDER.BODY,
+        PP_PLACEHOLDER.TITLE: PP_PLACEHOLDER.TITLE,
+    }
+
+    def __init__(
+        self,
+        slide_size: Tuple[Optional[int], Optional[int]],
+        layout: Any,
+        master: Any,
+    ):
+        """Initialize from the parsed layout and master parts (python-pptx oxml elements)."""
+        self.slide_width_emu, self.slide_height_emu = slide_size
+
+        layout_placeholders = list(layout.cSld.spTree.iter_ph_elms())
+        master_placeholders = list(master.cSld.spTree.iter_ph_elms())
+
+        # Placeholder idx -> effective (left, top, width, height) on the layout
+        self._geometry: Dict[int, Tuple[Any, ...]] = {}
+        for element in layout_placeholders:
+            if element.ph_idx in self._geometry:
+                continue
+            geometry = get_element_geometry(element)
+            if isinstance(element, CT_Shape) and None in geometry:
+                base_type = self.BASE_PLACEHOLDER_TYPES.get(element.ph_type)
+                base = next(
+                    (e for e in master_placeholders if e.ph_type == base_type), None
+                )
+                if base is not None:
+                    geometry = tuple(
+                        value if value is not None else base_value
+                        for value, base_value in zip(
+                            geometry, get_element_geometry(base)
+                        )
+                    )
+            self._geometry[element.ph_idx] = geometry
+
+        self._font_sizes = get_placeholder_font_sizes(layout_placeholders)
+        self._text_style_font_sizes = get_text_style_font_sizes(master)
+
+    def shape_geometry(self, shape: BaseShape) -> Tuple[Any, Any, Any, Any]:
+        """Return the effective (left, top, width, height) of a slide shape in EMUs."""
+        element = shape._element
+        geometry = get_element_geometry(element)
+        if None not in geometry:
+            return geometry
+
+        ph = element.ph
+        if ph is None:
+            return geometry
+        inherited = self._geometry.get(ph.idx, (None, None, None, None))
+        return tuple(  # type: ignore
+            value if value is not None else inherited_value
+            for value, inherited_value in zip(geometry, inherited)
+        )
+
+    def placeholder_font_size(self, shape: BaseShape) -> Optional[float]:
+        """Return the default font size a placeholder inherits from the layout, in points."""
+        return self._font_sizes.get(shape.placeholder_format.type)  # type: ignore
+
+    def text_style_font_size(self, shape: BaseShape, style_name: str) -> Optional[int]:
+        """Return the font size of a text style ("titleStyle" or "bodyStyle") of the master."""
+        return self._text_style_font_sizes.get(style_name)
+
+
+class PackageXml:
+    """Read-only access to the parts of a .pptx package, straight from the zip."""
+
+    RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+    def __init__(self, zip_file: zipfile.ZipFile):
+        self.zip_file = zip_file
+        self._layout_styles: Dict[str, LayoutStyles] = {}
+
+        # The presentation part is the package's officeDocument
+        self.presentation_part = self.related_parts("", "/officeDocument")[0]
+        presentation = self.parse(self.presentation_part)
+        sldSz = presentation.sldSz
+        self.slide_size = (
+            (sldSz.cx, sldSz.cy) if sldSz is not None else (None, None)
+        )
+
+        # Slide parts in presentation order
+        relationships = self.relationships(self.presentation_part)
+        self.slide_parts = [
+            relationships[sldId.get(qn("r:id"))][1]
+            for sldId in presentation.iter(qn("p:sldId"))
+        ]
+
+    def parse(self, part_name: str) -> Any:
+        """Parse a part into python-pptx oxml elements."""
+        return etree.fromstring(self.zip_file.read(part_name), oxml_parser)
+
+    def relationships(self, part_name: str) -> Dict[str, Tuple[str, str]]:
+        """Map the relationship IDs of a part to (type, target part name)."""
+        directory, file_name = posixpath.split(part_name)
+        rels_name = posixpath.join(directory, "_rels", file_name + ".rels")
+        try:
+            rels = etree.fromstring(self.zip_file.read(rels_name))
+        except KeyError:
+            return {}
+
+        relationships = {}
+        for rel in rels.iter(f"{self.RELS_NS}Relationship"):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(directory, target))
+            relationships[rel.get("Id")] = (rel.get("Type", ""), target)
+        return relationships
+
+    def related_parts(self, part_name: str, type_suffix: str) -> List[str]:
+        """Return the parts a part is related to by relationships of a type."""
+        return [
+            target
+            for rel_type, target in self.relationships(part_name).values()
+            if rel_type.endswith(type_suffix)
+        ]
+
+    def layout_styles(self, slide_part: str) -> LayoutStyles:
+        """Return the LayoutStyles of a slide's layout, reading the layout once."""
+        layout_part = self.related_parts(slide_part, "/slideLayout")[0]
+        styles = self._layout_styles.get(layout_part)
+        if styles is None:
+            master_part = self.related_parts(layout_part, "/slideMaster")[0]
+            styles = self._layout_styles[layout_part] = LayoutStyles(
+                self.slide_size, self.parse(layout_part), self.parse(master_part)
+            )
+        return styles
+
+
 @dataclass
 class ShapeWithPosition:
     """A shape with its absolute position on the slide."""
@@ -138,12 +715,20 @@ class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
     def __init__(self, paragraph: Any):
-        """Initialize from a PowerPoint paragraph object.
+        """Initialize from a PowerPoint paragraph object or its <a:p> element.
+
+        Color, rPr and alignment are read without creating any elements, so
+        shapes can be measured again after editing without saving and
+        reloading the presentation. (Getting a shape's text frame, as
+        is_valid_shape and ShapeData do, still adds a <p:txBody> to a shape
+        that has none.) Properties are read from the oxml elements, without
+        building the python-pptx proxy objects for the paragraph and its runs.
 
         Args:
-            paragraph: The PowerPoint paragraph object
+            paragraph: The PowerPoint paragraph object, or its <a:p> element
         """
-        self.text: str = paragraph.text.strip()
+        p = getattr(paragraph, "_p", paragraph)
+        self.text: str = p.text.strip()
         self.bullet: bool = False
         self.level: Optional[int] = None
         self.alignment: Optional[str] = None
@@ -158,43 +743,42 @@ class ParagraphData:
         self.theme_color: Optional[str] = None
         self.line_spacing: Optional[float] = None
 
-        # Check for bullet formatting
-        if (
-            hasattr(paragraph, "_p")
-            and paragraph._p is not None
-            and paragraph._p.pPr is not None
-        ):
-            pPr = paragraph._p.pPr
+        # Read from pPr directly since the paragraph's alignment, level, etc.
+        # add an empty <a:pPr/> when there is none
+        pPr = p.pPr
+        line_spacing = None
+        if pPr is not None:
+            # Check for bullet formatting
             ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
             if (
                 pPr.find(f"{ns}buChar") is not None
                 or pPr.find(f"{ns}buAutoNum") is not None
             ):
                 self.bullet = True
-                if hasattr(paragraph, "level"):
-                    self.level = paragraph.level
+                self.level = pPr.lvl
 
-        # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
+            # Add alignment if not LEFT (default)
             alignment_map = {
                 PP_ALIGN.CENTER: "CENTER",
                 PP_ALIGN.RIGHT: "RIGHT",
                 PP_ALIGN.JUSTIFY: "JUSTIFY",
             }
-            if paragraph.alignment in alignment_map:
-                self.alignment = alignment_map[paragraph.alignment]
+            if pPr.algn in alignment_map:
+                self.alignment = alignment_map[pPr.algn]
 
-        # Add spacing properties if set
-        if hasattr(paragraph, "space_before") and paragraph.space_before:
-            self.space_before = paragraph.space_before.pt
-        if hasattr(paragraph, "space_after") and paragraph.space_after:
-            self.space_after = paragraph.space_after.pt
+            # Add spacing properties if set
+            space_before, space_after = pPr.space_before, pPr.space_after
+            if space_before:
+                self.space_before = space_before.pt
+            if space_after:
+                self.space_after = space_after.pt
+            line_spacing = pPr.line_spacing
 
         # Extract font properties from first run
-        if paragraph.runs:
-            first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
-                font = first_run.font
+        runs = p.r_lst
+        if runs:
+            font = self.get_run_font(runs[0])
+            if font is not None:
                 if font.name:
                     self.font_name = font.name
                 if font.size:
@@ -207,26 +791,52 @@ class ParagraphData:
                     self.underline = font.underline
 
                 # Handle color - both RGB and theme colors
-                try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
-                except (AttributeError, TypeError):
-                    # Fall back to theme color
-                    try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
-                    except (AttributeError, TypeError):
-                        pass
+                self.color, self.theme_color = self.get_font_color(font)
 
         # Add line spacing if set
-        if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
-            if hasattr(paragraph.line_spacing, "pt"):
-                self.line_spacing = round(paragraph.line_spacing.pt, 2)
+        if line_spacing is not None:
+            if hasattr(line_spacing, "pt"):
+                self.line_spacing = round(line_spacing.pt, 2)
             else:
                 # Multiplier - convert to points
                 font_size = self.font_size if self.font_size else 12.0
-                self.line_spacing = round(paragraph.line_spacing * font_size, 2)
+                self.line_spacing = round(line_spacing * font_size, 2)
+
+    @staticmethod
+    def get_run_font(run: Any) -> Optional[Font]:
+        """Return the character properties of a run (or its <a:r> element), or None.
+
+        Unlike run.font, this does not add an empty <a:rPr/> to the run.
+        """
+        rPr = getattr(run, "_r", run).rPr
+        return Font(rPr) if rPr is not None else None
+
+    @staticmethod
+    def get_font_color(font: Font) -> Tuple[Optional[str], Optional[str]]:
+        """Read a font's color without modifying the font.
+
+        Accessing font.color turns the font fill into a solid fill, adding an
+        empty <a:solidFill/> to runs without one, so it is only read here when
+        the fill is already solid.
+
+        Returns:
+            Tuple of (rgb_hex, theme_color_name); both None if no color is set
+        """
+        if font.fill.type != MSO_FILL.SOLID:
+            return None, None
+
+        try:
+            # Try RGB color first
+            if font.color.rgb:
+                return str(font.color.rgb), None
+        except (AttributeError, TypeError):
+            # Fall back to theme color
+            try:
+                if font.color.theme_color:
+                    return None, font.color.theme_color.name
+            except (AttributeError, TypeError):
+                pass
+        return None, None
 
     def to_dict(self) -> ParagraphDict:
         """Convert to dictionary for JSON serialization, excluding None values."""
@@ -286,61 +896,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return get_font_registry().find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -353,10 +909,10 @@ class ShapeData:
             Tuple of (width_emu, height_emu) or (None, None) if not found
         """
         try:
-            prs = slide.part.package.presentation_part.presentation
-            return prs.slide_width, prs.slide_height
+            styles = StyleResolver.for_part(slide.part)
         except (AttributeError, TypeError):
             return None, None
+        return styles.slide_width_emu, styles.slide_height_emu
 
     @staticmethod
     def get_default_font_size(shape: BaseShape, slide_layout: Any) -> Optional[float]:
@@ -374,13 +930,9 @@ class ShapeData:
                 return None
 
             shape_type = shape.placeholder_format.type  # type: ignore
-            for layout_placeholder in slide_layout.placeholders:
-                if layout_placeholder.placeholder_format.type == shape_type:
-                    # Find first defRPr element with sz (size) attribute
-                    for elem in layout_placeholder.element.iter():
-                        if "defRPr" in elem.tag and (sz := elem.get("sz")):
-                            return float(sz) / 100.0  # Convert EMUs to points
-                    break
+            return StyleResolver.for_part(slide_layout.part).layout_font_size(
+                slide_layout, shape_type
+            )
         except Exception:
             pass
         return None
@@ -391,6 +943,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        styles: Optional[Any] = None,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,95 +952,113 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            styles: Optional resolver of the slide size and inherited formatting;
+                defaults to the StyleResolver of the slide's presentation
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
 
-        # Get slide dimensions from slide object
+        if styles is None and slide:
+            styles = StyleResolver.for_part(slide.part)
+        self.styles = styles
+
+        # Get slide dimensions
         self.slide_width_emu, self.slide_height_emu = (
-            self.get_slide_dimensions(slide) if slide else (None, None)
+            (styles.slide_width_emu, styles.slide_height_emu) if styles else (None, None)
         )
 
         # Get placeholder type if applicable
         self.placeholder_type: Optional[str] = None
         self.default_font_size: Optional[float] = None
-        if hasattr(shape, "is_placeholder") and shape.is_placeholder:  # type: ignore
-            if shape.placeholder_format and shape.placeholder_format.type:  # type: ignore
-                self.placeholder_type = (
-                    str(shape.placeholder_format.type).split(".")[-1].split(" ")[0]  # type: ignore
-                )
+        placeholder_type = get_placeholder_type(shape)
+        if placeholder_type:
+            self.placeholder_type = str(placeholder_type).split(".")[-1].split(" ")[0]
 
-                # Get default font size from layout
-                if slide and hasattr(slide, "slide_layout"):
-                    self.default_font_size = self.get_default_font_size(
-                        shape, slide.slide_layout
-                    )
+            # Get default font size from layout
+            if styles:
+                try:
+                    self.default_font_size = styles.placeholder_font_size(shape)
+                except Exception:
+                    pass
 
-        # Get position information
+        # Get position information (inherited from the layout for placeholders)
         # Use absolute positions if provided (for shapes in groups), otherwise use shape's position
-        left_emu = (
-            absolute_left
-            if absolute_left is not None
-            else (shape.left if hasattr(shape, "left") else 0)
-        )
-        top_emu = (
-            absolute_top
-            if absolute_top is not None
-            else (shape.top if hasattr(shape, "top") else 0)
+        shape_left, shape_top, width_emu, height_emu = (
+            styles.shape_geometry(shape) if styles else get_shape_geometry(shape)
         )
+        left_emu = absolute_left if absolute_left is not None else shape_left
+        top_emu = absolute_top if absolute_top is not None else shape_top
 
         self.left: float = round(self.emu_to_inches(left_emu), 2)  # type: ignore
         self.top: float = round(self.emu_to_inches(top_emu), 2)  # type: ignore
-        self.width: float = round(
-            self.emu_to_inches(shape.width if hasattr(shape, "width") else 0),
-            2,  # type: ignore
-        )
-        self.height: float = round(
-            self.emu_to_inches(shape.height if hasattr(shape, "height") else 0),
-            2,  # type: ignore
-        )
+        self.width: float = round(self.emu_to_inches(width_emu), 2)  # type: ignore
+        self.height: float = round(self.emu_to_inches(height_emu), 2)  # type: ignore
 
         # Store EMU positions for overflow calculations
         self.left_emu = left_emu
         self.top_emu = top_emu
-        self.width_emu = shape.width if hasattr(shape, "width") else 0
-        self.height_emu = shape.height if hasattr(shape, "height") else 0
+        self.width_emu = width_emu
+        self.height_emu = height_emu
 
-        # Calculate overflow status
-        self.frame_overflow_bottom: Optional[float] = None
-        self.slide_overflow_right: Optional[float] = None
-        self.slide_overflow_bottom: Optional[float] = None
+        # Overlaps are filled in by detect_overlaps; the other issues are
+        # computed on first access (see the cached properties below)
         self.overlapping_shapes: Dict[
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
-        self.warnings: List[str] = []
-        self._estimate_frame_overflow()
-        self._calculate_slide_overflow()
-        self._detect_bullet_issues()
+
+    @cached_property
+    def frame_overflow_bottom(self) -> Optional[float]:
+        """Estimated text overflow past the bottom of the text frame, in inches."""
+        return self._estimate_frame_overflow()
+
+    @cached_property
+    def slide_overflow_right(self) -> Optional[float]:
+        """How far the shape extends past the right edge of the slide, in inches."""
+        return self._calculate_slide_overflow()[0]
+
+    @cached_property
+    def slide_overflow_bottom(self) -> Optional[float]:
+        """How far the shape extends past the bottom edge of the slide, in inches."""
+        return self._calculate_slide_overflow()[1]
+
+    @cached_property
+    def warnings(self) -> List[str]:
+        """Formatting warnings, such as manually typed bullet symbols."""
+        return self._detect_bullet_issues()
 
     @property
     def paragraphs(self) -> List[ParagraphData]:
         """Calculate paragraphs from the shape's text frame."""
+        return [para_data for _, _, para_data in self._text_paragraphs]
+
+    @cached_property
+    def _text_frame(self) -> Any:
+        """The shape's text frame, or None if it has none."""
         if not self.shape or not hasattr(self.shape, "text_frame"):
+            return None
+        return self.shape.text_frame  # type: ignore
+
+    @cached_property
+    def _text_paragraphs(self) -> List[Tuple[int, str, ParagraphData]]:
+        """(index, text, ParagraphData) of the paragraphs that have text.
+
+        Shared by the paragraphs, the overflow estimate and the bullet check,
+        so each paragraph is read once.
+        """
+        if not self._text_frame:
             return []
 
         paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
+        for para_idx, p in enumerate(self._text_frame._txBody.p_lst):
+            text = p.text
+            if text.strip():
+                paragraphs.append((para_idx, text, ParagraphData(p)))
         return paragraphs
 
     def _get_default_font_size(self) -> int:
         """Get default font size from theme text styles or use conservative default."""
         try:
-            if not (
-                hasattr(self.shape, "part") and hasattr(self.shape.part, "slide_layout")
-            ):
-                return 14
-
-            slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
-            if not hasattr(slide_master, "element"):
-                return 14
+            styles = self.styles or StyleResolver.for_part(self.shape.part)
 
             # Determine theme style based on placeholder type
             style_name = "bodyStyle"  # Default
@@ -495,12 +1066,9 @@ class ShapeData:
                 style_name = "titleStyle"
 
             # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            font_size = styles.text_style_font_size(self.shape, style_name)
+            if font_size is not None:
+                return font_size
         except Exception:
             pass
 
@@ -511,15 +1079,18 @@ class ShapeData:
         # Default PowerPoint margins in inches
         margins = {"top": 0.05, "bottom": 0.05, "left": 0.1, "right": 0.1}
 
-        # Override with actual margins if set
-        if hasattr(text_frame, "margin_top") and text_frame.margin_top:
-            margins["top"] = self.emu_to_inches(text_frame.margin_top)
-        if hasattr(text_frame, "margin_bottom") and text_frame.margin_bottom:
-            margins["bottom"] = self.emu_to_inches(text_frame.margin_bottom)
-        if hasattr(text_frame, "margin_left") and text_frame.margin_left:
-            margins["left"] = self.emu_to_inches(text_frame.margin_left)
-        if hasattr(text_frame, "margin_right") and text_frame.margin_right:
-            margins["right"] = self.emu_to_inches(text_frame.margin_right)
+        # Override with actual margins if set (the text frame's margin_* values,
+        # read from its <a:bodyPr> once)
+        bodyPr = text_frame._txBody.bodyPr
+        for side, attribute in (
+            ("top", "tIns"),
+            ("bottom", "bIns"),
+            ("left", "lIns"),
+            ("right", "rIns"),
+        ):
+            margin = getattr(bodyPr, attribute)
+            if margin:
+                margins[side] = self.emu_to_inches(margin)
 
         # Calculate usable area
         usable_width = self.width - margins["left"] - margins["right"]
@@ -531,85 +1102,107 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
+    def _wrap_text_line(
+        self, line: str, max_width_px: int, metrics: FontMetrics
+    ) -> List[str]:
+        """Wrap a single line of text to fit within max_width_px.
+
+        Line widths are accumulated from cached word widths, so each word is
+        measured once per font rather than once per candidate line.
+        """
         if not line:
             return [""]
 
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
+        words = line.split(" ")
+        widths = [metrics.word_length(word) for word in words]
+        space_width = metrics.space_width
+
+        # The whole line fits without wrapping
+        line_width = sum(widths) + space_width * (len(words) - 1)
+        if metrics.fits(line_width, words, max_width_px):
             return [line]
 
-        # Need to wrap - split into words
+        # Need to wrap - fill each line greedily word by word
         wrapped = []
-        words = line.split(" ")
-        current_line = ""
+        current_words: List[str] = []
+        current_width = 0.0
+
+        for word, width in zip(words, widths):
+            if not current_words:
+                # Leading empty words (repeated spaces) do not start a line
+                if word:
+                    current_words, current_width = [word], width
+                continue
 
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
+            test_width = current_width + space_width + width
+            if metrics.fits(test_width, current_words + [word], max_width_px):
+                current_words.append(word)
+                current_width = test_width
             else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
+                wrapped.append(" ".join(current_words))
+                current_words = [word] if word else []
+                current_width = width
 
-        if current_line:
-            wrapped.append(current_line)
+        if current_words:
+            wrapped.append(" ".join(current_words))
 
         return wrapped
 
-    def _estimate_frame_overflow(self) -> None:
+    def _estimate_frame_overflow(self) -> Optional[float]:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
+        text_frame = self._text_frame
+        if not text_frame or not self._text_paragraphs:
+            return None
 
         # Get usable dimensions after accounting for margins
         usable_width_px, usable_height_px = self._get_usable_dimensions(text_frame)
         if usable_width_px <= 0 or usable_height_px <= 0:
-            return
-
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
+            return None
 
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
-        # Calculate total height of all paragraphs
-        total_height_px = 0
-
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
-                continue
-
-            para_data = ParagraphData(paragraph)
-
-            # Load font for this paragraph
+        paragraphs = []
+        for para_idx, text, para_data in self._text_paragraphs:
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
+            lines = text.split("\n")
+            paragraphs.append((para_idx, para_data, font_name, font_size, lines))
+
+        # Cheap upper bound first: a line never wraps into more lines than it has
+        # words, so if even that fits, no fonts need to be loaded or measured
+        def max_line_count(font_name, font_size, lines):
+            return sum(max(1, sum(1 for word in line.split(" ") if word)) for line in lines)
+
+        if self._paragraphs_height(paragraphs, max_line_count) <= usable_height_px:
+            return None
+
+        def wrapped_line_count(font_name, font_size, lines):
+            metrics = get_font_registry().metrics(font_name, font_size)
+            return sum(
+                len(self._wrap_text_line(line, usable_width_px, metrics))
+                for line in lines
+            )
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+        total_height_px = self._paragraphs_height(paragraphs, wrapped_line_count)
+
+        # Check for overflow (ignore negligible overflows <= 0.05")
+        if total_height_px > usable_height_px:
+            overflow_px = total_height_px - usable_height_px
+            overflow_inches = round(overflow_px / 96.0, 2)
+            if overflow_inches > 0.05:  # Only report significant overflows
+                return overflow_inches
+        return None
 
-            # Wrap all lines in this paragraph
-            all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
-                all_wrapped_lines.extend(wrapped)
+    @staticmethod
+    def _paragraphs_height(paragraphs, line_count) -> float:
+        """Total height in pixels of the paragraphs, given a line counting function."""
+        total_height_px = 0
 
-            if all_wrapped_lines:
+        for para_idx, para_data, font_name, font_size, lines in paragraphs:
+            line_total = line_count(font_name, font_size, lines)
+
+            if line_total:
                 # Calculate line height
                 if para_data.line_spacing:
                     # Custom line spacing explicitly set
@@ -623,23 +1216,23 @@ class ShapeData:
                     total_height_px += para_data.space_before * 96 / 72
 
                 # Add paragraph text height
-                total_height_px += len(all_wrapped_lines) * line_height_px
+                total_height_px += line_total * line_height_px
 
                 # Add space_after
                 if para_data.space_after:
                     total_height_px += para_data.space_after * 96 / 72
 
-        # Check for overflow (ignore negligible overflows <= 0.05")
-        if total_height_px > usable_height_px:
-            overflow_px = total_height_px - usable_height_px
-            overflow_inches = round(overflow_px / 96.0, 2)
-            if overflow_inches > 0.05:  # Only report significant overflows
-                self.frame_overflow_bottom = overflow_inches
+        return total_height_px
+
+    def _calculate_slide_overflow(self) -> Tuple[Optional[float], Optional[float]]:
+        """Calculate if shape overflows the slide boundaries.
 
-    def _calculate_slide_overflow(self) -> None:
-        """Calculate if shape overflows the slide boundaries."""
+        Returns:
+            Tuple of (overflow_right, overflow_bottom) in inches, None where it fits
+        """
+        overflow_right = overflow_bottom = None
         if self.slide_width_emu is None or self.slide_height_emu is None:
-            return
+            return overflow_right, overflow_bottom
 
         # Check right overflow (ignore negligible overflows <= 0.01")
         right_edge_emu = self.left_emu + self.width_emu
@@ -647,7 +1240,7 @@ class ShapeData:
             overflow_emu = right_edge_emu - self.slide_width_emu
             overflow_inches = round(self.emu_to_inches(overflow_emu), 2)
             if overflow_inches > 0.01:  # Only report significant overflows
-                self.slide_overflow_right = overflow_inches
+                overflow_right = overflow_inches
 
         # Check bottom overflow (ignore negligible overflows <= 0.01")
         bottom_edge_emu = self.top_emu + self.height_emu
@@ -655,38 +1248,39 @@ class ShapeData:
             overflow_emu = bottom_edge_emu - self.slide_height_emu
             overflow_inches = round(self.emu_to_inches(overflow_emu), 2)
             if overflow_inches > 0.01:  # Only report significant overflows
-                self.slide_overflow_bottom = overflow_inches
+                overflow_bottom = overflow_inches
 
-    def _detect_bullet_issues(self) -> None:
-        """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
+        return overflow_right, overflow_bottom
 
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
+    def _detect_bullet_issues(self) -> List[str]:
+        """Detect bullet point formatting issues in paragraphs."""
+        warnings: List[str] = []
 
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        for _, _, para_data in self._text_paragraphs:
+            text = para_data.text
             # Check for manual bullet symbols
-            if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
-                self.warnings.append(
-                    "manual_bullet_symbol: use proper bullet formatting"
-                )
+            if any(text.startswith(symbol + " ") for symbol in bullet_symbols):
+                warnings.append("manual_bullet_symbol: use proper bullet formatting")
                 break
 
+        return warnings
+
     @property
     def has_any_issues(self) -> bool:
-        """Check if shape has any issues (overflow, overlap, or warnings)."""
+        """Check if shape has any issues (overflow, overlap, or warnings).
+
+        The cheap checks run first, so text is only measured for shapes
+        that have no other issue.
+        """
         return (
-            self.frame_overflow_bottom is not None
+            len(self.overlapping_shapes) > 0
             or self.slide_overflow_right is not None
             or self.slide_overflow_bottom is not None
-            or len(self.overlapping_shapes) > 0
             or len(self.warnings) > 0
+            or self.frame_overflow_bottom is not None
         )
 
     def to_dict(self) -> ShapeDict:
@@ -750,15 +1344,13 @@ def is_valid_shape(shape: BaseShape) -> bool:
         return False
 
     # Skip slide numbers and numeric footers
-    if hasattr(shape, "is_placeholder") and shape.is_placeholder:  # type: ignore
-        if shape.placeholder_format and shape.placeholder_format.type:  # type: ignore
-            placeholder_type = (
-                str(shape.placeholder_format.type).split(".")[-1].split(" ")[0]  # type: ignore
-            )
-            if placeholder_type == "SLIDE_NUMBER":
-                return False
-            if placeholder_type == "FOOTER" and text.isdigit():
-                return False
+    placeholder_type = get_placeholder_type(shape)
+    if placeholder_type:
+        placeholder_type = str(placeholder_type).split(".")[-1].split(" ")[0]
+        if placeholder_type == "SLIDE_NUMBER":
+            return False
+        if placeholder_type == "FOOTER" and text.isdigit():
+            return False
 
     return True
 
@@ -783,8 +1375,7 @@ def collect_shapes_with_absolute_positions(
     if hasattr(shape, "shapes"):  # GroupShape
         result = []
         # Get this group's position
-        group_left = shape.left if hasattr(shape, "left") else 0
-        group_top = shape.top if hasattr(shape, "top") else 0
+        group_left, group_top, _, _ = get_shape_geometry(shape)
 
         # Calculate absolute position for this group
         abs_group_left = parent_left + group_left
@@ -802,8 +1393,7 @@ def collect_shapes_with_absolute_positions(
     # Regular shape - check if it has valid text
     if is_valid_shape(shape):
         # Calculate absolute position
-        shape_left = shape.left if hasattr(shape, "left") else 0
-        shape_top = shape.top if hasattr(shape, "top") else 0
+        shape_left, shape_top, _, _ = get_shape_geometry(shape)
 
         return [
             ShapeWithPosition(
@@ -888,27 +1478,24 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
+    # Ensure shape IDs are set
+    for i, shape in enumerate(shapes):
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    rects = [(shape.left, shape.top, shape.width, shape.height) for shape in shapes]
+    overlap_areas = {}
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+    def is_overlapping(i: int, j: int) -> bool:
+        overlaps, overlap_area = calculate_overlap(rects[i], rects[j])
+        overlap_areas[i, j] = overlap_area
+        return overlaps
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
-
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
-
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    # Only pairs whose extents touch are measured, in the same order as a pairwise scan
+    boxes = [(left, top, left + width, top + height) for left, top, width, height in rects]
+    for i, j in find_overlapping_pairs(boxes, is_overlapping):
+        # Add shape IDs with overlap area in square inches
+        shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_areas[i, j]
+        shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_areas[i, j]
 
 
 def extract_text_inventory(
@@ -931,50 +1518,159 @@ def extract_text_inventory(
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+        slide_inventory = extract_slide_inventory(slide, issues_only=issues_only)
+        if slide_inventory:
+            inventory[f"slide-{slide_idx}"] = slide_inventory
 
-        if not shapes_with_positions:
-            continue
+    return inventory
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of a single slide as {shape-N: ShapeData}.
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+    Shapes are sorted by visual position and numbered in that order; an
+    empty dict means the slide has no (matching) text shapes.
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+        )
+        for swp in shapes_with_positions
+    ]
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+    return build_slide_inventory(shape_data_list, issues_only)
 
-        if not sorted_shapes:
-            continue
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+def build_slide_inventory(
+    shape_data_list: List[ShapeData], issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Number the text shapes of one slide by position and detect their overlaps."""
+    if not shape_data_list:
+        return {}
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+def extract_text_inventory_from_xml(
+    pptx_path: Path, issues_only: bool = False
+) -> InventoryData:
+    """Extract the same inventory as extract_text_inventory from the slide XML.
+
+    No python-pptx Presentation is built: slides are streamed from the zip
+    with an lxml pull parser, only text shapes are wrapped in shape objects,
+    and inherited formatting is read once per layout. This is much faster for
+    auditing many decks. The ShapeData objects only support reading (no
+    shape.part), so use extract_text_inventory for editing.
+    """
+    inventory: InventoryData = {}
+
+    with zipfile.ZipFile(pptx_path) as zip_file:
+        package = PackageXml(zip_file)
+        for slide_idx, slide_part in enumerate(package.slide_parts):
+            styles = package.layout_styles(slide_part)
+
+            shape_data_list = []
+            with zip_file.open(slide_part) as xml_file:
+                for sp, group_left, group_top in iter_slide_shape_elements(xml_file):
+                    shape = Shape(sp, None)
+                    if not is_valid_shape(shape):
+                        continue
+                    # Shapes in groups are offset by the enclosing groups
+                    left = top = None
+                    if group_left or group_top:
+                        shape_left, shape_top, _, _ = styles.shape_geometry(shape)
+                        left, top = group_left + shape_left, group_top + shape_top
+                    shape_data_list.append(ShapeData(shape, left, top, styles=styles))
+
+            slide_inventory = build_slide_inventory(shape_data_list, issues_only)
+            if slide_inventory:
+                inventory[f"slide-{slide_idx}"] = slide_inventory
 
     return inventory
 
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+def iter_slide_shape_elements(xml_file: Any) -> Any:
+    """Stream a slide part and yield (sp, group_left, group_top) for its p:sp shapes.
+
+    Only shapes python-pptx sees are yielded: direct children of the shape
+    tree or of (nested) groups, not alternate content. The group offsets
+    accumulate the positions of the enclosing groups, as in
+    collect_shapes_with_absolute_positions.
+    """
+    sp_tree_tag, group_tag = qn("p:spTree"), qn("p:grpSp")
+    group_properties_tag, shape_tag = qn("p:grpSpPr"), qn("p:sp")
+
+    parser = etree.XMLPullParser(
+        events=("start", "end"),
+        tag=(sp_tree_tag, group_tag, group_properties_tag, shape_tag),
+        remove_blank_text=True,
+        resolve_entities=False,
+    )
+    parser.set_element_class_lookup(element_class_lookup)
+
+    # Open shape trees: [element, left offset, top offset, visible to python-pptx]
+    trees: List[List[Any]] = []
+
+    def handle(event: str, element: Any) -> Any:
+        parent = trees[-1] if trees else None
+        is_child = parent is not None and element.getparent() is parent[0]
+        if event == "start":
+            if element.tag == sp_tree_tag and not trees:
+                trees.append([element, 0, 0, True])
+            elif element.tag == group_tag and parent is not None:
+                trees.append([element, parent[1], parent[2], is_child and parent[3]])
+        elif element.tag == shape_tag:
+            if is_child and parent[3]:  # type: ignore
+                yield element, parent[1], parent[2]  # type: ignore
+        elif element.tag == group_properties_tag:
+            # The group's own offset is known once its properties are parsed
+            if is_child and parent[0].tag == group_tag and len(trees) > 1:  # type: ignore
+                group = parent[0]  # type: ignore
+                parent[1] = trees[-2][1] + (group.x or 0)  # type: ignore
+                parent[2] = trees[-2][2] + (group.y or 0)  # type: ignore
+        elif parent is not None and element is parent[0]:
+            trees.pop()
+
+    while chunk := xml_file.read(64 * 1024):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            yield from handle(event, element)
+    parser.close()
+    for event, element in parser.read_events():
+        yield from handle(event, element)
+
+
+def get_inventory_as_dict(
+    pptx_path: Path, issues_only: bool = False, jobs: int = 1, fast: bool = False
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
@@ -984,11 +1680,22 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes to spread slides over (0 = one per CPU).
+            Each worker loads the presentation once; the result is the same as
+            with jobs=1.
+        fast: Read the slide XML directly (extract_text_inventory_from_xml)
+            instead of loading the presentation; jobs is then ignored
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
+    jobs = jobs or os.cpu_count() or 1
+    if fast:
+        inventory = extract_text_inventory_from_xml(pptx_path, issues_only=issues_only)
+    elif jobs > 1:
+        return _get_inventory_as_dict_parallel(pptx_path, issues_only, jobs)
+    else:
+        inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
 
     # Convert ShapeData objects to dictionaries
     dict_inventory: InventoryDict = {}
@@ -1000,6 +1707,68 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     return dict_inventory
 
 
+def _get_inventory_as_dict_parallel(
+    pptx_path: Path, issues_only: bool, jobs: int
+) -> InventoryDict:
+    """Extract slides in worker processes and reassemble the inventory in slide order."""
+    # Only the presentation part is read here; each worker loads the whole deck
+    with zipfile.ZipFile(pptx_path) as zip_file:
+        slide_count = len(PackageXml(zip_file).slide_parts)
+    if slide_count == 0:
+        return {}
+
+    # Several small chunks per worker keep the load balanced across slow slides
+    workers = min(jobs, slide_count)
+    chunk_size = max(1, slide_count // (workers * 4))
+    chunks = [
+        list(range(start, min(start + chunk_size, slide_count)))
+        for start in range(0, slide_count, chunk_size)
+    ]
+
+    dict_inventory: InventoryDict = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path),),
+    ) as executor:
+        for chunk_result in executor.map(
+            _extract_slides_as_dict, chunks, [issues_only] * len(chunks)
+        ):
+            for slide_idx, slide_inventory in chunk_result:
+                dict_inventory[f"slide-{slide_idx}"] = slide_inventory
+
+    return dict_inventory
+
+
+# Presentation loaded once by each worker process (see _get_inventory_as_dict_parallel)
+_worker_presentation: Optional[Any] = None
+
+
+def _init_inventory_worker(pptx_path: str) -> None:
+    global _worker_presentation
+    _worker_presentation = Presentation(pptx_path)
+
+
+def _extract_slides_as_dict(
+    slide_indices: List[int], issues_only: bool
+) -> List[Tuple[int, Dict[str, ShapeDict]]]:
+    slides = _worker_presentation.slides  # type: ignore
+    result = []
+    for slide_idx in slide_indices:
+        slide_inventory = extract_slide_inventory(slides[slide_idx], issues_only)
+        if slide_inventory:
+            result.append(
+                (
+                    slide_idx,
+                    {
+                        shape_key: shape_data.to_dict()
+                        for shape_key, shape_data in slide_inventory.items()
+                    },
+                )
+            )
+    return result
+
+
 def save_inventory(inventory: InventoryData, output_path: Path) -> None:
     """Save inventory to JSON file with proper formatting.
 
@@ -1012,6 +1781,11 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
 
+    write_inventory_json(json_inventory, output_path)
+
+
+def write_inventory_json(json_inventory: InventoryDict, output_path: Path) -> None:
+    """Write an already serialized inventory (see get_inventory_as_dict) to a JSON file."""
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(json_inventory, f, indent=2, ensure_ascii=False)
 
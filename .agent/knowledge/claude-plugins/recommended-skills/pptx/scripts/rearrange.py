@@ -4,19 +4,40 @@ Rearrange PowerPoint slides based on a sequence of indices.
 
 Usage:
     python rearrange.py template.pptx output.pptx 0,34,34,50,52
+    python rearrange.py template.pptx output.pptx 0,b:3,34 --source b=other.pptx
 
 This will create output.pptx using slides from template.pptx in the specified order.
-Slides can be repeated (e.g., 34 appears twice).
+Slides can be repeated (e.g., 34 appears twice), and slides of other decks can be
+included by label (e.g., b:3 is slide 3 of other.pptx).
+
+The output is composed in one pass over the sequence: the first use of a
+template slide keeps the original, later uses and slides of other decks are
+copied, unused template slides are dropped, and the slide list is written
+once in the final order. Images and media of copied slides are shared by
+content hash, so repeated or imported media is stored only once.
 """
 
 import argparse
+import hashlib
+import re
 import shutil
 import sys
-from copy import deepcopy
 from pathlib import Path
 
-import six
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, XmlPart
+from pptx.opc.packuri import PackURI
+
+RELATIONSHIPS_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+DRAWINGML_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
+# Hyperlink elements that are removed, rather than just unlinked, when the
+# relationship they use is dropped
+HYPERLINK_TAGS = {f"{DRAWINGML_NS}hlinkClick", f"{DRAWINGML_NS}hlinkHover"}
+
+# Relationship types whose targets are shared between slides with equal content
+SHARED_MEDIA_RELTYPES = {RT.IMAGE, RT.MEDIA, RT.VIDEO, RT.AUDIO}
 
 
 def main():
@@ -31,6 +52,10 @@ Examples:
   python rearrange.py template.pptx output.pptx 5,3,1,2,4
     Creates output.pptx with slides reordered as specified
 
+  python rearrange.py template.pptx output.pptx 0,b:3,b:3,7 --source b=other.pptx
+    Creates output.pptx using slide 0 of template.pptx, slide 3 of other.pptx
+    (twice) and slide 7 of template.pptx
+
 Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         """,
     )
@@ -38,14 +63,36 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
     parser.add_argument("template", help="Path to template PPTX file")
     parser.add_argument("output", help="Path for output PPTX file")
     parser.add_argument(
-        "sequence", help="Comma-separated sequence of slide indices (0-based)"
+        "sequence",
+        help="Comma-separated sequence of slide indices (0-based); "
+        "LABEL:N is slide N of the source deck LABEL",
+    )
+    parser.add_argument(
+        "--source",
+        action="append",
+        default=[],
+        metavar="LABEL=PATH",
+        help="Another PPTX file to take slides from, referenced as LABEL:N in the sequence "
+        "(can be repeated)",
     )
 
     args = parser.parse_args()
 
+    # Parse the source decks
+    sources = {}
+    for source in args.source:
+        label, separator, path = source.partition("=")
+        if not separator or not label or not path:
+            print(f"Error: Invalid source (use LABEL=PATH): {source}")
+            sys.exit(1)
+        if not Path(path).exists():
+            print(f"Error: Source file not found: {path}")
+            sys.exit(1)
+        sources[label] = Path(path)
+
     # Parse the slide sequence
     try:
-        slide_sequence = [int(x.strip()) for x in args.sequence.split(",")]
+        slide_sequence = parse_slide_sequence(args.sequence)
     except ValueError:
         print(
             "Error: Invalid sequence format. Use comma-separated integers (e.g., 0,34,34,50,52)"
@@ -63,7 +110,7 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        rearrange_presentation(template_path, output_path, slide_sequence)
+        rearrange_presentation(template_path, output_path, slide_sequence, sources)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -72,88 +119,189 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         sys.exit(1)
 
 
-def duplicate_slide(pres, index):
-    """Duplicate a slide in the presentation."""
-    source = pres.slides[index]
-
-    # Use source's layout to preserve formatting
-    new_slide = pres.slides.add_slide(source.slide_layout)
-
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
-            )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
+def parse_slide_sequence(text):
+    """Parse "0,34,b:3" into [0, 34, ("b", 3)].
+
+    Plain entries are template slide indices; LABEL:N entries are slide N of
+    a source deck. Raises ValueError for malformed entries.
+    """
+    sequence = []
+    for item in text.split(","):
+        label, separator, index = item.strip().rpartition(":")
+        if separator:
+            if not label:
+                raise ValueError(f"Missing source label: {item}")
+            sequence.append((label, int(index)))
+        else:
+            sequence.append(int(index))
+    return sequence
+
+
+class SlideCopier:
+    """Copies slides into a presentation, from the same or another deck.
+
+    A copied slide gets its own copy of the parts it relates to (charts,
+    diagrams, embedded files, ...), except for images and media, which are
+    shared: the presentation's parts are indexed by content hash once, and
+    an image or media part is only added if no part with the same content
+    exists. Slides from another deck use the presentation's layout
+    with the same name (or else at the same position).
+
+    Links to other slides are kept as they are, even into another deck;
+    compose_slides retargets or drops those that leave the output.
+    """
+
+    def __init__(self, prs):
+        self.prs = prs
+        self.package = prs.part.package
+        self._partnames = None  # Partnames in use, collected on first copy
+        self._next_numbers = {}  # Partname template -> first number to try
+        self._parts_by_hash = None  # (content type, sha256) -> binary part
+        self._layouts_by_name = {}
+        for layout in prs.slide_layouts:
+            self._layouts_by_name.setdefault(layout.name, layout)
+        # Slide part of another deck -> part of its first copy
+        self.slide_copies = {}
+
+    def copy_slide(self, source_slide):
+        """Add a copy of source_slide to the presentation's parts.
+
+        Returns the rId of the presentation's relationship to the new slide;
+        the slide is not added to the slide list.
+        """
+        layout = self._target_layout(source_slide.slide_layout)
+        slide_part = self._copy_part(source_slide.part, layout_part=layout.part)
+        if source_slide.part.package is not self.package:
+            self.slide_copies.setdefault(source_slide.part, slide_part)
+        return self.prs.part.relate_to(slide_part, RT.SLIDE)
+
+    def _target_layout(self, source_layout):
+        """Return the presentation's layout to use for a slide with source_layout."""
+        if source_layout.part.package is self.package:
+            return source_layout
+        layout = self._layouts_by_name.get(source_layout.name)
+        if layout is None:
+            # Same position in the first master, or else the first layout
+            layouts = self.prs.slide_layouts
+            source_layouts = source_layout.slide_master.slide_layouts
+            position = source_layouts.index(source_layout)
+            layout = layouts[position] if position < len(layouts) else layouts[0]
+        return layout
+
+    def _copy_part(self, part, layout_part=None):
+        """Copy an XML part and, recursively, the parts it relates to."""
+        new_part = PartFactory(
+            self._next_partname(part.partname), part.content_type, self.package, part.blob
+        )
+
+        rId_map = {}
+        for rId, rel in part.rels.items():
+            if rel.is_external:
+                rId_map[rId] = new_part.relate_to(
+                    rel.target_ref, rel.reltype, is_external=True
                 )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
+            elif rel.reltype == RT.SLIDE_LAYOUT and layout_part is not None:
+                rId_map[rId] = new_part.relate_to(layout_part, rel.reltype)
+            elif rel.reltype == RT.NOTES_SLIDE:
+                rId_map[rId] = None  # Notes are not copied
+            elif rel.reltype == RT.SLIDE:
+                rId_map[rId] = new_part.relate_to(rel.target_part, rel.reltype)
+            elif rel.reltype in SHARED_MEDIA_RELTYPES:
+                rId_map[rId] = new_part.relate_to(
+                    self._media_part(rel.target_part), rel.reltype
+                )
+            elif isinstance(rel.target_part, XmlPart):
+                rId_map[rId] = new_part.relate_to(
+                    self._copy_part(rel.target_part), rel.reltype
+                )
+            else:
+                rId_map[rId] = new_part.relate_to(
+                    self._new_part(rel.target_part), rel.reltype
                 )
 
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
-
-    return new_slide
+        # Point the copied XML's relationship references at the new rIds, and
+        # drop those to relationships that were not copied
+        update_references(new_part, rId_map)
+        return new_part
+
+    def _media_part(self, part):
+        """Return the presentation's part with the content of an image or media part, adding it if needed."""
+        if self._parts_by_hash is None:
+            self._parts_by_hash = {}
+            for existing in self.package.iter_parts():
+                if not isinstance(existing, XmlPart):
+                    self._parts_by_hash.setdefault(self._content_key(existing), existing)
+
+        key = self._content_key(part)
+        target = self._parts_by_hash.get(key)
+        if target is None:
+            target = self._parts_by_hash[key] = self._new_part(part)
+        return target
+
+    def _new_part(self, part):
+        """Add a copy of a binary part (without relationships)."""
+        return PartFactory(
+            self._next_partname(part.partname), part.content_type, self.package, part.blob
+        )
 
+    @staticmethod
+    def _content_key(part):
+        return part.content_type, hashlib.sha256(part.blob).hexdigest()
 
-def delete_slide(pres, index):
-    """Delete a slide from the presentation."""
-    rId = pres.slides._sldIdLst[index].rId
-    pres.part.drop_rel(rId)
-    del pres.slides._sldIdLst[index]
+    def _next_partname(self, partname):
+        """Return an unused partname numbered like partname, e.g. /ppt/slides/slide7.xml."""
+        if self._partnames is None:
+            self._partnames = {part.partname for part in self.package.iter_parts()}
 
+        # Number the partname's base name: slide3.xml -> slide%d.xml, logo.png -> logo%d.png
+        template = re.sub(r"\d*(\.[^./]*)?$", r"%d\1", partname.replace("%", "%%"), count=1)
+        number = self._next_numbers.get(template, 1)
+        while template % number in self._partnames:
+            number += 1
+        self._next_numbers[template] = number + 1
+        self._partnames.add(template % number)
+        return PackURI(template % number)
 
-def reorder_slides(pres, slide_index, target_index):
-    """Move a slide from one position to another."""
-    slides = pres.slides._sldIdLst
 
-    # Remove slide element from current position
-    slide_element = slides[slide_index]
-    slides.remove(slide_element)
+def update_references(part, rId_map):
+    """Rewrite a part's XML references to relationships after they changed.
 
-    # Insert at target position
-    slides.insert(target_index, slide_element)
+    References to rIds in rId_map are changed to the mapped rId; those
+    mapped to None, and any others to an rId the part does not have, are
+    removed: hyperlinks using them are deleted, other elements lose the
+    attribute. This way the XML only refers to relationships that exist.
+    """
+    rIds = set(part.rels.keys())
+    dangling = []
+    for element in part._element.iter():
+        for name, value in element.attrib.items():
+            if not name.startswith(RELATIONSHIPS_NS):
+                continue
+            if value in rId_map:
+                value = rId_map[value]
+                if value is not None:
+                    element.set(name, value)
+            if value not in rIds:
+                dangling.append((element, name))
+
+    for element, name in dangling:
+        parent = element.getparent()
+        if element.tag in HYPERLINK_TAGS and parent is not None:
+            parent.remove(element)
+        else:
+            del element.attrib[name]
 
 
-def rearrange_presentation(template_path, output_path, slide_sequence):
+def rearrange_presentation(template_path, output_path, slide_sequence, sources=None):
     """
     Create a new presentation with slides from template in specified order.
 
     Args:
         template_path: Path to template PPTX file
         output_path: Path for output PPTX file
-        slide_sequence: List of slide indices (0-based) to include
+        slide_sequence: List of slide indices (0-based) to include; an entry
+            can also be a (label, index) tuple for a slide of a source deck
+        sources: Optional dict mapping labels to other PPTX files to take slides from
     """
     # Copy template to preserve dimensions and theme
     if template_path != output_path:
@@ -162,64 +310,25 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
     else:
         prs = Presentation(template_path)
 
-    total_slides = len(prs.slides)
+    source_decks = {
+        label: Presentation(str(path)) for label, path in (sources or {}).items()
+    }
 
     # Validate indices
-    for idx in slide_sequence:
+    slide_counts = {None: len(prs.slides)}
+    slide_counts.update({label: len(deck.slides) for label, deck in source_decks.items()})
+    for entry in slide_sequence:
+        label, idx = entry if isinstance(entry, tuple) else (None, entry)
+        if label not in slide_counts:
+            raise ValueError(f"Unknown source deck '{label}' (use --source {label}=PATH)")
+        total_slides = slide_counts[label]
         if idx < 0 or idx >= total_slides:
-            raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
-
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
-
-    # Step 1: DUPLICATE repeated slides
-    print(f"Processing {len(slide_sequence)} slides from template...")
-    for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
-            # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
-            print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
-            # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
-            print(
-                f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
+            deck = f" of source '{label}'" if label else ""
+            raise ValueError(
+                f"Slide index {idx}{deck} out of range (0-{total_slides - 1})"
             )
-            for _ in range(count):
-                duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
-            duplicated[template_idx] = duplicates
-        else:
-            # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
-            print(f"  [{i}] Using original slide {template_idx}")
-
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
-
-    # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
+
+    compose_slides(prs, slide_sequence, source_decks)
 
     # Save the presentation
     prs.save(output_path)
@@ -227,5 +336,81 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
     print(f"Final presentation has {len(prs.slides)} slides")
 
 
+def compose_slides(prs, slide_sequence, source_decks=None):
+    """Make prs consist of the slides of slide_sequence, in one pass.
+
+    The first occurrence of a template slide keeps the original slide; any
+    later occurrence, and every slide of a source deck, is a copy. Template
+    slides not in the sequence are dropped and the slide list is rewritten
+    once, in sequence order.
+
+    Args:
+        prs: The template presentation, modified in place
+        slide_sequence: Template slide indices or (label, index) tuples
+        source_decks: Dict mapping labels to source Presentation objects
+    """
+    sld_id_lst = prs.slides._sldIdLst
+    template_sld_ids = list(sld_id_lst)
+    template_slides = list(prs.slides)
+    source_slides = {
+        label: list(deck.slides) for label, deck in (source_decks or {}).items()
+    }
+    copier = SlideCopier(prs)
+
+    # Step 1: PICK or COPY each slide of the sequence
+    print(f"Processing {len(slide_sequence)} slides from template...")
+    kept = set()  # Template slides used as originals
+    final_sld_ids = []
+    for i, entry in enumerate(slide_sequence):
+        if isinstance(entry, tuple):
+            label, idx = entry
+            rId = copier.copy_slide(source_slides[label][idx])
+            final_sld_ids.append(sld_id_lst.add_sldId(rId))
+            print(f"  [{i}] Copying slide {idx} from source '{label}'")
+        elif entry not in kept:
+            kept.add(entry)
+            final_sld_ids.append(template_sld_ids[entry])
+            print(f"  [{i}] Using original slide {entry}")
+        else:
+            rId = copier.copy_slide(template_slides[entry])
+            final_sld_ids.append(sld_id_lst.add_sldId(rId))
+            print(f"  [{i}] Using duplicate of slide {entry}")
+
+    # Step 2: DELETE unwanted slides; parts only they use are no longer saved.
+    # Links to slides that are not in the output would keep them in the
+    # package, so they are pointed at the slide's copy or removed.
+    final_parts = {prs.part.related_part(sld_id.rId) for sld_id in final_sld_ids}
+    for slide_part in final_parts:
+        retarget_slide_links(slide_part, final_parts, copier.slide_copies)
+
+    print(f"\nDeleting {len(template_sld_ids) - len(kept)} unused slides...")
+    for idx, sld_id in enumerate(template_sld_ids):
+        if idx not in kept:
+            prs.part.rels.pop(sld_id.rId)
+
+    # Step 3: REWRITE the slide list once, in the final order
+    print(f"Ordering {len(final_sld_ids)} slides in final sequence...")
+    for sld_id in list(sld_id_lst):
+        sld_id_lst.remove(sld_id)
+    sld_id_lst.extend(final_sld_ids)
+
+
+def retarget_slide_links(slide_part, final_parts, slide_copies):
+    """Make a slide's links to other slides point only at slides of the output.
+
+    A link to a slide outside final_parts is moved to the copy of that slide
+    in slide_copies (for slides imported from another deck) or else removed,
+    along with the hyperlink that uses it.
+    """
+    rId_map = {}
+    for rId, rel in list(slide_part.rels.items()):
+        if rel.reltype != RT.SLIDE or rel.is_external or rel.target_part in final_parts:
+            continue
+        slide_part.rels.pop(rId)
+        copy = slide_copies.get(rel.target_part)
+        rId_map[rId] = None if copy is None else slide_part.relate_to(copy, RT.SLIDE)
+    update_references(slide_part, rId_map)
+
+
 if __name__ == "__main__":
     main()
@@ -14,7 +14,7 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-from inventory import InventoryData, extract_text_inventory
+from inventory import InventoryData, ShapeData, extract_text_inventory
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
@@ -221,9 +221,6 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     # Pass prs to use same Presentation instance
     inventory = extract_text_inventory(Path(pptx_file), prs)
 
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
-
     # Load replacement data with duplicate key detection
     with open(json_file, "r") as f:
         replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
@@ -240,6 +237,17 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         )
         raise ValueError(f"Found {len(errors)} validation error(s)")
 
+    # Only shapes that receive replacement paragraphs have text afterwards, so
+    # only they need to be verified
+    replaced_inventory: InventoryData = {}
+    for slide_key, shapes_dict in inventory.items():
+        for shape_key, shape_data in shapes_dict.items():
+            if "paragraphs" in replacements.get(slide_key, {}).get(shape_key, {}):
+                replaced_inventory.setdefault(slide_key, {})[shape_key] = shape_data
+
+    # Detect text overflow in original presentation (before the text is cleared)
+    original_overflow = detect_frame_overflow(replaced_inventory)
+
     # Track statistics
     shapes_processed = 0
     shapes_cleared = 0
@@ -288,20 +296,21 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
+    # Check for issues after replacements by measuring the replaced shapes again
+    # in memory. ShapeData reads color, rPr and alignment without creating
+    # elements; its text-frame access would add a <p:txBody> to a shape without
+    # one, but every shape measured here already has text.
+    updated_inventory: InventoryData = {}
+    for slide_key, shapes_dict in replaced_inventory.items():
+        slide = prs.slides[int(slide_key.split("-")[1])]
+        for shape_key, shape_data in shapes_dict.items():
+            updated_shape_data = ShapeData(
+                shape_data.shape, shape_data.left_emu, shape_data.top_emu, slide
+            )
+            updated_shape_data.shape_id = shape_key
+            updated_inventory.setdefault(slide_key, {})[shape_key] = updated_shape_data
 
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
     overflow_errors = []
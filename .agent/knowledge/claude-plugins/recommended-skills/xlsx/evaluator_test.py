@@ -0,0 +1,289 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font, PatternFill
+
+from evaluator import FUNCTIONS, LAZY_FUNCTIONS, ExcelError, FormulaEngine, UnsupportedFormulaError
+from recalc import recalc
+
+
+# Function calls with their expected results, evaluated against the data in
+# TestFunctions.setUp. Every function in FUNCTIONS and LAZY_FUNCTIONS is used.
+FUNCTION_CASES = [
+    ('SUM(A1:A5)', 15.0),
+    ('AVERAGE(A1:A5)', 3.0),
+    ('MIN(A1:A5)', 1.0),
+    ('MAX(A1:A5)', 5.0),
+    ('COUNT(A1:B5)', 5.0),
+    ('COUNTA(A1:B5)', 10.0),
+    ('AND(TRUE,A1>0)', True),
+    ('OR(FALSE,A1>1)', False),
+    ('NOT(FALSE)', True),
+    ('ABS(-2.5)', 2.5),
+    ('INT(-2.5)', -3.0),
+    ('MOD(-7,3)', 2.0),
+    ('SQRT(16)', 4.0),
+    ('POWER(2,10)', 1024.0),
+    ('ROUND(2.345,2)', 2.35),
+    ('ROUNDUP(2.341,2)', 2.35),
+    ('ROUNDDOWN(-2.349,2)', -2.34),
+    ('SUMPRODUCT(A1:A5,C1:C5)', 550.0),
+    ('SUMIF(B1:B5,"a",C1:C5)', 50.0),
+    ('SUMIFS(C1:C5,B1:B5,"b",A1:A5,">2")', 50.0),
+    ('COUNTIF(A1:A5,">=3")', 3.0),
+    ('COUNTIFS(B1:B5,"a",C1:C5,">10")', 1.0),
+    ('VLOOKUP(3,A1:C5,3,FALSE)', 30.0),
+    ('HLOOKUP(2,E1:G2,2,FALSE)', 'y'),
+    ('MATCH(4,A1:A5,0)', 4.0),
+    ('INDEX(A1:C5,3,3)', 30.0),
+    ('CONCATENATE("a",1,TRUE)', 'a1TRUE'),
+    ('LEN("hello")', 5.0),
+    ('LEFT("hello",2)', 'he'),
+    ('RIGHT("hello",3)', 'llo'),
+    ('MID("hello",2,3)', 'ell'),
+    ('UPPER("abc")', 'ABC'),
+    ('LOWER("ABC")', 'abc'),
+    ('TRIM("  a  b ")', 'a b'),
+    ('IF(A1>0,"yes",1/0)', 'yes'),
+    ('IFERROR(1/0,-1)', -1.0),
+    ('IFNA(MATCH(9,A1:A5,0),"none")', 'none'),
+    ('CHOOSE(2,"x","y","z")', 'y'),
+    ('ISERROR(1/0)', True),
+    ('ISNUMBER(A1)', True),
+    ('ISTEXT(B1)', True),
+    ('ISBLANK(D1)', True),
+]
+
+
+class WorkbookTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def save_workbook(self, cells, name='test.xlsx'):
+        """Save a one-sheet workbook with {coordinate: value} and return its path"""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'Sheet'
+        for coordinate, value in cells.items():
+            sheet[coordinate] = value
+        path = os.path.join(self.temp_dir, name)
+        workbook.save(path)
+        return path
+
+    def load(self, cells):
+        engine = FormulaEngine.load(self.save_workbook(cells))
+        engine.recalculate()
+        return engine
+
+
+class TestFunctions(WorkbookTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.data = {'E1': 1, 'F1': 2, 'G1': 3, 'E2': 'x', 'F2': 'y', 'G2': 'z'}
+        for row, (number, text, amount) in enumerate(
+            [(1, 'a', 10), (2, 'b', 20), (3, 'c', 30), (4, 'a', 40), (5, 'b', 50)], start=1
+        ):
+            self.data.update({f'A{row}': number, f'B{row}': text, f'C{row}': amount})
+
+    def test_every_function_is_covered(self):
+        """Test that FUNCTION_CASES calls every supported function"""
+        called = {name for formula, _ in FUNCTION_CASES for name in re.findall(r'([A-Z]+)\(', formula)}
+        self.assertEqual(set(FUNCTIONS) | set(LAZY_FUNCTIONS), called)
+
+    def test_functions(self):
+        """Test the result of each supported function"""
+        cells = dict(self.data)
+        for row, (formula, _) in enumerate(FUNCTION_CASES, start=1):
+            cells[f'H{row}'] = f'={formula}'
+        engine = self.load(cells)
+        for row, (formula, expected) in enumerate(FUNCTION_CASES, start=1):
+            with self.subTest(formula=formula):
+                value = engine.get_value('Sheet', f'H{row}')
+                if isinstance(expected, float):
+                    self.assertAlmostEqual(value, expected)
+                else:
+                    self.assertEqual(value, expected)
+
+    def test_operators(self):
+        """Test operator precedence, text joins, comparisons and errors"""
+        engine = self.load({
+            'A1': 2,
+            'B1': '=1+2*3^2',
+            'B2': '=-A1^2',
+            'B3': '="n"&A1',
+            'B4': '=A1>=2',
+            'B5': '=50%',
+            'B6': '=A1/0',
+            'B7': '=B6+1',
+        })
+        self.assertEqual(engine.get_value('Sheet', 'B1'), 19.0)
+        self.assertEqual(engine.get_value('Sheet', 'B2'), 4.0)
+        self.assertEqual(engine.get_value('Sheet', 'B3'), 'n2')
+        self.assertEqual(engine.get_value('Sheet', 'B4'), True)
+        self.assertEqual(engine.get_value('Sheet', 'B5'), 0.5)
+        self.assertEqual(engine.get_value('Sheet', 'B6'), ExcelError('#DIV/0!'))
+        self.assertEqual(engine.get_value('Sheet', 'B7'), ExcelError('#DIV/0!'))
+
+
+class TestSharedFormulas(WorkbookTestCase):
+
+    def share_formulas(self, path, columns, rows):
+        """Rewrite the formulas in columns as shared formulas, as Excel stores filled ranges"""
+        with zipfile.ZipFile(path) as archive:
+            parts = {info.filename: archive.read(info) for info in archive.infolist()}
+        sheet_xml = parts['xl/worksheets/sheet1.xml'].decode('utf-8')
+        for index, column in enumerate(columns):
+            first, last = rows[0], rows[-1]
+            sheet_xml = sheet_xml.replace(
+                f'<c r="{column}{first}"><f>',
+                f'<c r="{column}{first}"><f t="shared" ref="{column}{first}:{column}{last}" si="{index}">',
+            )
+            for row in rows[1:]:
+                sheet_xml = re.sub(
+                    f'(<c r="{column}{row}">)<f>[^<]*</f>',
+                    f'\\1<f t="shared" si="{index}"/>',
+                    sheet_xml,
+                )
+        parts['xl/worksheets/sheet1.xml'] = sheet_xml.encode('utf-8')
+        with zipfile.ZipFile(path, 'w') as archive:
+            for name, data in parts.items():
+                archive.writestr(name, data)
+
+    def test_shared_formula_offsets(self):
+        """Test that shared formulas shift relative references and keep absolute ones"""
+        cells = {}
+        for row in range(1, 5):
+            cells[f'A{row}'] = row
+            cells[f'B{row}'] = f'=A{row}*10'
+            cells[f'C{row}'] = f'=$A$1+A{row}'
+        path = self.save_workbook(cells)
+        self.share_formulas(path, ['B', 'C'], [1, 2, 3, 4])
+
+        engine = FormulaEngine.load(path)
+        self.assertEqual(engine.recalculate(), 8)
+        self.assertEqual([engine.get_value('Sheet', f'B{row}') for row in range(1, 5)], [10.0, 20.0, 30.0, 40.0])
+        self.assertEqual([engine.get_value('Sheet', f'C{row}') for row in range(1, 5)], [2.0, 3.0, 4.0, 5.0])
+
+
+class TestIncrementalRecalculation(WorkbookTestCase):
+
+    def test_only_downstream_cells_are_evaluated(self):
+        """Test that recalculate() after set_value() evaluates only dependent cells"""
+        engine = self.load({
+            'A1': 1,
+            'A2': 2,
+            'A3': 3,
+            'B1': '=A1*2',
+            'B2': '=A2*2',
+            'B3': '=SUM(B1:B2)',
+            'C1': '=A3+1',
+        })
+        self.assertEqual(engine.recalculate(), 0)
+
+        engine.set_value('Sheet', 'A1', 5)
+        self.assertEqual(engine.recalculate(), 2)  # B1 and B3, through the range
+        self.assertEqual(engine.get_value('Sheet', 'B1'), 10.0)
+        self.assertEqual(engine.get_value('Sheet', 'B3'), 14.0)
+        self.assertEqual(engine.get_value('Sheet', 'C1'), 4.0)
+
+    def test_set_value_on_formula_cell(self):
+        """Test that formula cells cannot be overwritten with set_value()"""
+        engine = self.load({'A1': 1, 'B1': '=A1'})
+        with self.assertRaises(ValueError):
+            engine.set_value('Sheet', 'B1', 2)
+
+
+class TestUnsupportedFormulas(WorkbookTestCase):
+
+    def test_circular_reference(self):
+        """Test that a circular reference, including one through a range, is unsupported"""
+        for cells in ({'A1': '=B1+1', 'B1': '=A1+1'}, {'A1': '=SUM(A2:A3)', 'A3': '=A1'}):
+            with self.subTest(cells=cells):
+                engine = FormulaEngine.load(self.save_workbook(cells))
+                with self.assertRaisesRegex(UnsupportedFormulaError, 'circular reference'):
+                    engine.recalculate()
+
+    def test_intersection(self):
+        """Test that the intersection (space) operator is unsupported"""
+        path = self.save_workbook({'A1': 1, 'B1': '=SUM(A1:A10 A5:A6)'})
+        with self.assertRaisesRegex(UnsupportedFormulaError, 'intersection'):
+            FormulaEngine.load(path)
+
+    def test_auto_engine_falls_back(self):
+        """Test that recalc() in auto mode falls back to LibreOffice for unsupported formulas"""
+        path = self.save_workbook({'A1': 1, 'B1': '=SUM(A1:A10 A5:A6)'})
+        with open(path, 'rb') as f:
+            original = f.read()
+
+        result = recalc(path, engine='native')
+        self.assertIn('intersection', result['error'])
+
+        with mock.patch('recalc.shutil.which', return_value=None):
+            result = recalc(path, engine='auto')
+        self.assertIn('intersection', result['fallback_reason'])
+        self.assertIn('LibreOffice', result['error'])
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), original)
+
+
+class TestSave(WorkbookTestCase):
+
+    def test_round_trip(self):
+        """Test that save() writes cached values and keeps formulas and styles"""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'Sheet'
+        sheet['A1'] = 2
+        sheet['A1'].number_format = '0.00'
+        sheet['B1'] = '=A1*3'
+        sheet['B1'].font = Font(bold=True)
+        sheet['B1'].fill = PatternFill('solid', fgColor='FFFF00')
+        sheet['B2'] = '="x"&A1'
+        sheet['B3'] = '=A1>1'
+        sheet['B4'] = '=1/0'
+        path = os.path.join(self.temp_dir, 'styled.xlsx')
+        workbook.save(path)
+        with open(path, 'rb') as f:
+            original = f.read()
+
+        engine = FormulaEngine.load(path)
+        engine.recalculate()
+        engine.set_value('Sheet', 'A2', 'note')  # A cell that does not exist yet
+        saved_path = os.path.join(self.temp_dir, 'saved.xlsx')
+        engine.save(saved_path)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), original)
+
+        formulas = load_workbook(saved_path)['Sheet']
+        self.assertEqual(formulas['B1'].value, '=A1*3')
+        self.assertEqual(formulas['B2'].value, '="x"&A1')
+        self.assertTrue(formulas['B1'].font.bold)
+        self.assertEqual(formulas['B1'].fill.fgColor.rgb, '00FFFF00')
+        self.assertEqual(formulas['A1'].number_format, '0.00')
+
+        values = load_workbook(saved_path, data_only=True)['Sheet']
+        self.assertEqual(values['B1'].value, 6)
+        self.assertEqual(values['B2'].value, 'x2')
+        self.assertIs(values['B3'].value, True)
+        self.assertEqual(values['B4'].value, '#DIV/0!')
+        self.assertEqual(values['A2'].value, 'note')
+
+        reloaded = FormulaEngine.load(saved_path)
+        self.assertEqual(reloaded.get_value('Sheet', 'B1'), 6.0)
+        self.assertEqual(reloaded.get_value('Sheet', 'A2'), 'note')
+
+
+if __name__ == '__main__':
+    unittest.main()